@@ -302,8 +302,8 @@ class SentimentAnalytics:
             logger.error(f"Error comparing keywords: {e}")
             return {'error': str(e)}
     
-    def check_alert_conditions(self, keyword: str) -> List[AlertCondition]:
-        """Check if any alert conditions are met."""
+    def check_alert_conditions(self, keyword: str, summary: Optional[Dict[str, Any]] = None) -> List[AlertCondition]:
+        """Check if any alert conditions are met, optionally from a precomputed summary."""
         try:
             alerts = []
             config = self.config.alerts
@@ -312,7 +312,8 @@ class SentimentAnalytics:
                 return alerts
             
             # Get recent data
-            summary = self.db.get_sentiment_summary(keyword, hours=1)  # Last hour
+            if summary is None:
+                summary = self.db.get_sentiment_summary(keyword, hours=1)  # Last hour
             trend_analysis = self.analyze_trends(keyword, hours=6)  # 6 hour trend
             
             current_sentiment = summary.get('avg_sentiment', 0)
@@ -505,9 +506,12 @@ class SentimentAnalytics:
             return ["Error generating recommendations - check system logs"]
 
 
-# Global analytics instance
-analytics = SentimentAnalytics()
+# Global analytics instance, created on first use
+_analytics: Optional[SentimentAnalytics] = None
 
 def get_analytics() -> SentimentAnalytics:
     """Get the global analytics instance."""
-    return analytics
\ No newline at end of file
+    global _analytics
+    if _analytics is None:
+        _analytics = SentimentAnalytics()
+    return _analytics
\ No newline at end of file
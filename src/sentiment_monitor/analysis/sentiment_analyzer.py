@@ -2,10 +2,16 @@
 
 import logging
 import time
-from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Pattern, Tuple
 import re
 from datetime import datetime
 
+import numpy as np
+
 # VADER sentiment
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
@@ -26,6 +32,58 @@ from ..utils.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Compound score cut-offs for positive and negative labels
+_POSITIVE_THRESHOLD = 0.05
+_NEGATIVE_THRESHOLD = -0.05
+
+# Score fields combined across models by get_weighted_sentiment
+_WEIGHTED_FIELDS = ('compound_score', 'positive_score', 'negative_score', 'neutral_score', 'confidence')
+
+# Text cleaning patterns, compiled once at import and shared by all preprocessors
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_MENTION_RE = re.compile(r'@\w+')
+_HASHTAG_RE = re.compile(r'#\w+')
+_EMOJI_RE = re.compile("["
+                       u"\\U0001F600-\\U0001F64F"  # emoticons
+                       u"\\U0001F300-\\U0001F5FF"  # symbols & pictographs
+                       u"\\U0001F680-\\U0001F6FF"  # transport & map symbols
+                       u"\\U0001F1E0-\\U0001F1FF"  # flags (iOS)
+                       u"\\U00002500-\\U00002BEF"  # chinese char
+                       u"\\U00002702-\\U000027B0"
+                       u"\\U00002702-\\U000027B0"
+                       u"\\U000024C2-\\U0001F251"
+                       u"\\U0001f926-\\U0001f937"
+                       u"\\U00010000-\\U0010ffff"
+                       u"\\u2640-\\u2642"
+                       u"\\u2600-\\u2B55"
+                       u"\\u200d"
+                       u"\\u23cf"
+                       u"\\u23e9"
+                       u"\\u231a"
+                       u"\\ufe0f"  # dingbats
+                       u"\\u3030"
+                       "]+", flags=re.UNICODE)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _removal_pattern(remove_urls: bool, remove_mentions: bool, remove_hashtags: bool) -> Optional[Pattern]:
+    """Combine the enabled removal patterns into one alternation so text is scanned once."""
+    enabled = [
+        pattern.pattern
+        for pattern, remove in ((_URL_RE, remove_urls), (_MENTION_RE, remove_mentions), (_HASHTAG_RE, remove_hashtags))
+        if remove
+    ]
+    return re.compile('|'.join(enabled)) if enabled else None
+
 
 class TextPreprocessor:
     """Handles text preprocessing for sentiment analysis."""
@@ -33,7 +91,6 @@ class TextPreprocessor:
     def __init__(self):
         self.config = get_config()
         self._download_nltk_data()
-        self._setup_patterns()
     
     def _download_nltk_data(self) -> None:
         """Download required NLTK data."""
@@ -47,105 +104,112 @@ class TextPreprocessor:
             except Exception as e:
                 logger.warning(f"Could not download NLTK data: {e}")
     
-    def _setup_patterns(self) -> None:
-        """Setup regex patterns for text cleaning."""
-        self.url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
-        self.mention_pattern = re.compile(r'@\\w+')
-        self.hashtag_pattern = re.compile(r'#\\w+')
-        self.emoji_pattern = re.compile("["
-                                      u"\\U0001F600-\\U0001F64F"  # emoticons
-                                      u"\\U0001F300-\\U0001F5FF"  # symbols & pictographs
-                                      u"\\U0001F680-\\U0001F6FF"  # transport & map symbols
-                                      u"\\U0001F1E0-\\U0001F1FF"  # flags (iOS)
-                                      u"\\U00002500-\\U00002BEF"  # chinese char
-                                      u"\\U00002702-\\U000027B0"
-                                      u"\\U00002702-\\U000027B0"
-                                      u"\\U000024C2-\\U0001F251"
-                                      u"\\U0001f926-\\U0001f937"
-                                      u"\\U00010000-\\U0010ffff"
-                                      u"\\u2640-\\u2642"
-                                      u"\\u2600-\\u2B55"
-                                      u"\\u200d"
-                                      u"\\u23cf"
-                                      u"\\u23e9"
-                                      u"\\u231a"
-                                      u"\\ufe0f"  # dingbats
-                                      u"\\u3030"
-                                      "]+", flags=re.UNICODE)
-    
     def preprocess(self, text: str) -> str:
         """Preprocess text for sentiment analysis."""
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
+        text_config = self.config.text_processing
+        max_length = text_config.max_text_length
         
-        # Remove URLs if configured
-        if self.config.text_processing.remove_urls:
-            text = self.url_pattern.sub('', text)
+        # Clean only a prefix so cost is bounded by max_length; one extra character shows
+        # whether the result overflows, and the prefix widens while cleaning shrank it
+        window = max_length + 1
+        while True:
+            cleaned = self._clean(text[:window], text_config)
+            if len(cleaned) > max_length or window >= len(text):
+                break
+            window *= 2
         
-        # Remove mentions if configured
-        if self.config.text_processing.remove_mentions:
-            text = self.mention_pattern.sub('', text)
+        # Only text that is still too long after cleaning is cut and marked
+        if len(cleaned) > max_length:
+            cleaned = cleaned[:max_length] + "..."
         
-        # Remove hashtags if configured
-        if self.config.text_processing.remove_hashtags:
-            text = self.hashtag_pattern.sub('', text)
+        return cleaned
+    
+    @staticmethod
+    def _clean(text: str, text_config) -> str:
+        """Lowercase text and strip URLs, mentions, hashtags, emojis and extra whitespace."""
+        # Convert to lowercase
+        text = text.lower()
+        
+        # Remove URLs, mentions and hashtags if configured, in a single pass
+        removal_pattern = _removal_pattern(
+            text_config.remove_urls, text_config.remove_mentions, text_config.remove_hashtags
+        )
+        if removal_pattern:
+            text = removal_pattern.sub('', text)
         
         # Handle emojis
-        if self.config.text_processing.handle_emojis:
-            text = self.emoji_pattern.sub(' [EMOJI] ', text)
+        if text_config.handle_emojis:
+            text = _EMOJI_RE.sub(' [EMOJI] ', text)
         
         # Clean up whitespace
-        text = ' '.join(text.split())
-        
-        # Truncate if too long
-        max_length = self.config.text_processing.max_text_length
-        if len(text) > max_length:
-            text = text[:max_length] + "..."
-        
-        return text
+        return ' '.join(text.split())
+
+
+@lru_cache(maxsize=None)
+def _shared_vader() -> SentimentIntensityAnalyzer:
+    """Parse the VADER lexicon once per process; the analyzer holds no per-call state."""
+    return SentimentIntensityAnalyzer()
 
 
 class VADERAnalyzer:
     """VADER sentiment analyzer wrapper."""
     
     def __init__(self):
-        self.analyzer = SentimentIntensityAnalyzer()
+        self.analyzer = _shared_vader()
         self.model_name = "vader"
         self.model_version = "3.3.2"
+        
+        # Reposts and boilerplate replies repeat exact texts, so remember their scores
+        self._polarity_scores = lru_cache(maxsize=65536)(self.analyzer.polarity_scores)
     
     def analyze(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment using VADER."""
         try:
             start_time = time.time()
-            scores = self.analyzer.polarity_scores(text)
+            scores = self._polarity_scores(text)
             processing_time = time.time() - start_time
-            
-            # VADER provides compound, pos, neu, neg scores
-            # Compound score is the main sentiment indicator (-1 to 1)
-            compound = scores['compound']
-            
-            # Calculate confidence based on the magnitude of compound score
-            confidence = abs(compound)
-            
-            return {
-                'model_name': self.model_name,
-                'model_version': self.model_version,
-                'compound_score': compound,
-                'positive_score': scores['pos'],
-                'negative_score': scores['neg'],
-                'neutral_score': scores['neu'],
-                'confidence': confidence,
-                'processing_time': processing_time,
-                'raw_output': scores
-            }
+            return self._build_result(scores, processing_time)
             
         except Exception as e:
             logger.error(f"VADER analysis error: {e}")
             return self._get_error_result(e)
     
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze sentiment for several texts using VADER."""
+        try:
+            start_time = time.time()
+            all_scores = [self._polarity_scores(text) for text in texts]
+            processing_time = (time.time() - start_time) / max(len(texts), 1)
+            return [self._build_result(scores, processing_time) for scores in all_scores]
+            
+        except Exception as e:
+            logger.error(f"VADER batch analysis error: {e}")
+            return [self._get_error_result(e) for _ in texts]
+    
+    def _build_result(self, scores: Dict[str, float], processing_time: float) -> Dict[str, Any]:
+        """Build the result structure from VADER polarity scores."""
+        # VADER provides compound, pos, neu, neg scores
+        # Compound score is the main sentiment indicator (-1 to 1)
+        compound = scores['compound']
+        
+        # Calculate confidence based on the magnitude of compound score
+        confidence = abs(compound)
+        
+        return {
+            'model_name': self.model_name,
+            'model_version': self.model_version,
+            'compound_score': compound,
+            'positive_score': scores['pos'],
+            'negative_score': scores['neg'],
+            'neutral_score': scores['neu'],
+            'confidence': confidence,
+            'processing_time': processing_time,
+            'raw_output': dict(scores)  # Copy so callers can't alter cached scores
+        }
+    
     def _get_error_result(self, error: Exception) -> Dict[str, Any]:
         """Return error result structure."""
         return {
@@ -208,52 +272,76 @@ class RoBERTaAnalyzer:
         try:
             start_time = time.time()
             
-            # Check text length and truncate if necessary
-            if self.tokenizer:
-                tokens = self.tokenizer.encode(text, truncation=True, max_length=512)
-                if len(tokens) >= 512:
-                    text = self.tokenizer.decode(tokens[:-1], skip_special_tokens=True)
-            
             # Get predictions
-            results = self.pipeline(text)
+            results = self.pipeline(self._truncate(text))
             processing_time = time.time() - start_time
             
             # Handle nested list format (RoBERTa returns [[{results}]])
             if isinstance(results, list) and len(results) > 0 and isinstance(results[0], list):
                 results = results[0]
             
-            # Convert to our format
-            scores = {result['label'].lower(): result['score'] for result in results}
-            
-            # Map labels to our format
-            positive_score = scores.get('positive', 0.0)
-            negative_score = scores.get('negative', 0.0)
-            neutral_score = scores.get('neutral', 0.0)
+            return self._build_result(results, processing_time)
             
-            # Calculate compound score (-1 to 1)
-            compound_score = positive_score - negative_score
+        except Exception as e:
+            logger.error(f"RoBERTa analysis error: {e}")
+            return self._get_error_result(e)
+    
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze sentiment for several texts with a single pipeline call."""
+        if not self.is_available():
+            return [self._get_unavailable_result() for _ in texts]
+        
+        try:
+            start_time = time.time()
             
-            # Confidence is the maximum score
-            confidence = max(positive_score, negative_score, neutral_score)
+            # The pipeline batches a list input through the model together
+            batch_results = self.pipeline([self._truncate(text) for text in texts])
+            processing_time = (time.time() - start_time) / max(len(texts), 1)
             
-            return {
-                'model_name': self.model_name,
-                'model_version': self.model_version,
-                'compound_score': compound_score,
-                'positive_score': positive_score,
-                'negative_score': negative_score,
-                'neutral_score': neutral_score,
-                'confidence': confidence,
-                'processing_time': processing_time,
-                'raw_output': {
-                    'results': results,
-                    'scores': scores
-                }
-            }
+            return [self._build_result(results, processing_time) for results in batch_results]
             
         except Exception as e:
-            logger.error(f"RoBERTa analysis error: {e}")
-            return self._get_error_result(e)
+            logger.error(f"RoBERTa batch analysis error: {e}")
+            return [self._get_error_result(e) for _ in texts]
+    
+    def _truncate(self, text: str) -> str:
+        """Truncate text to the model's maximum input length."""
+        if self.tokenizer:
+            tokens = self.tokenizer.encode(text, truncation=True, max_length=512)
+            if len(tokens) >= 512:
+                text = self.tokenizer.decode(tokens[:-1], skip_special_tokens=True)
+        return text
+    
+    def _build_result(self, results: List[Dict[str, Any]], processing_time: float) -> Dict[str, Any]:
+        """Build the result structure from the pipeline's label scores."""
+        # Convert to our format
+        scores = {result['label'].lower(): result['score'] for result in results}
+        
+        # Map labels to our format
+        positive_score = scores.get('positive', 0.0)
+        negative_score = scores.get('negative', 0.0)
+        neutral_score = scores.get('neutral', 0.0)
+        
+        # Calculate compound score (-1 to 1)
+        compound_score = positive_score - negative_score
+        
+        # Confidence is the maximum score
+        confidence = max(positive_score, negative_score, neutral_score)
+        
+        return {
+            'model_name': self.model_name,
+            'model_version': self.model_version,
+            'compound_score': compound_score,
+            'positive_score': positive_score,
+            'negative_score': negative_score,
+            'neutral_score': neutral_score,
+            'confidence': confidence,
+            'processing_time': processing_time,
+            'raw_output': {
+                'results': results,
+                'scores': scores
+            }
+        }
     
     def _get_unavailable_result(self) -> Dict[str, Any]:
         """Return result when model is unavailable."""
@@ -356,71 +444,108 @@ class SentimentAnalyzer:
             'roberta': roberta_weight
         }
         
-        # Calculate weighted averages
-        total_weight = 0
-        weighted_compound = 0
-        weighted_positive = 0
-        weighted_negative = 0
-        weighted_neutral = 0
-        weighted_confidence = 0
-        
-        model_results = {}
-        
-        for result in results:
-            model_name = result['model_name'].split('/')[-1].split('-')[0]  # Extract model type
-            weight = weights.get(model_name, 1.0)
-            
-            weighted_compound += result['compound_score'] * weight
-            weighted_positive += result['positive_score'] * weight
-            weighted_negative += result['negative_score'] * weight
-            weighted_neutral += result['neutral_score'] * weight
-            weighted_confidence += result['confidence'] * weight
-            
-            total_weight += weight
-            model_results[model_name] = result
+        model_names = [result['model_name'].split('/')[-1].split('-')[0] for result in results]  # Extract model type
+        model_weights = np.fromiter((weights.get(name, 1.0) for name in model_names), dtype=np.float64, count=len(results))
         
+        total_weight = model_weights.sum()
         if total_weight == 0:
             return None
         
-        # Normalize by total weight
-        final_result = {
-            'compound_score': weighted_compound / total_weight,
-            'positive_score': weighted_positive / total_weight,
-            'negative_score': weighted_negative / total_weight,
-            'neutral_score': weighted_neutral / total_weight,
-            'confidence': weighted_confidence / total_weight,
+        # Stack the scores into an (M, 5) array and average them in one weighted reduction
+        scores = np.array(
+            [[result[field] for field in _WEIGHTED_FIELDS] for result in results],
+            dtype=np.float64
+        )
+        averages = (model_weights @ scores / total_weight).tolist()
+        
+        model_results = dict(zip(model_names, results))
+        
+        # Weighted averages, plus which models contributed
+        final_result = dict(zip(_WEIGHTED_FIELDS, averages))
+        final_result.update({
             'model_count': len(results),
             'models_used': list(model_results.keys()),
             'individual_results': model_results
-        }
+        })
         
         return final_result
     
     def get_sentiment_label(self, compound_score: float) -> str:
         """Get sentiment label from compound score."""
-        if compound_score >= 0.05:
+        if compound_score >= _POSITIVE_THRESHOLD:
             return 'positive'
-        elif compound_score <= -0.05:
+        elif compound_score <= _NEGATIVE_THRESHOLD:
             return 'negative'
         else:
             return 'neutral'
     
+    def get_sentiment_labels(self, compound_scores: np.ndarray) -> np.ndarray:
+        """Get sentiment labels for an array of compound scores in one vectorized pass."""
+        compound_scores = np.asarray(compound_scores)
+        return np.select(
+            [compound_scores >= _POSITIVE_THRESHOLD, compound_scores <= _NEGATIVE_THRESHOLD],
+            ['positive', 'negative'],
+            default='neutral'
+        )
+    
     def is_high_confidence(self, confidence: float) -> bool:
         """Check if confidence meets threshold."""
         threshold = self.config.sentiment.confidence_threshold
         return confidence >= threshold
     
-    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+    def analyze_batch(self, texts: List[str], start_index: int = 0) -> List[Dict[str, Any]]:
         """Analyze multiple texts efficiently."""
+        # Preprocess everything up front so each model scores the whole batch in one call
+        processed = {}
+        for i, text in enumerate(texts):
+            try:
+                if text and text.strip():
+                    processed_text = self.preprocessor.preprocess(text)
+                    if processed_text:
+                        processed[i] = processed_text
+            except Exception as e:
+                logger.error(f"Error preprocessing text {i}: {e}")
+        
+        # Nothing left to score after cleaning, so skip the model calls entirely
+        if not processed:
+            return [None] * len(texts)
+        
+        analysis_results = {i: [] for i in processed}
+        
+        # Check which models are enabled in config
+        enabled_analyzers = {
+            name: analyzer for name, analyzer in self.analyzers.items()
+            if self.config.sentiment.models.get(name, {}).get('enabled', True)
+        }
+        
+        def analyze_with_model(name: str, analyzer: Any) -> List[Dict[str, Any]]:
+            try:
+                return analyzer.analyze_batch(list(processed.values()))
+            except Exception as e:
+                logger.error(f"Error analyzing batch with {name}: {e}")
+                return []
+        
+        # Transformer forward passes release the GIL, so run the models side by side
+        if len(enabled_analyzers) > 1:
+            max_workers = min(self.config.performance.max_workers, len(enabled_analyzers))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                model_results = list(executor.map(analyze_with_model, enabled_analyzers, enabled_analyzers.values()))
+        else:
+            model_results = [analyze_with_model(name, analyzer) for name, analyzer in enabled_analyzers.items()]
+        
+        for batch_results in model_results:
+            for i, result in zip(processed, batch_results):
+                if result:
+                    analysis_results[i].append(result)
+        
         results = []
         
-        for i, text in enumerate(texts):
+        for i in range(len(texts)):
             try:
-                analysis_results = self.analyze_text(text)
-                weighted_result = self.get_weighted_sentiment(analysis_results)
+                weighted_result = self.get_weighted_sentiment(analysis_results.get(i))
                 
                 if weighted_result:
-                    weighted_result['text_index'] = i
+                    weighted_result['text_index'] = start_index + i
                     weighted_result['sentiment_label'] = self.get_sentiment_label(weighted_result['compound_score'])
                     weighted_result['high_confidence'] = self.is_high_confidence(weighted_result['confidence'])
                 
@@ -432,19 +557,37 @@ class SentimentAnalyzer:
         
         return results
     
-    def get_model_info(self) -> Dict[str, Any]:
-        """Get information about available models."""
-        info = {
-            'available_models': list(self.analyzers.keys()),
-            'model_details': {},
-            'configuration': self.config.sentiment.model_dump()
-        }
+    def analyze_stream(self, texts: Iterable[str], chunk_size: int = 256) -> Iterator[Optional[Dict[str, Any]]]:
+        """Analyze texts lazily, scoring one chunk at a time so memory stays bounded."""
+        texts = iter(texts)
+        start_index = 0
         
-        for name, analyzer in self.analyzers.items():
-            info['model_details'][name] = {
+        while True:
+            chunk = list(islice(texts, chunk_size))
+            if not chunk:
+                return
+            
+            yield from self.analyze_batch(chunk, start_index=start_index)
+            start_index += len(chunk)
+    
+    def get_model_info(self) -> Mapping[str, Any]:
+        """Get information about available models."""
+        return self._model_info
+    
+    @cached_property
+    def _model_info(self) -> Mapping[str, Any]:
+        """Build the read-only model information once; models and config are fixed after init."""
+        model_details = {
+            name: MappingProxyType({
                 'model_name': analyzer.model_name,
                 'model_version': getattr(analyzer, 'model_version', 'unknown'),
                 'available': getattr(analyzer, 'is_available', lambda: True)()
-            }
+            })
+            for name, analyzer in self.analyzers.items()
+        }
         
-        return info
\ No newline at end of file
+        return MappingProxyType({
+            'available_models': tuple(self.analyzers.keys()),
+            'model_details': MappingProxyType(model_details),
+            'configuration': _freeze(self.config.sentiment.model_dump())
+        })
\ No newline at end of file
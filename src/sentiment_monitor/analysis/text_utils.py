@@ -6,8 +6,55 @@ from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
 import string
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Negation patterns
+_NEGATION_RE = re.compile(
+    r'\b(?:not|no|never|none|nobody|nothing|neither|nowhere|isn\'t|aren\'t|wasn\'t|weren\'t|haven\'t|hasn\'t|hadn\'t|won\'t|wouldn\'t|don\'t|doesn\'t|didn\'t|can\'t|couldn\'t|shouldn\'t|mustn\'t|needn\'t|daren\'t|mayn\'t|oughtn\'t)\b',
+    re.IGNORECASE
+)
+
+# Intensifier patterns
+_INTENSIFIER_RE = re.compile(
+    r'\b(?:very|really|extremely|incredibly|absolutely|totally|completely|utterly|quite|rather|pretty|fairly|somewhat|slightly|barely|hardly|scarcely)\b',
+    re.IGNORECASE
+)
+
+# Question patterns
+_QUESTION_RE = re.compile(r'\?')
+
+# Exclamation patterns
+_EXCLAMATION_RE = re.compile(r'!')
+
+# Capital letters pattern (for emphasis detection)
+_CAPS_RE = re.compile(r'\b[A-Z]{2,}\b')
+
+# Repeated characters (e.g., "sooooo")
+_REPEATED_CHARS_RE = re.compile(r'(.)\1{2,}')
+
+# Translation table deleting ASCII punctuation
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# Common stop words skipped by keyword extraction
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
+    'this', 'that', 'these', 'those', 'will', 'would', 'could', 'should', 'can', 'may', 'might'
+})
+
+# Entity patterns combined into one alternation. Stock tickers come first so
+# exchange notation like "IBM.NYSE" is read as a ticker; company and
+# cryptocurrency names match case-insensitively.
+_ENTITY_RE = re.compile(
+    r'(?P<stocks>\$[A-Z]{1,5}\b'  # Stock tickers like $AAPL, $TSLA
+    r'|\b[A-Z]{1,5}\.(?:NYSE|NASDAQ)\b)'  # Exchange notation
+    r'|(?P<companies>(?i:\b(?:Apple|Google|Microsoft|Amazon|Facebook|Meta|Tesla|Netflix|Uber|Airbnb|Twitter|LinkedIn|Instagram|YouTube|TikTok|Snapchat|WhatsApp|Zoom|Slack|Discord|Spotify|Adobe|Oracle|IBM|Intel|AMD|NVIDIA|Salesforce)\b))'
+    r'|(?P<cryptocurrencies>(?i:\b(?:Bitcoin|BTC|Ethereum|ETH|Dogecoin|DOGE|Litecoin|LTC|Ripple|XRP|Cardano|ADA|Polkadot|DOT|Chainlink|LINK|Binance|BNB|Polygon|MATIC)\b))'
+)
+
 
 class TextAnalyzer:
     """Advanced text analysis utilities."""
@@ -17,29 +64,13 @@ class TextAnalyzer:
     
     def _setup_patterns(self) -> None:
         """Setup regex patterns for text analysis."""
-        # Negation patterns
-        self.negation_pattern = re.compile(
-            r'\b(?:not|no|never|none|nobody|nothing|neither|nowhere|isn\'t|aren\'t|wasn\'t|weren\'t|haven\'t|hasn\'t|hadn\'t|won\'t|wouldn\'t|don\'t|doesn\'t|didn\'t|can\'t|couldn\'t|shouldn\'t|mustn\'t|needn\'t|daren\'t|mayn\'t|oughtn\'t)\b',
-            re.IGNORECASE
-        )
-        
-        # Intensifier patterns
-        self.intensifier_pattern = re.compile(
-            r'\b(?:very|really|extremely|incredibly|absolutely|totally|completely|utterly|quite|rather|pretty|fairly|somewhat|slightly|barely|hardly|scarcely)\b',
-            re.IGNORECASE
-        )
-        
-        # Question patterns
-        self.question_pattern = re.compile(r'\?')
-        
-        # Exclamation patterns
-        self.exclamation_pattern = re.compile(r'!')
-        
-        # Capital letters pattern (for emphasis detection)
-        self.caps_pattern = re.compile(r'\b[A-Z]{2,}\b')
-        
-        # Repeated characters (e.g., "sooooo")
-        self.repeated_chars_pattern = re.compile(r'(.)\1{2,}')
+        # Patterns are compiled once at import and shared by every analyzer
+        self.negation_pattern = _NEGATION_RE
+        self.intensifier_pattern = _INTENSIFIER_RE
+        self.question_pattern = _QUESTION_RE
+        self.exclamation_pattern = _EXCLAMATION_RE
+        self.caps_pattern = _CAPS_RE
+        self.repeated_chars_pattern = _REPEATED_CHARS_RE
     
     def analyze_negation_context(self, text: str) -> Dict[str, Any]:
         """Analyze negation patterns in text."""
@@ -50,7 +81,7 @@ class TextAnalyzer:
         negated_sentences = []
         
         for sentence in sentences:
-            if self.negation_pattern.search(sentence.lower()):
+            if self.negation_pattern.search(sentence):  # Pattern is case-insensitive
                 negated_sentences.append(sentence.strip())
         
         return {
@@ -80,9 +111,9 @@ class TextAnalyzer:
         # Analyze repeated characters
         repeated_chars = self.repeated_chars_pattern.findall(text)
         
-        # Analyze punctuation
-        exclamations = len(self.exclamation_pattern.findall(text))
-        questions = len(self.question_pattern.findall(text))
+        # Analyze punctuation; str.count scans in C without building match lists
+        exclamations = text.count('!')
+        questions = text.count('?')
         
         # Calculate emphasis score
         emphasis_score = (
@@ -106,23 +137,13 @@ class TextAnalyzer:
         """Extract keywords from text."""
         # Simple keyword extraction using word frequency
         # Remove punctuation and convert to lowercase
-        text_clean = text.lower().translate(str.maketrans('', '', string.punctuation))
+        text_clean = text.lower().translate(_PUNCTUATION_TABLE)
         words = text_clean.split()
         
-        # Filter out common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-            'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
-            'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
-            'this', 'that', 'these', 'those', 'will', 'would', 'could', 'should', 'can', 'may', 'might'
-        }
-        
-        # Filter words
-        filtered_words = [word for word in words if len(word) > 2 and word not in stop_words]
-        
-        # Count word frequency
-        word_counts = Counter(filtered_words)
+        # Filter out common stop words, then count word frequency in one pass
+        word_counts = Counter(word for word in words if len(word) > 2 and word not in _STOP_WORDS)
         
+        # most_common(n) selects with a heap, O(U log n) rather than sorting all U words
         return word_counts.most_common(top_n)
     
     def analyze_text_complexity(self, text: str) -> Dict[str, Any]:
@@ -130,17 +151,19 @@ class TextAnalyzer:
         if not text:
             return {}
         
-        # Basic metrics
+        # Basic metrics, tokenizing once
+        words = text.split()
         char_count = len(text)
-        word_count = len(text.split())
+        word_count = len(words)
         sentence_count = len(re.split(r'[.!?]+', text))
         
         # Average metrics
-        avg_word_length = sum(len(word) for word in text.split()) / max(word_count, 1)
+        word_lengths = np.fromiter(map(len, words), dtype=np.int32, count=word_count)
+        avg_word_length = float(word_lengths.mean()) if word_count else 0.0
         avg_sentence_length = word_count / max(sentence_count, 1)
         
         # Vocabulary richness (unique words / total words)
-        unique_words = len(set(text.lower().split()))
+        unique_words = len({word.lower() for word in words})
         vocabulary_richness = unique_words / max(word_count, 1)
         
         return {
@@ -271,33 +294,9 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
         'stocks': []
     }
     
-    # Company patterns (basic)
-    company_patterns = [
-        r'\b(?:Apple|Google|Microsoft|Amazon|Facebook|Meta|Tesla|Netflix|Uber|Airbnb|Twitter|LinkedIn|Instagram|YouTube|TikTok|Snapchat|WhatsApp|Zoom|Slack|Discord|Spotify|Adobe|Oracle|IBM|Intel|AMD|NVIDIA|Salesforce)\b'
-    ]
-    
-    # Cryptocurrency patterns
-    crypto_patterns = [
-        r'\b(?:Bitcoin|BTC|Ethereum|ETH|Dogecoin|DOGE|Litecoin|LTC|Ripple|XRP|Cardano|ADA|Polkadot|DOT|Chainlink|LINK|Binance|BNB|Polygon|MATIC)\b'
-    ]
-    
-    # Stock ticker patterns
-    stock_patterns = [
-        r'\$[A-Z]{1,5}\b',  # Stock tickers like $AAPL, $TSLA
-        r'\b[A-Z]{1,5}\.(?:NYSE|NASDAQ)\b'  # Exchange notation
-    ]
-    
-    for pattern in company_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        entities['companies'].extend(matches)
-    
-    for pattern in crypto_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        entities['cryptocurrencies'].extend(matches)
-    
-    for pattern in stock_patterns:
-        matches = re.findall(pattern, text)
-        entities['stocks'].extend(matches)
+    # One scan classifies every match by the name of the group that matched
+    for match in _ENTITY_RE.finditer(text):
+        entities[match.lastgroup].append(match.group())
     
     # Remove duplicates
     for key in entities:
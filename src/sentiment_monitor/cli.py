@@ -30,6 +30,7 @@ from .collectors.reddit_collector import RedditCollector
 from .collectors.hackernews_collector import HackerNewsCollector
 from .analysis.sentiment_analyzer import SentimentAnalyzer
 from .utils.config import get_config, get_secrets
+from .utils.alerts import get_alert_manager
 
 # Setup logging
 logging.basicConfig(
@@ -162,7 +163,7 @@ def status(ctx):
         print("=== Sentiment Monitor Status ===")
         print(f"Database: {cli_obj.db.get_database_stats()}")
         print(f"Collectors: {[name for name in cli_obj.collectors.keys()]}")
-        print(f"Sentiment Models: {cli_obj.sentiment_analyzer.get_model_info()['available_models']}")
+        print(f"Sentiment Models: {list(cli_obj.sentiment_analyzer.get_model_info()['available_models'])}")
 
 
 @cli.group()
@@ -272,32 +273,31 @@ def collect(ctx, keyword, platform, limit):
         
         total_collected = 0
         
-        for kw in keywords:
-            cli_obj.print_info(f"Collecting for keyword: {kw}")
+        for platform_name in platforms:
+            if platform_name not in cli_obj.collectors:
+                continue
             
-            for platform_name in platforms:
-                if platform_name not in cli_obj.collectors:
-                    continue
-                
-                collector = cli_obj.collectors[platform_name]
-                if not collector.is_available():
-                    cli_obj.print_warning(f"{platform_name} collector not available")
-                    continue
+            collector = cli_obj.collectors[platform_name]
+            if not collector.is_available():
+                cli_obj.print_warning(f"{platform_name} collector not available")
+                continue
+            
+            try:
+                # One collection pass per platform covers every keyword
+                posts_by_keyword = collector.collect_posts_for_keywords(keywords, limit=limit)
                 
-                try:
-                    posts = collector.collect_posts_for_keyword(kw, limit=limit)
-                    
+                for kw in keywords:
                     # Store posts in database
                     stored_count = 0
-                    for post_data in posts:
+                    for post_data in posts_by_keyword.get(kw, []):
                         if cli_obj.db.add_post(post_data):
                             stored_count += 1
                     
-                    cli_obj.print_success(f"Collected {stored_count} new posts from {platform_name}")
+                    cli_obj.print_success(f"Collected {stored_count} new posts for '{kw}' from {platform_name}")
                     total_collected += stored_count
-                    
-                except Exception as e:
-                    cli_obj.print_error(f"Error collecting from {platform_name}: {e}")
+                
+            except Exception as e:
+                cli_obj.print_error(f"Error collecting from {platform_name}: {e}")
         
         cli_obj.print_success(f"Total collected: {total_collected} posts")
         
@@ -510,32 +510,37 @@ def monitor(ctx, keyword, interval):
         
         try:
             while True:
-                for kw in keywords:
-                    cli_obj.print_info(f"Collecting for: {kw}")
+                cli_obj.print_info(f"Collecting for: {', '.join(keywords)}")
+                
+                # Collect from all platforms, covering every keyword in one pass each
+                for platform_name, collector in cli_obj.collectors.items():
+                    if not collector.is_available():
+                        continue
                     
-                    # Collect from all platforms
-                    for platform_name, collector in cli_obj.collectors.items():
-                        if not collector.is_available():
-                            continue
+                    try:
+                        posts_by_keyword = collector.collect_posts_for_keywords(keywords, limit=50)
+                        stored_count = 0
                         
-                        try:
-                            posts = collector.collect_posts_for_keyword(kw, limit=50)
-                            stored_count = 0
-                            
+                        for posts in posts_by_keyword.values():
                             for post_data in posts:
                                 if cli_obj.db.add_post(post_data):
                                     stored_count += 1
-                            
-                            if stored_count > 0:
-                                cli_obj.print_success(f"Stored {stored_count} new posts from {platform_name}")
                         
-                        except Exception as e:
-                            cli_obj.print_warning(f"Error collecting from {platform_name}: {e}")
+                        if stored_count > 0:
+                            cli_obj.print_success(f"Stored {stored_count} new posts from {platform_name}")
+                    
+                    except Exception as e:
+                        cli_obj.print_warning(f"Error collecting from {platform_name}: {e}")
                 
                 # Analyze new posts
                 cli_obj.print_info("Analyzing new posts...")
                 ctx.invoke(analyze, limit=100)
                 
+                # Check alert conditions for every keyword with one grouped summary query
+                alerts = get_alert_manager().check_and_create_alerts_bulk(keywords)
+                for alert in alerts:
+                    cli_obj.print_warning(f"Alert [{alert.severity}]: {alert.message}")
+                
                 cli_obj.print_info(f"Waiting {interval} seconds until next collection...")
                 time.sleep(interval)
                 
@@ -25,6 +25,11 @@ class BaseCollector(ABC):
         """Collect posts for a specific keyword."""
         pass
     
+    def collect_posts_for_keywords(self, keywords: List[str], limit: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+        """Collect posts for several keywords, keyed by keyword."""
+        # Collectors that can share work between keywords override this
+        return {keyword: self.collect_posts_for_keyword(keyword, limit=limit) for keyword in keywords}
+    
     @abstractmethod
     def test_connection(self) -> Dict[str, Any]:
         """Test the connection to the data source."""
@@ -85,6 +90,8 @@ class BaseCollector(ABC):
     def filter_duplicates(self, posts: List[Dict[str, Any]], 
                          existing_ids: set) -> List[Dict[str, Any]]:
         """Filter out duplicate posts based on external_id."""
+        # Only `in` and add() are used, so a long-running collector can pass a
+        # Bloom filter here to bound memory, accepting its false-positive rate
         filtered_posts = []
         
         for post in posts:
@@ -2,18 +2,36 @@
 
 import logging
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+# Multi-keyword matching in a single pass over the text (optional: pyahocorasick)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from .base_collector import BaseCollector
 from ..storage.database import get_db
-from ..storage.models import Platform, Keyword
+from ..storage.models import Keyword
 from ..utils.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so per-story API calls reuse pooled keep-alive connections
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(pool_maxsize=10))
+
+# Pause after each story request, per worker, to stay under the API rate limit
+STORY_REQUEST_DELAY = 0.2
+
 
 class HackerNewsCollector(BaseCollector):
     """Collects posts from Hacker News using their API and web scraping."""
@@ -32,12 +50,9 @@ class HackerNewsCollector(BaseCollector):
         """Initialize Hacker News collector."""
         try:
             # Get platform ID
-            with self.db.get_session() as session:
-                platform = session.query(Platform).filter_by(name='hackernews').first()
-                if platform:
-                    self._hn_platform_id = platform.id
-                else:
-                    logger.error("Hacker News platform not found in database")
+            self._hn_platform_id = self.db.get_platform_id('hackernews')
+            if self._hn_platform_id is None:
+                logger.error("Hacker News platform not found in database")
         except Exception as e:
             logger.error(f"Error initializing Hacker News collector: {e}")
     
@@ -47,62 +62,89 @@ class HackerNewsCollector(BaseCollector):
     
     def collect_posts_for_keyword(self, keyword: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Collect posts from Hacker News for a specific keyword."""
+        return self.collect_posts_for_keywords([keyword], limit=limit).get(keyword, [])
+    
+    def collect_posts_for_keywords(self, keywords: List[str], limit: int = 50) -> Dict[str, List[Dict[str, Any]]]:
+        """Collect posts for several keywords from a single pass over the story feeds."""
         if not self.is_available():
             logger.warning("Hacker News collector not available")
-            return []
+            return {}
         
-        posts = []
+        posts = {keyword: [] for keyword in keywords}
         try:
-            # Get keyword object from database
+            # Get keyword ids from database in one query
             with self.db.get_session() as session:
-                keyword_obj = session.query(Keyword).filter_by(keyword=keyword).first()
-                if not keyword_obj:
+                keyword_ids = dict(
+                    session.query(Keyword.keyword, Keyword.id).filter(Keyword.keyword.in_(keywords)).all()
+                )
+            
+            for keyword in keywords:
+                if keyword not in keyword_ids:
                     logger.warning(f"Keyword '{keyword}' not found in database")
-                    return []
-                keyword_id = keyword_obj.id
+            
+            if not keyword_ids:
+                return posts
+            
+            # The matcher reports lowercased keywords; map them back to the stored ones
+            keywords_by_match: Dict[str, List[str]] = {}
+            for keyword in keyword_ids:
+                keywords_by_match.setdefault(keyword.lower(), []).append(keyword)
+            matcher = self._build_keyword_matcher(list(keyword_ids))
             
             # Get top stories and new stories
             story_types = ['topstories', 'newstories']
+            per_type_limit = limit // len(story_types)
             
-            for story_type in story_types:
-                try:
-                    # Get story IDs
-                    story_ids = self._get_story_ids(story_type, limit=limit*2)
-                    
-                    collected_count = 0
-                    for story_id in story_ids:
-                        if collected_count >= limit // len(story_types):
-                            break
+            # One pool serves every story request made during this collection
+            with ThreadPoolExecutor(max_workers=self.config.performance.max_workers,
+                                    thread_name_prefix='hn-fetch') as executor:
+                for story_type in story_types:
+                    try:
+                        # Get story IDs
+                        story_ids = self._get_story_ids(story_type, limit=limit*2)
                         
+                        collected_counts = dict.fromkeys(keyword_ids, 0)
+                        stories = self._iter_story_data(story_ids, executor)
                         try:
-                            story_data = self._get_story_data(story_id)
-                            if story_data and self._is_relevant_story(story_data, keyword):
-                                post_data = self._convert_to_post_data(story_data, keyword_id)
-                                if post_data:
-                                    posts.append(post_data)
-                                    collected_count += 1
+                            for story_id, story_data in stories:
+                                if all(count >= per_type_limit for count in collected_counts.values()):
+                                    break
+                                
+                                try:
+                                    # Every keyword is matched against the story in one scan
+                                    for match in self._match_story_keywords(story_data, matcher):
+                                        for keyword in keywords_by_match[match]:
+                                            if collected_counts[keyword] >= per_type_limit:
+                                                continue
+                                            
+                                            keyword_id = keyword_ids[keyword]
+                                            post_data = self._convert_to_post_data(story_data, keyword_id)
+                                            if post_data:
+                                                posts[keyword].append(post_data)
+                                                collected_counts[keyword] += 1
+                                                
+                                                # Collect comments if the story is highly relevant
+                                                if story_data.get('score', 0) > 50:
+                                                    comment_posts = self._collect_comments(story_data, keyword, keyword_id, max_comments=3)
+                                                    posts[keyword].extend(comment_posts)
                                     
-                                    # Collect comments if the story is highly relevant
-                                    if story_data.get('score', 0) > 50:
-                                        comment_posts = self._collect_comments(story_data, keyword, keyword_id, max_comments=3)
-                                        posts.extend(comment_posts)
-                            
-                        except Exception as e:
-                            logger.warning(f"Error processing story {story_id}: {e}")
-                            continue
-                        
-                        # Rate limiting
-                        time.sleep(0.2)
-                
-                except Exception as e:
-                    logger.warning(f"Error collecting {story_type}: {e}")
-                    continue
-            
-            # Also search using Algolia HN Search API
-            algolia_posts = self._search_algolia(keyword, keyword_id, limit=limit//4)
-            posts.extend(algolia_posts)
+                                except Exception as e:
+                                    logger.warning(f"Error processing story {story_id}: {e}")
+                                    continue
+                        finally:
+                            # Cancel requests queued beyond the point where collection stopped
+                            stories.close()
+                    
+                    except Exception as e:
+                        logger.warning(f"Error collecting {story_type}: {e}")
+                        continue
             
-            logger.info(f"Collected {len(posts)} posts for keyword '{keyword}' from Hacker News")
+            for keyword, keyword_id in keyword_ids.items():
+                # Also search using Algolia HN Search API
+                algolia_posts = self._search_algolia(keyword, keyword_id, limit=limit//4)
+                posts[keyword].extend(algolia_posts)
+                
+                logger.info(f"Collected {len(posts[keyword])} posts for keyword '{keyword}' from Hacker News")
             
         except Exception as e:
             logger.error(f"Error collecting Hacker News posts: {e}")
@@ -112,7 +154,7 @@ class HackerNewsCollector(BaseCollector):
     def _get_story_ids(self, story_type: str, limit: int = 100) -> List[int]:
         """Get story IDs from Hacker News API."""
         try:
-            response = requests.get(f"{self.base_url}/{story_type}.json", timeout=10)
+            response = _http.get(f"{self.base_url}/{story_type}.json", timeout=10)
             response.raise_for_status()
             story_ids = response.json()
             return story_ids[:limit]
@@ -123,24 +165,86 @@ class HackerNewsCollector(BaseCollector):
     def _get_story_data(self, story_id: int) -> Optional[Dict[str, Any]]:
         """Get story data from Hacker News API."""
         try:
-            response = requests.get(f"{self.base_url}/item/{story_id}.json", timeout=10)
+            response = _http.get(f"{self.base_url}/item/{story_id}.json", timeout=10)
             response.raise_for_status()
             return response.json()
         except Exception as e:
             logger.warning(f"Error getting story {story_id}: {e}")
             return None
     
+    def _get_story_data_paced(self, story_id: int) -> Optional[Dict[str, Any]]:
+        """Get story data, then pause so each worker respects the API rate limit."""
+        story_data = self._get_story_data(story_id)
+        time.sleep(STORY_REQUEST_DELAY)
+        return story_data
+    
+    def _iter_story_data(self, story_ids: List[int],
+                         executor: ThreadPoolExecutor) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+        """Yield (story_id, story_data) in order, keeping a bounded number of requests in flight."""
+        # Each item is a separate latency-bound request, so overlap them on the shared session;
+        # the window keeps an early stop from fetching stories nobody will read
+        remaining = iter(story_ids)
+        pending = deque(
+            (story_id, executor.submit(self._get_story_data_paced, story_id))
+            for story_id in islice(remaining, 2 * self.config.performance.max_workers)
+        )
+        try:
+            while pending:
+                story_id, future = pending.popleft()
+                for next_id in islice(remaining, 1):
+                    pending.append((next_id, executor.submit(self._get_story_data_paced, next_id)))
+                yield story_id, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+    
+    def _get_story_data_many(self, story_ids: List[int]) -> List[Optional[Dict[str, Any]]]:
+        """Get data for several stories concurrently, in the order of story_ids."""
+        if not story_ids:
+            return []
+        
+        max_workers = min(self.config.performance.max_workers, len(story_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [story_data for _, story_data in self._iter_story_data(story_ids, executor)]
+    
     def _is_relevant_story(self, story_data: Dict[str, Any], keyword: str) -> bool:
         """Check if story is relevant to the keyword."""
         if not story_data or story_data.get('deleted') or story_data.get('dead'):
             return False
         
+        return keyword.lower() in self._story_search_text(story_data)
+    
+    def _story_search_text(self, story_data: Dict[str, Any]) -> str:
+        """Build the lowercased text that keywords are matched against."""
         title = story_data.get('title', '')
         text = story_data.get('text', '')
         url = story_data.get('url', '')
         
-        search_text = f"{title} {text} {url}".lower()
-        return keyword.lower() in search_text
+        return f"{title} {text} {url}".lower()
+    
+    def _build_keyword_matcher(self, keywords: List[str]) -> Any:
+        """Build a matcher for finding many keywords in a story at once."""
+        lowered = frozenset(keyword.lower() for keyword in keywords if keyword)
+        if not AHOCORASICK_AVAILABLE or not lowered:
+            return lowered
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in lowered:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _match_story_keywords(self, story_data: Dict[str, Any], matcher: Any) -> Set[str]:
+        """Return every keyword from the matcher that occurs in the story."""
+        if not story_data or story_data.get('deleted') or story_data.get('dead'):
+            return set()
+        
+        search_text = self._story_search_text(story_data)
+        
+        # Without pyahocorasick the matcher is the keyword set, scanned one keyword at a time
+        if isinstance(matcher, frozenset):
+            return {keyword for keyword in matcher if keyword in search_text}
+        return {keyword for _, keyword in matcher.iter(search_text)}
     
     def _convert_to_post_data(self, story_data: Dict[str, Any], keyword_id: int) -> Optional[Dict[str, Any]]:
         """Convert HN story data to our post format."""
@@ -261,7 +365,7 @@ class HackerNewsCollector(BaseCollector):
                 'page': 0
             }
             
-            response = requests.get(search_url, params=params, timeout=10)
+            response = _http.get(search_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -325,13 +429,13 @@ class HackerNewsCollector(BaseCollector):
         
         try:
             # Test main API
-            response = requests.get(f"{self.base_url}/topstories.json", timeout=10)
+            response = _http.get(f"{self.base_url}/topstories.json", timeout=10)
             if response.status_code == 200:
                 status['api_responsive'] = True
             
             # Test Algolia search
-            search_response = requests.get("https://hn.algolia.com/api/v1/search", 
-                                         params={'query': 'test', 'hitsPerPage': 1}, timeout=10)
+            search_response = _http.get("https://hn.algolia.com/api/v1/search", 
+                                      params={'query': 'test', 'hitsPerPage': 1}, timeout=10)
             if search_response.status_code == 200:
                 status['algolia_responsive'] = True
             
@@ -1,15 +1,16 @@
 """Reddit data collector using PRAW."""
 
 import logging
+import re
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterator, Pattern
 import praw
 from praw.exceptions import PRAWException
 import requests.exceptions
 
 from ..storage.database import get_db
-from ..storage.models import Post, Keyword, Platform
+from ..storage.models import Post, Keyword
 from ..utils.config import get_config, get_secrets
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,7 @@ class RedditCollector:
         self.db = get_db()
         self.reddit = None
         self._reddit_platform_id = None
+        self._keyword_patterns: Dict[str, Pattern] = {}
         
         self._initialize_reddit()
     
@@ -52,12 +54,9 @@ class RedditCollector:
                 logger.info("Reddit API connection established (read-only)")
             
             # Get platform ID
-            with self.db.get_session() as session:
-                platform = session.query(Platform).filter_by(name='reddit').first()
-                if platform:
-                    self._reddit_platform_id = platform.id
-                else:
-                    logger.error("Reddit platform not found in database")
+            self._reddit_platform_id = self.db.get_platform_id('reddit')
+            if self._reddit_platform_id is None:
+                logger.error("Reddit platform not found in database")
                     
         except Exception as e:
             logger.error(f"Error initializing Reddit API: {e}")
@@ -248,11 +247,13 @@ class RedditCollector:
         if not text or not keyword:
             return False
         
-        text_lower = text.lower()
-        keyword_lower = keyword.lower()
+        # Compile each keyword once; searching case-insensitively avoids lowercasing every text
+        pattern = self._keyword_patterns.get(keyword)
+        if pattern is None:
+            pattern = self._keyword_patterns[keyword] = re.compile(re.escape(keyword), re.IGNORECASE)
         
         # Simple keyword matching - can be enhanced with boolean operators later
-        return keyword_lower in text_lower
+        return pattern.search(text) is not None
     
     def collect_trending_topics(self, subreddits: List[str] = None) -> List[Dict[str, Any]]:
         """Collect trending topics from specified subreddits."""
@@ -7,7 +7,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
 # Configure logging
@@ -62,6 +62,10 @@ if db is None:
     st.error("Failed to initialize application. Please check your configuration.")
     st.stop()
 
+# Refresh cadences for auto-refreshing fragments
+METRICS_REFRESH_SECONDS = 30
+CHARTS_REFRESH_SECONDS = 300
+
 # Helper functions
 @st.cache_data(ttl=60)  # Cache for 1 minute
 def get_active_keywords():
@@ -93,6 +97,15 @@ def sentiment_color(score):
     else:
         return "#FFD700"  # Yellow
 
+def sentiment_colors(scores):
+    """Get colors for an array of sentiment scores (vectorized sentiment_color)."""
+    scores = np.asarray(scores, dtype=float)
+    return np.select(
+        [scores > 0.1, scores < -0.1],
+        ["#2E8B57", "#DC143C"],  # Green, Red
+        default="#FFD700"  # Yellow
+    )
+
 def sentiment_label(score):
     """Get label for sentiment score."""
     if score > 0.5:
@@ -161,10 +174,39 @@ def main():
         st.warning(f"No data found for keyword '{selected_keyword}' in the last {time_range.lower()}")
         return
     
-    # Main dashboard layout
+    # Key metrics and recent posts refresh on the fast cadence
+    metrics_every = METRICS_REFRESH_SECONDS if auto_refresh else None
+    charts_every = CHARTS_REFRESH_SECONDS if auto_refresh else None
+    st.fragment(display_metrics_row, run_every=metrics_every)(selected_keyword, hours, time_range)
+    
+    # Gauge and charts refresh on the slow cadence
+    st.fragment(display_sentiment_gauge, run_every=charts_every)(selected_keyword, hours)
+    
+    # Time series chart
+    if trends:
+        st.fragment(display_timeseries, run_every=charts_every)(selected_keyword, hours)
+    
+    # Distribution and volume charts
+    st.fragment(display_breakdown_charts, run_every=charts_every)(selected_keyword, hours)
+    
+    # Recent posts table
+    st.fragment(display_recent_posts_section, run_every=metrics_every)(selected_keyword, hours)
+    
+    # System status in sidebar
+    st.sidebar.subheader("System Status")
+    show_system_status()
+    
+    # Data collection controls
+    st.sidebar.subheader("Data Collection")
+    if st.sidebar.button("Collect New Data"):
+        collect_data(selected_keyword)
+
+def display_metrics_row(keyword, hours, time_range):
+    """Display key metrics row (rerun as a fragment)."""
+    _, summary, _ = get_sentiment_data(keyword, hours)
+    
     col1, col2, col3, col4 = st.columns(4)
     
-    # Key metrics
     with col1:
         total_posts = summary.get('total_posts', 0)
         st.metric(
@@ -197,17 +239,27 @@ def main():
             f"{negative_ratio:.1f}%",
             delta=f"{summary.get('negative_count', 0)} posts"
         )
+
+def display_sentiment_gauge(keyword, hours):
+    """Display current sentiment gauge (rerun as a fragment)."""
+    _, summary, _ = get_sentiment_data(keyword, hours)
     
-    # Sentiment gauge
     st.subheader("Current Sentiment")
-    gauge_fig = create_sentiment_gauge(avg_sentiment)
+    gauge_fig = create_sentiment_gauge(summary.get('avg_sentiment', 0))
     st.plotly_chart(gauge_fig, use_container_width=True)
+
+def display_timeseries(keyword, hours):
+    """Display sentiment timeline (rerun as a fragment)."""
+    trends, _, _ = get_sentiment_data(keyword, hours)
     
-    # Time series chart
+    st.subheader("Sentiment Over Time")
     if trends:
-        st.subheader("Sentiment Over Time")
-        timeseries_fig = create_timeseries_chart(trends, selected_keyword)
+        timeseries_fig = create_timeseries_chart(trends, keyword)
         st.plotly_chart(timeseries_fig, use_container_width=True)
+
+def display_breakdown_charts(keyword, hours):
+    """Display distribution and volume charts side by side (rerun as a fragment)."""
+    trends, summary, _ = get_sentiment_data(keyword, hours)
     
     # Two column layout for additional charts
     col_left, col_right = st.columns(2)
@@ -225,27 +277,16 @@ def main():
         if trends:
             correlation_fig = create_correlation_chart(trends)
             st.plotly_chart(correlation_fig, use_container_width=True)
+
+def display_recent_posts_section(keyword, hours):
+    """Display recent posts section (rerun as a fragment)."""
+    _, _, recent_posts = get_sentiment_data(keyword, hours)
     
-    # Recent posts table
     st.subheader("Recent Posts")
     if recent_posts:
         display_recent_posts(recent_posts)
     else:
         st.info("No recent posts found")
-    
-    # System status in sidebar
-    st.sidebar.subheader("System Status")
-    show_system_status()
-    
-    # Data collection controls
-    st.sidebar.subheader("Data Collection")
-    if st.sidebar.button("Collect New Data"):
-        collect_data(selected_keyword)
-    
-    # Auto-refresh
-    if auto_refresh:
-        time.sleep(30)
-        st.rerun()
 
 def create_sentiment_gauge(sentiment_score):
     """Create sentiment gauge chart."""
@@ -298,7 +339,7 @@ def create_timeseries_chart(trends, keyword):
             mode='lines+markers',
             name='Sentiment',
             line=dict(color='blue', width=2),
-            marker=dict(size=4)
+            marker=dict(size=4, color=sentiment_colors(df['sentiment']))
         ),
         row=1, col=1
     )
@@ -444,18 +485,23 @@ def collect_data(keyword):
     """Collect new data for keyword."""
     try:
         with st.spinner(f"Collecting data for '{keyword}'..."):
-            total_collected = 0
+            available = {name: c for name, c in collectors.items() if c.is_available()}
+            collected_posts = []
+            
+            # Collectors are network-bound, so run them concurrently
+            if available:
+                with ThreadPoolExecutor(max_workers=len(available)) as executor:
+                    futures = {
+                        executor.submit(collector.collect_posts_for_keyword, keyword, limit=25): name
+                        for name, collector in available.items()
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            collected_posts.extend(future.result())
+                        except Exception as e:
+                            logger.error(f"Error collecting from {futures[future]}: {e}")
             
-            for name, collector in collectors.items():
-                if collector.is_available():
-                    posts = collector.collect_posts_for_keyword(keyword, limit=25)
-                    
-                    stored_count = 0
-                    for post_data in posts:
-                        if db.add_post(post_data):
-                            stored_count += 1
-                    
-                    total_collected += stored_count
+            total_collected = len(db.add_posts(collected_posts))
             
             if total_collected > 0:
                 st.success(f"Collected {total_collected} new posts!")
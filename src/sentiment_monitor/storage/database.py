@@ -7,16 +7,54 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, func, and_, or_
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, bindparam, delete, event, func, insert, inspect, lambda_stmt, select, and_, or_
+# Upserts use SQLite's ON CONFLICT syntax; DatabaseManager only ever opens SQLite
+# engines, and the JSONB column variant does not make these statements portable
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.exc import SQLAlchemyError
 
 from .models import Base, Keyword, Platform, Post, SentimentScore, Alert, SentimentSummary
 from ..utils.config import get_config
+from ..utils import serialization
 
 logger = logging.getLogger(__name__)
 
 
+def _summary_columns():
+    """Aggregate columns shared by the sentiment summary queries."""
+    return (
+        func.count(SentimentScore.id).label('total_posts'),
+        func.avg(SentimentScore.compound_score).label('avg_sentiment'),
+        func.avg(SentimentScore.confidence).label('avg_confidence'),
+        func.count(func.nullif(SentimentScore.compound_score > 0.1, False)).label('positive_count'),
+        func.count(func.nullif(SentimentScore.compound_score < -0.1, False)).label('negative_count'),
+        func.count(func.nullif(and_(SentimentScore.compound_score >= -0.1, SentimentScore.compound_score <= 0.1), False)).label('neutral_count')
+    )
+
+
+def _format_summary(stats, hours: int) -> Dict[str, Any]:
+    """Convert a summary row (or None) into the summary dict."""
+    return {
+        'total_posts': getattr(stats, 'total_posts', 0) or 0,
+        'avg_sentiment': float(getattr(stats, 'avg_sentiment', 0) or 0),
+        'avg_confidence': float(getattr(stats, 'avg_confidence', 0) or 0),
+        'positive_count': getattr(stats, 'positive_count', 0) or 0,
+        'negative_count': getattr(stats, 'negative_count', 0) or 0,
+        'neutral_count': getattr(stats, 'neutral_count', 0) or 0,
+        'period_hours': hours
+    }
+
+
+def _with_metadata_column(data: Dict[str, Any], column: str) -> Dict[str, Any]:
+    """Rename the generic 'metadata' key to the model's JSON column attribute."""
+    values = dict(data)
+    if 'metadata' in values:
+        values[column] = values.pop('metadata')
+    return values
+
+
 class DatabaseManager:
     """Manages database connections and operations."""
     
@@ -28,25 +66,57 @@ class DatabaseManager:
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create engine
+        # Create engine; an in-memory database lives in a single connection, so
+        # share it across threads instead of giving each thread an empty one
+        pool_options = {'poolclass': StaticPool} if self.db_path == ':memory:' else {}
         self.engine = create_engine(
             f"sqlite:///{self.db_path}",
             echo=False,  # Set to True for SQL debugging
             pool_recycle=3600,
-            connect_args={'check_same_thread': False}
+            connect_args={'check_same_thread': False},
+            **pool_options,
+            json_serializer=serialization.dumps,
+            json_deserializer=serialization.loads
         )
+        event.listen(self.engine, 'connect', self._set_sqlite_pragmas)
+        
+        # Create session factory; keep attributes loaded after commit so
+        # returned objects don't need a refresh SELECT
+        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
         
-        # Create session factory
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # Platform rows are fixed after initialization, so their ids can be cached
+        self._platform_ids: Dict[str, int] = {}
         
         # Initialize database
         self.init_db()
     
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Configure each new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        # Required for ON DELETE CASCADE on sentiment scores
+        cursor.execute("PRAGMA foreign_keys=ON")
+        # WAL lets readers run alongside the writer; NORMAL skips the fsync per commit
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+    
     def init_db(self) -> None:
         """Initialize database tables and default data."""
         try:
             # Create all tables
             Base.metadata.create_all(bind=self.engine)
+            
+            # Older databases may hold repeated scores that would block the unique index
+            self._dedupe_sentiment_scores()
+            
+            # create_all skips existing tables, so add indexes introduced since they were created
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=self.engine, checkfirst=True)
             logger.info("Database tables created successfully")
             
             # Insert default platforms if they don't exist
@@ -56,19 +126,29 @@ class DatabaseManager:
             logger.error(f"Error initializing database: {e}")
             raise
     
+    def _dedupe_sentiment_scores(self) -> None:
+        """Keep only the newest score per post and model before uq_post_model is created."""
+        existing = {index['name'] for index in inspect(self.engine).get_indexes(SentimentScore.__tablename__)}
+        if 'uq_post_model' in existing:
+            return
+        
+        newest = select(func.max(SentimentScore.id)).group_by(SentimentScore.post_id, SentimentScore.model_name)
+        with self.get_session() as session:
+            result = session.execute(delete(SentimentScore).where(SentimentScore.id.not_in(newest)))
+            session.commit()
+            if result.rowcount:
+                logger.info(f"Removed {result.rowcount} duplicate sentiment scores")
+    
     def _insert_default_platforms(self) -> None:
         """Insert default social media platforms."""
+        default_platforms = ['reddit', 'hackernews', 'twitter', 'news']
+        
         with self.get_session() as session:
-            existing_platforms = session.query(Platform).all()
-            existing_names = {p.name for p in existing_platforms}
-            
-            default_platforms = ['reddit', 'hackernews', 'twitter', 'news']
-            
-            for platform_name in default_platforms:
-                if platform_name not in existing_names:
-                    platform = Platform(name=platform_name)
-                    session.add(platform)
-            
+            # Unique constraint on name makes this idempotent across restarts
+            session.execute(
+                insert(Platform).prefix_with('OR IGNORE'),
+                [{'name': name} for name in default_platforms]
+            )
             session.commit()
             logger.info("Default platforms initialized")
     
@@ -101,7 +181,6 @@ class DatabaseManager:
             new_keyword = Keyword(keyword=keyword)
             session.add(new_keyword)
             session.commit()
-            session.refresh(new_keyword)
             
             logger.info(f"Added new keyword: {keyword}")
             return new_keyword
@@ -128,24 +207,29 @@ class DatabaseManager:
         with self.get_session() as session:
             return session.query(Platform).filter_by(name=name).first()
     
+    def get_platform_id(self, name: str) -> Optional[int]:
+        """Get a platform's id by name, caching ids that were found."""
+        platform_id = self._platform_ids.get(name)
+        if platform_id is None:
+            with self.get_session() as session:
+                platform_id = session.execute(
+                    select(Platform.id).where(Platform.name == name)
+                ).scalar_one_or_none()
+            if platform_id is not None:
+                self._platform_ids[name] = platform_id
+        return platform_id
+    
     def add_post(self, post_data: Dict[str, Any]) -> Optional[Post]:
         """Add a new post to the database."""
         with self.get_session() as session:
             try:
-                # Check for duplicates
-                existing = session.query(Post).filter_by(
-                    platform_id=post_data['platform_id'],
-                    external_id=post_data['external_id']
-                ).first()
-                
-                if existing:
-                    return None  # Skip duplicate
+                # Duplicates hit uq_platform_external_id and return no row
+                stmt = sqlite_insert(Post).values(_with_metadata_column(post_data, 'post_metadata')).on_conflict_do_nothing(
+                    index_elements=['platform_id', 'external_id']
+                ).returning(Post)
                 
-                # Create new post
-                post = Post(**post_data)
-                session.add(post)
+                post = session.scalars(stmt).first()
                 session.commit()
-                session.refresh(post)
                 
                 return post
                 
@@ -153,28 +237,51 @@ class DatabaseManager:
                 logger.error(f"Error adding post: {e}")
                 return None
     
+    def add_posts(self, posts_data: List[Dict[str, Any]]) -> List[Post]:
+        """Add multiple posts in a single transaction, skipping duplicates."""
+        if not posts_data:
+            return []
+        
+        with self.get_session() as session:
+            try:
+                # Look up existing posts for the whole batch in one query
+                external_ids = {p['external_id'] for p in posts_data}
+                existing = {
+                    tuple(row) for row in session.query(Post.platform_id, Post.external_id).filter(
+                        Post.external_id.in_(external_ids)
+                    ).all()
+                }
+                
+                new_posts = []
+                for post_data in posts_data:
+                    key = (post_data['platform_id'], post_data['external_id'])
+                    if key in existing:
+                        continue  # Skip duplicate
+                    existing.add(key)
+                    new_posts.append(Post(**_with_metadata_column(post_data, 'post_metadata')))
+                
+                session.add_all(new_posts)
+                session.commit()
+                
+                return new_posts
+            
+            except SQLAlchemyError as e:
+                logger.error(f"Error adding posts: {e}")
+                return []
+    
     def add_sentiment_score(self, score_data: Dict[str, Any]) -> Optional[SentimentScore]:
         """Add sentiment score for a post."""
         with self.get_session() as session:
             try:
-                # Check if score already exists for this post and model
-                existing = session.query(SentimentScore).filter_by(
-                    post_id=score_data['post_id'],
-                    model_name=score_data['model_name']
-                ).first()
-                
-                if existing:
-                    # Update existing score
-                    for key, value in score_data.items():
-                        setattr(existing, key, value)
-                    score = existing
-                else:
-                    # Create new score
-                    score = SentimentScore(**score_data)
-                    session.add(score)
+                # Insert, or update the existing score for this post and model, in one statement
+                stmt = sqlite_insert(SentimentScore).values(score_data)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['post_id', 'model_name'],
+                    set_={key: stmt.excluded[key] for key in score_data if key != 'post_id'}
+                ).returning(SentimentScore)
                 
+                score = session.scalars(stmt).first()
                 session.commit()
-                session.refresh(score)
                 return score
                 
             except SQLAlchemyError as e:
@@ -186,13 +293,18 @@ class DatabaseManager:
         with self.get_session() as session:
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
             
-            return session.query(Post).join(Keyword).filter(
+            # lambda_stmt caches the compiled SQL; only parameters change per call
+            stmt = lambda_stmt(lambda: select(Post).join(Keyword).where(
                 and_(
-                    Keyword.keyword == keyword,
-                    Post.posted_at >= cutoff_time,
+                    Keyword.keyword == bindparam('keyword'),
+                    Post.posted_at >= bindparam('cutoff'),
                     Post.is_processed == True
                 )
-            ).order_by(Post.posted_at.desc()).limit(limit).all()
+            ).order_by(Post.posted_at.desc()).limit(bindparam('limit')))
+            
+            return session.execute(
+                stmt, {'keyword': keyword, 'cutoff': cutoff_time, 'limit': limit}
+            ).scalars().all()
     
     def get_sentiment_trends(self, keyword: str, hours: int = 24) -> List[Dict[str, Any]]:
         """Get sentiment trends for a keyword over time."""
@@ -200,27 +312,29 @@ class DatabaseManager:
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
             
             # Query for sentiment scores with timestamps
-            results = session.query(
+            stmt = lambda_stmt(lambda: select(
                 Post.posted_at,
                 SentimentScore.compound_score,
                 SentimentScore.confidence,
                 SentimentScore.model_name
-            ).join(SentimentScore).join(Keyword).filter(
+            ).join(SentimentScore).join(Keyword).where(
                 and_(
-                    Keyword.keyword == keyword,
-                    Post.posted_at >= cutoff_time,
+                    Keyword.keyword == bindparam('keyword'),
+                    Post.posted_at >= bindparam('cutoff'),
                     SentimentScore.confidence >= 0.5  # Only high confidence scores
                 )
-            ).order_by(Post.posted_at).all()
+            ).order_by(Post.posted_at))
+            
+            results = session.execute(stmt, {'keyword': keyword, 'cutoff': cutoff_time})
             
             return [
                 {
-                    'timestamp': result.posted_at,
-                    'sentiment': result.compound_score,
-                    'confidence': result.confidence,
-                    'model': result.model_name
+                    'timestamp': posted_at,
+                    'sentiment': compound_score,
+                    'confidence': confidence,
+                    'model': model_name
                 }
-                for result in results
+                for posted_at, compound_score, confidence, model_name in results
             ]
     
     def get_sentiment_summary(self, keyword: str, hours: int = 24) -> Dict[str, Any]:
@@ -229,29 +343,43 @@ class DatabaseManager:
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
             
             # Get basic stats
-            stats = session.query(
-                func.count(SentimentScore.id).label('total_posts'),
-                func.avg(SentimentScore.compound_score).label('avg_sentiment'),
-                func.avg(SentimentScore.confidence).label('avg_confidence'),
-                func.count(func.nullif(SentimentScore.compound_score > 0.1, False)).label('positive_count'),
-                func.count(func.nullif(SentimentScore.compound_score < -0.1, False)).label('negative_count'),
-                func.count(func.nullif(and_(SentimentScore.compound_score >= -0.1, SentimentScore.compound_score <= 0.1), False)).label('neutral_count')
-            ).join(Post).join(Keyword).filter(
+            stmt = lambda_stmt(lambda: select(*_summary_columns()).join(Post).join(Keyword).where(
                 and_(
-                    Keyword.keyword == keyword,
-                    Post.posted_at >= cutoff_time
+                    Keyword.keyword == bindparam('keyword'),
+                    Post.posted_at >= bindparam('cutoff')
                 )
-            ).first()
+            ))
             
-            return {
-                'total_posts': stats.total_posts or 0,
-                'avg_sentiment': float(stats.avg_sentiment or 0),
-                'avg_confidence': float(stats.avg_confidence or 0),
-                'positive_count': stats.positive_count or 0,
-                'negative_count': stats.negative_count or 0,
-                'neutral_count': stats.neutral_count or 0,
-                'period_hours': hours
-            }
+            stats = session.execute(stmt, {'keyword': keyword, 'cutoff': cutoff_time}).first()
+            
+            return _format_summary(stats, hours)
+    
+    def get_sentiment_summaries(self, keywords: List[str], hours: int = 24) -> Dict[str, Dict[str, Any]]:
+        """Get aggregated sentiment statistics for several keywords in one query."""
+        if not keywords:
+            return {}
+        
+        with self.get_session() as session:
+            cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+            
+            stmt = lambda_stmt(lambda: select(
+                Keyword.keyword, *_summary_columns()
+            ).select_from(SentimentScore).join(Post).join(Keyword).where(
+                and_(
+                    Keyword.keyword.in_(bindparam('keywords', expanding=True)),
+                    Post.posted_at >= bindparam('cutoff')
+                )
+            ).group_by(Keyword.keyword))
+            
+            rows = session.execute(stmt, {'keywords': list(keywords), 'cutoff': cutoff_time}).all()
+            summaries = {row.keyword: _format_summary(row, hours) for row in rows}
+            
+            # Keywords without posts in the window get an empty summary
+            for keyword in keywords:
+                if keyword not in summaries:
+                    summaries[keyword] = _format_summary(None, hours)
+            
+            return summaries
     
     def add_alert(self, alert_data: Dict[str, Any]) -> Alert:
         """Add a new alert."""
@@ -259,13 +387,28 @@ class DatabaseManager:
             alert = Alert(**alert_data)
             session.add(alert)
             session.commit()
-            session.refresh(alert)
             return alert
     
+    def add_alerts(self, alerts_data: List[Dict[str, Any]]) -> List[Alert]:
+        """Add multiple alerts in a single transaction."""
+        if not alerts_data:
+            return []
+        
+        with self.get_session() as session:
+            # ORM bulk INSERT ... RETURNING sends the whole batch as one multi-row statement
+            alerts = session.scalars(
+                insert(Alert).returning(Alert),
+                [_with_metadata_column(alert_data, 'alert_metadata') for alert_data in alerts_data]
+            ).all()
+            session.commit()
+            return alerts
+    
     def get_active_alerts(self) -> List[Alert]:
         """Get all active alerts."""
         with self.get_session() as session:
-            return session.query(Alert).filter_by(is_active=True, is_acknowledged=False).all()
+            return session.query(Alert).options(
+                joinedload(Alert.keyword_rel)
+            ).filter_by(is_active=True, is_acknowledged=False).all()
     
     def cleanup_old_data(self, retention_days: int = None) -> None:
         """Clean up old data based on retention policy."""
@@ -275,14 +418,19 @@ class DatabaseManager:
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
         
         with self.get_session() as session:
-            # Delete old posts and their associated data
-            old_posts = session.query(Post).filter(Post.collected_at < cutoff_date)
-            deleted_count = old_posts.count()
-            old_posts.delete()
+            # Delete scores of old posts first; databases created before the
+            # foreign key gained ON DELETE CASCADE would otherwise reject the delete
+            old_post_ids = select(Post.id).where(Post.collected_at < cutoff_date)
+            session.execute(delete(SentimentScore).where(SentimentScore.post_id.in_(old_post_ids)))
+            
+            # Delete old posts
+            result = session.execute(
+                delete(Post).where(Post.collected_at < cutoff_date)
+            )
+            deleted_count = result.rowcount
             
             # Delete old alerts
-            old_alerts = session.query(Alert).filter(Alert.created_at < cutoff_date)
-            old_alerts.delete()
+            session.execute(delete(Alert).where(Alert.created_at < cutoff_date))
             
             session.commit()
             logger.info(f"Cleaned up {deleted_count} old posts and associated data")
@@ -310,9 +458,12 @@ class DatabaseManager:
             return 0.0
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+# Global database manager instance, created on first use
+_db_manager: Optional[DatabaseManager] = None
 
 def get_db() -> DatabaseManager:
     """Get the global database manager instance."""
-    return db_manager
\ No newline at end of file
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
\ No newline at end of file
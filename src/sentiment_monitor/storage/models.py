@@ -1,32 +1,19 @@
 """Database models for sentiment monitoring data."""
 
-from datetime import datetime
 from typing import Optional, Dict, Any
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, Text, Boolean, 
-    ForeignKey, Index, UniqueConstraint
+    ForeignKey, Index, UniqueConstraint, JSON, func
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.types import TypeDecorator, VARCHAR
-import json
 
 Base = declarative_base()
 
 
-class JSONEncodedDict(TypeDecorator):
-    """Enables JSON storage by encoding and decoding on the fly."""
-    impl = VARCHAR
-    
-    def process_bind_param(self, value, dialect):
-        if value is not None:
-            value = json.dumps(value)
-        return value
-    
-    def process_result_value(self, value, dialect):
-        if value is not None:
-            value = json.loads(value)
-        return value
+# Native JSON column; the driver handles encoding and Postgres gets binary JSONB
+JSONType = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), 'postgresql')
 
 
 class Keyword(Base):
@@ -36,11 +23,11 @@ class Keyword(Base):
     id = Column(Integer, primary_key=True)
     keyword = Column(String(255), unique=True, nullable=False)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    posts = relationship("Post", back_populates="keyword_rel")
+    posts = relationship("Post", back_populates="keyword_rel", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Keyword(id={self.id}, keyword='{self.keyword}', active={self.is_active})>"
@@ -53,10 +40,10 @@ class Platform(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(50), unique=True, nullable=False)  # reddit, hackernews, etc.
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
     
     # Relationships
-    posts = relationship("Post", back_populates="platform_rel")
+    posts = relationship("Post", back_populates="platform_rel", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Platform(id={self.id}, name='{self.name}')>"
@@ -80,16 +67,16 @@ class Post(Base):
     author = Column(String(255))
     
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
     posted_at = Column(DateTime)  # When it was posted on the platform
-    collected_at = Column(DateTime, default=datetime.utcnow)
+    collected_at = Column(DateTime, server_default=func.now())
     
     # Engagement metrics
     score = Column(Integer, default=0)  # Reddit upvotes, HN points, etc.
     comment_count = Column(Integer, default=0)
     
     # Additional metadata (platform-specific)
-    post_metadata = Column(JSONEncodedDict)
+    post_metadata = Column(JSONType)
     
     # Processing flags
     is_processed = Column(Boolean, default=False)
@@ -99,7 +86,7 @@ class Post(Base):
     # Relationships
     platform_rel = relationship("Platform", back_populates="posts")
     keyword_rel = relationship("Keyword", back_populates="posts")
-    sentiment_scores = relationship("SentimentScore", back_populates="post")
+    sentiment_scores = relationship("SentimentScore", back_populates="post", passive_deletes=True)
     
     # Indexes
     __table_args__ = (
@@ -118,7 +105,7 @@ class SentimentScore(Base):
     __tablename__ = 'sentiment_scores'
     
     id = Column(Integer, primary_key=True)
-    post_id = Column(Integer, ForeignKey('posts.id'), nullable=False)
+    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
     
     # Model information
     model_name = Column(String(100), nullable=False)  # vader, roberta, etc.
@@ -135,17 +122,18 @@ class SentimentScore(Base):
     processing_time = Column(Float)  # Time taken to process (seconds)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
     
     # Additional model-specific data
-    raw_output = Column(JSONEncodedDict)
+    raw_output = Column(JSONType)
     
     # Relationships
     post = relationship("Post", back_populates="sentiment_scores")
     
     # Indexes
     __table_args__ = (
-        Index('idx_post_model', 'post_id', 'model_name'),
+        # Unique so add_sentiment_score can upsert on (post_id, model_name)
+        Index('uq_post_model', 'post_id', 'model_name', unique=True),
         Index('idx_compound_score', 'compound_score'),
         Index('idx_confidence', 'confidence'),
     )
@@ -176,20 +164,24 @@ class Alert(Base):
     acknowledged_at = Column(DateTime)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
     resolved_at = Column(DateTime)
     
     # Additional data
-    alert_metadata = Column(JSONEncodedDict)
+    alert_metadata = Column(JSONType)
     
     # Relationships
     keyword_rel = relationship("Keyword")
     
     # Indexes
     __table_args__ = (
-        Index('idx_keyword_active', 'keyword_id', 'is_active'),
+        # Recent-alert lookups filter on keyword/is_active/created_at and read alert_type
+        Index('idx_keyword_active_created', 'keyword_id', 'is_active', 'created_at', 'alert_type'),
+        Index('idx_active_ack_created', 'is_active', 'is_acknowledged', 'created_at',
+              postgresql_include=['severity', 'message']),
         Index('idx_created_at', 'created_at'),
         Index('idx_severity', 'severity'),
+        Index('idx_active_resolved_at', 'is_active', 'resolved_at'),
     )
     
     def __repr__(self):
@@ -228,8 +220,8 @@ class SentimentSummary(Base):
     high_confidence_count = Column(Integer, default=0)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
     keyword_rel = relationship("Keyword")
@@ -1,20 +1,46 @@
 """Alert management and notification system."""
 
+import atexit
 import logging
 import smtplib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from typing import List, Dict, Any, Optional, Set, Tuple
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+
+from sqlalchemy import bindparam, case, delete, func, lambda_stmt, select
+from sqlalchemy.orm import joinedload
 
 from ..storage.database import get_db
 from ..storage.models import Alert, Keyword
 from ..utils.config import get_config, get_secrets
+from ..utils import serialization
 from ..analysis.analytics import get_analytics
 
 logger = logging.getLogger(__name__)
 
+# Slack message prefix and attachment color by severity
+_SEVERITY_PREFIX = {
+    'critical': '[CRITICAL]',
+    'high': '[HIGH]',
+    'medium': '[MEDIUM]',
+    'low': '[INFO]'
+}
+_SEVERITY_COLOR = {
+    'critical': '#FF0000',
+    'high': '#FF6B35',
+    'medium': '#F7931E',
+    'low': '#36A64F'
+}
+
+# Shared HTTP session so webhook calls reuse pooled keep-alive connections
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(pool_maxsize=4, max_retries=Retry(total=3, backoff_factor=0.5)))
+
 
 class AlertManager:
     """Manages alerts and notifications."""
@@ -24,6 +50,13 @@ class AlertManager:
         self.config = get_config()
         self.secrets = get_secrets()
         self.analytics = get_analytics()
+        
+        # Notifications run in the background so alert checks never wait on SMTP/HTTP
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.performance.max_workers,
+            thread_name_prefix='alert-notify'
+        )
+        atexit.register(self._executor.shutdown, wait=True)
     
     def check_and_create_alerts(self, keyword: str) -> List[Alert]:
         """Check alert conditions and create alerts if necessary."""
@@ -42,30 +75,17 @@ class AlertManager:
                 
                 keyword_id = keyword_obj.id
             
-            for condition in alert_conditions:
-                if condition.triggered:
-                    # Check if similar alert already exists recently
-                    if not self._alert_exists_recently(keyword_id, condition.alert_type, hours=1):
-                        alert_data = {
-                            'keyword_id': keyword_id,
-                            'alert_type': condition.alert_type,
-                            'severity': condition.severity,
-                            'message': condition.message,
-                            'current_value': condition.current_value,
-                            'threshold_value': condition.threshold_value,
-                            'metadata': {
-                                'keyword': keyword,
-                                'detection_time': datetime.utcnow().isoformat()
-                            }
-                        }
-                        
-                        alert = self.db.add_alert(alert_data)
-                        created_alerts.append(alert)
-                        
-                        logger.info(f"Created alert for {keyword}: {condition.message}")
-                        
-                        # Send notifications if enabled
-                        self._send_notifications(alert)
+            # Skip alert types that already fired recently to avoid spam
+            recent_alerts = self._recent_alert_keys([keyword_id], hours=1)
+            
+            alerts_data = self._build_alerts_data(keyword, keyword_id, alert_conditions, recent_alerts)
+            created_alerts = self.db.add_alerts(alerts_data)
+            
+            for alert in created_alerts:
+                logger.info(f"Created alert for {keyword}: {alert.message}")
+                
+                # Send notifications if enabled
+                self._send_notifications(alert, keyword)
             
             return created_alerts
             
@@ -73,35 +93,116 @@ class AlertManager:
             logger.error(f"Error checking alerts for {keyword}: {e}")
             return created_alerts
     
-    def _alert_exists_recently(self, keyword_id: int, alert_type: str, hours: int = 1) -> bool:
-        """Check if similar alert exists recently to avoid spam."""
+    def check_and_create_alerts_bulk(self, keywords: List[str]) -> List[Alert]:
+        """Check alert conditions for several keywords and create alerts in one batch."""
+        created_alerts = []
+        
+        try:
+            # Resolve all keyword ids in one query
+            with self.db.get_session() as session:
+                keyword_ids = dict(
+                    session.query(Keyword.keyword, Keyword.id).filter(
+                        Keyword.keyword.in_(keywords)
+                    ).all()
+                )
+            
+            for keyword in keywords:
+                if keyword not in keyword_ids:
+                    logger.warning(f"Keyword '{keyword}' not found")
+            
+            # One grouped scan for the last-hour summaries of every keyword
+            summaries = self.db.get_sentiment_summaries(list(keyword_ids), hours=1)
+            
+            # Alerts already raised this window, for every keyword at once
+            recent_alerts = self._recent_alert_keys(list(keyword_ids.values()), hours=1)
+            
+            alerts_data = []
+            for keyword, keyword_id in keyword_ids.items():
+                alert_conditions = self.analytics.check_alert_conditions(keyword, summary=summaries[keyword])
+                alerts_data.extend(
+                    self._build_alerts_data(keyword, keyword_id, alert_conditions, recent_alerts)
+                )
+            
+            created_alerts = self.db.add_alerts(alerts_data)
+            
+            keywords_by_id = {keyword_id: keyword for keyword, keyword_id in keyword_ids.items()}
+            for alert in created_alerts:
+                keyword = keywords_by_id[alert.keyword_id]
+                logger.info(f"Created alert for {keyword}: {alert.message}")
+                
+                # Send notifications if enabled
+                self._send_notifications(alert, keyword)
+            
+            return created_alerts
+            
+        except Exception as e:
+            logger.error(f"Error checking alerts for {len(keywords)} keywords: {e}")
+            return created_alerts
+    
+    def _build_alerts_data(self, keyword: str, keyword_id: int, alert_conditions: list,
+                           recent_alerts: Set[Tuple[int, str]]) -> List[Dict[str, Any]]:
+        """Build alert rows for triggered conditions not already alerted recently."""
+        alerts_data = []
+        for condition in alert_conditions:
+            key = (keyword_id, condition.alert_type)
+            if condition.triggered and key not in recent_alerts:
+                recent_alerts.add(key)
+                alerts_data.append({
+                    'keyword_id': keyword_id,
+                    'alert_type': condition.alert_type,
+                    'severity': condition.severity,
+                    'message': condition.message,
+                    'current_value': condition.current_value,
+                    'threshold_value': condition.threshold_value,
+                    'metadata': {
+                        'keyword': keyword,
+                        'detection_time': datetime.utcnow().isoformat()
+                    }
+                })
+        return alerts_data
+    
+    def _recent_alert_keys(self, keyword_ids: List[int], hours: int = 1) -> Set[Tuple[int, str]]:
+        """Get (keyword_id, alert_type) pairs with an active alert in the recent window."""
         try:
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
             
             with self.db.get_session() as session:
-                existing_alert = session.query(Alert).filter(
-                    Alert.keyword_id == keyword_id,
-                    Alert.alert_type == alert_type,
-                    Alert.created_at >= cutoff_time,
+                stmt = lambda_stmt(lambda: select(Alert.keyword_id, Alert.alert_type).where(
+                    Alert.keyword_id.in_(bindparam('keyword_ids', expanding=True)),
+                    Alert.created_at >= bindparam('cutoff'),
                     Alert.is_active == True
-                ).first()
+                ).distinct())
+                
+                rows = session.execute(stmt, {'keyword_ids': keyword_ids, 'cutoff': cutoff_time}).all()
                 
-                return existing_alert is not None
+                return {tuple(row) for row in rows}
                 
         except Exception as e:
             logger.error(f"Error checking existing alerts: {e}")
-            return False
+            return set()
     
-    def _send_notifications(self, alert: Alert) -> None:
-        """Send notifications for an alert."""
+    def _send_notifications(self, alert: Alert, keyword: str) -> None:
+        """Schedule notifications for an alert on the background executor."""
         try:
+            # Hand worker threads a plain snapshot rather than the ORM object
+            snapshot = {
+                'id': alert.id,
+                'keyword': keyword,
+                'alert_type': alert.alert_type,
+                'severity': alert.severity,
+                'message': alert.message,
+                'current_value': alert.current_value,
+                'threshold_value': alert.threshold_value,
+                'created_at': alert.created_at
+            }
+            
             # Email notifications
             if self._email_enabled():
-                self._send_email_notification(alert)
+                self._executor.submit(self._send_email_notification, snapshot)
             
             # Slack notifications
             if self._slack_enabled():
-                self._send_slack_notification(alert)
+                self._executor.submit(self._send_slack_notification, snapshot)
             
         except Exception as e:
             logger.error(f"Error sending notifications: {e}")
@@ -116,35 +217,35 @@ class AlertManager:
         slack_config = self.secrets.get('slack', {})
         return bool(slack_config.get('webhook_url'))
     
-    def _send_email_notification(self, alert: Alert) -> None:
+    def _send_email_notification(self, alert: Dict[str, Any]) -> None:
         """Send email notification for alert."""
         try:
             email_config = self.secrets.get('email', {})
             
             # Create message
-            msg = MimeMultipart()
+            msg = MIMEMultipart()
             msg['From'] = email_config['email']
             msg['To'] = email_config['email']  # Send to self for now
-            msg['Subject'] = f"[Sentiment Monitor] {alert.severity.upper()} Alert - {alert.keyword_rel.keyword}"
+            msg['Subject'] = f"[Sentiment Monitor] {alert['severity'].upper()} Alert - {alert['keyword']}"
             
             # Email body
             body = f"""
 Sentiment Monitor Alert
 
-Keyword: {alert.keyword_rel.keyword}
-Alert Type: {alert.alert_type}
-Severity: {alert.severity}
-Message: {alert.message}
+Keyword: {alert['keyword']}
+Alert Type: {alert['alert_type']}
+Severity: {alert['severity']}
+Message: {alert['message']}
 
-Current Value: {alert.current_value}
-Threshold: {alert.threshold_value}
-Time: {alert.created_at}
+Current Value: {alert['current_value']}
+Threshold: {alert['threshold_value']}
+Time: {alert['created_at']}
 
 ---
 Sentiment Monitor by Kevin Veeder
             """
             
-            msg.attach(MimeText(body, 'plain'))
+            msg.attach(MIMEText(body, 'plain'))
             
             # Send email
             server = smtplib.SMTP(
@@ -158,78 +259,68 @@ Sentiment Monitor by Kevin Veeder
             server.sendmail(email_config['email'], email_config['email'], text)
             server.quit()
             
-            logger.info(f"Email notification sent for alert {alert.id}")
+            logger.info(f"Email notification sent for alert {alert['id']}")
             
         except Exception as e:
             logger.error(f"Error sending email notification: {e}")
     
-    def _send_slack_notification(self, alert: Alert) -> None:
+    def _send_slack_notification(self, alert: Dict[str, Any]) -> None:
         """Send Slack notification for alert."""
         try:
             slack_config = self.secrets.get('slack', {})
             webhook_url = slack_config['webhook_url']
             
-            # Determine prefix based on severity
-            severity_prefix = {
-                'critical': '[CRITICAL]',
-                'high': '[HIGH]',
-                'medium': '[MEDIUM]',
-                'low': '[INFO]'
-            }
-            prefix = severity_prefix.get(alert.severity, '[ALERT]')
-            
-            # Color based on severity
-            color_map = {
-                'critical': '#FF0000',
-                'high': '#FF6B35',
-                'medium': '#F7931E',
-                'low': '#36A64F'
-            }
-            color = color_map.get(alert.severity, '#F7931E')
+            prefix = _SEVERITY_PREFIX.get(alert['severity'], '[ALERT]')
+            color = _SEVERITY_COLOR.get(alert['severity'], '#F7931E')
             
             # Create Slack message
             slack_data = {
-                'text': f'{prefix} Sentiment Alert - {alert.keyword_rel.keyword}',
+                'text': f'{prefix} Sentiment Alert - {alert["keyword"]}',
                 'attachments': [
                     {
                         'color': color,
                         'fields': [
                             {
                                 'title': 'Keyword',
-                                'value': alert.keyword_rel.keyword,
+                                'value': alert['keyword'],
                                 'short': True
                             },
                             {
                                 'title': 'Severity',
-                                'value': alert.severity.upper(),
+                                'value': alert['severity'].upper(),
                                 'short': True
                             },
                             {
                                 'title': 'Alert Type',
-                                'value': alert.alert_type.replace('_', ' ').title(),
+                                'value': alert['alert_type'].replace('_', ' ').title(),
                                 'short': True
                             },
                             {
                                 'title': 'Current Value',
-                                'value': f'{alert.current_value:.3f}',
+                                'value': f'{alert["current_value"]:.3f}',
                                 'short': True
                             },
                             {
                                 'title': 'Message',
-                                'value': alert.message,
+                                'value': alert['message'],
                                 'short': False
                             }
                         ],
                         'footer': 'Sentiment Monitor',
-                        'ts': int(alert.created_at.timestamp())
+                        'ts': int(alert['created_at'].timestamp())
                     }
                 ]
             }
             
-            response = requests.post(webhook_url, json=slack_data, timeout=10)
+            response = _http.post(
+                webhook_url,
+                data=serialization.dumps_bytes(slack_data),
+                headers={'Content-Type': 'application/json'},
+                timeout=10
+            )
             response.raise_for_status()
             
-            logger.info(f"Slack notification sent for alert {alert.id}")
+            logger.info(f"Slack notification sent for alert {alert['id']}")
             
         except Exception as e:
             logger.error(f"Error sending Slack notification: {e}")
@@ -238,17 +329,21 @@ Sentiment Monitor by Kevin Veeder
         """Get active alerts, optionally filtered by keyword."""
         try:
             with self.db.get_session() as session:
-                query = session.query(Alert).filter(
+                stmt = lambda_stmt(lambda: select(Alert).options(
+                    joinedload(Alert.keyword_rel)
+                ).where(
                     Alert.is_active == True,
                     Alert.is_acknowledged == False
-                )
+                ).order_by(Alert.created_at.desc()))
+                params = {}
                 
                 if keyword:
                     keyword_obj = session.query(Keyword).filter_by(keyword=keyword).first()
                     if keyword_obj:
-                        query = query.filter(Alert.keyword_id == keyword_obj.id)
+                        stmt += lambda s: s.where(Alert.keyword_id == bindparam('keyword_id'))
+                        params['keyword_id'] = keyword_obj.id
                 
-                return query.order_by(Alert.created_at.desc()).all()
+                return session.execute(stmt, params).scalars().all()
                 
         except Exception as e:
             logger.error(f"Error getting active alerts: {e}")
@@ -294,13 +389,13 @@ Sentiment Monitor by Kevin Veeder
             cutoff_date = datetime.utcnow() - timedelta(days=days)
             
             with self.db.get_session() as session:
-                old_alerts = session.query(Alert).filter(
-                    Alert.is_active == False,
-                    Alert.resolved_at < cutoff_date
+                result = session.execute(
+                    delete(Alert).where(
+                        Alert.is_active == False,
+                        Alert.resolved_at < cutoff_date
+                    )
                 )
-                
-                count = old_alerts.count()
-                old_alerts.delete()
+                count = result.rowcount
                 session.commit()
                 
                 logger.info(f"Cleaned up {count} old alerts")
@@ -314,30 +409,27 @@ Sentiment Monitor by Kevin Veeder
         """Get summary of alert statistics."""
         try:
             with self.db.get_session() as session:
-                # Count alerts by severity
-                severity_counts = {}
-                for severity in ['critical', 'high', 'medium', 'low']:
-                    count = session.query(Alert).filter(
-                        Alert.severity == severity,
-                        Alert.is_active == True
-                    ).count()
-                    severity_counts[severity] = count
+                last_24h = datetime.utcnow() - timedelta(hours=24)
+                
+                # Single pass: active and recent counts per (type, severity) group
+                stmt = lambda_stmt(lambda: select(
+                    Alert.alert_type,
+                    Alert.severity,
+                    func.sum(case((Alert.is_active == True, 1), else_=0)),
+                    func.sum(case((Alert.created_at >= bindparam('since'), 1), else_=0))
+                ).group_by(Alert.alert_type, Alert.severity))
                 
-                # Count alerts by type
+                rows = session.execute(stmt, {'since': last_24h}).all()
+                
+                severity_counts = {severity: 0 for severity in ['critical', 'high', 'medium', 'low']}
                 type_counts = {}
-                alert_types = session.query(Alert.alert_type).distinct().all()
-                for (alert_type,) in alert_types:
-                    count = session.query(Alert).filter(
-                        Alert.alert_type == alert_type,
-                        Alert.is_active == True
-                    ).count()
-                    type_counts[alert_type] = count
+                recent_count = 0
                 
-                # Recent activity
-                last_24h = datetime.utcnow() - timedelta(hours=24)
-                recent_count = session.query(Alert).filter(
-                    Alert.created_at >= last_24h
-                ).count()
+                for alert_type, severity, active_count, group_recent in rows:
+                    if severity in severity_counts:
+                        severity_counts[severity] += active_count
+                    type_counts[alert_type] = type_counts.get(alert_type, 0) + active_count
+                    recent_count += group_recent
                 
                 return {
                     'total_active': sum(severity_counts.values()),
@@ -352,9 +444,12 @@ Sentiment Monitor by Kevin Veeder
             return {}
 
 
-# Global alert manager instance
-alert_manager = AlertManager()
+# Global alert manager instance, created on first use
+_alert_manager: Optional[AlertManager] = None
 
 def get_alert_manager() -> AlertManager:
     """Get the global alert manager instance."""
-    return alert_manager
\ No newline at end of file
+    global _alert_manager
+    if _alert_manager is None:
+        _alert_manager = AlertManager()
+    return _alert_manager
\ No newline at end of file
@@ -1,47 +1,62 @@
 """Configuration management utilities."""
 
 import os
+import shutil
+import tempfile
+import time
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
-class DatabaseConfig(BaseModel):
+# Minimum time between checks of the config file's mtime in get_config()
+CONFIG_CHECK_INTERVAL_SECONDS = 5.0
+
+
+class BaseConfigModel(BaseModel):
+    """Base for config sections: immutable once loaded, unknown keys ignored."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+
+class DatabaseConfig(BaseConfigModel):
     path: str
     backup_interval_hours: int = 24
     retention_days: int = 30
 
 
-class CollectionConfig(BaseModel):
+class CollectionConfig(BaseConfigModel):
     polling_interval: int = 3
     max_posts_per_poll: int = 50
     platforms: Dict[str, Any] = {}
 
 
-class SentimentConfig(BaseModel):
+class SentimentConfig(BaseConfigModel):
     models: Dict[str, Any] = {}
     confidence_threshold: float = 0.7
 
 
-class AlertsConfig(BaseModel):
+class AlertsConfig(BaseConfigModel):
     enabled: bool = True
     thresholds: Dict[str, float] = {}
     volume_threshold: int = 10
     rapid_change_threshold: float = 0.3
 
 
-class DashboardConfig(BaseModel):
+class DashboardConfig(BaseConfigModel):
     title: str = "Real-Time Sentiment Monitor"
     refresh_interval_seconds: int = 30
     max_recent_posts: int = 20
     charts: Dict[str, Any] = {}
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(BaseConfigModel):
     level: str = "INFO"
     file_path: str = "logs/sentiment_monitor.log"
     max_file_size_mb: int = 10
@@ -50,14 +65,14 @@ class LoggingConfig(BaseModel):
     file_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
 
 
-class PerformanceConfig(BaseModel):
+class PerformanceConfig(BaseConfigModel):
     max_workers: int = 4
     request_timeout: int = 30
     max_retries: int = 3
     backoff_factor: float = 1.0
 
 
-class TextProcessingConfig(BaseModel):
+class TextProcessingConfig(BaseConfigModel):
     max_text_length: int = 1000
     detect_language: bool = True
     target_language: str = "en"
@@ -67,7 +82,7 @@ class TextProcessingConfig(BaseModel):
     handle_emojis: bool = True
 
 
-class Config(BaseModel):
+class Config(BaseConfigModel):
     database: DatabaseConfig
     collection: CollectionConfig
     sentiment: SentimentConfig
@@ -87,16 +102,21 @@ class ConfigManager:
         self.config_file = self.config_dir / "config.yaml"
         self.secrets_file = self.config_dir / "secrets.yaml"
         self._config: Optional[Config] = None
+        self._config_mtime: Optional[float] = None
+        self._config_checked_at = 0.0
         self._secrets: Optional[Dict[str, Any]] = None
     
     def load_config(self) -> Config:
         """Load and validate configuration from YAML file."""
         if self._config is None:
             try:
+                config_mtime = os.stat(self.config_file).st_mtime
                 with open(self.config_file, 'r') as f:
-                    config_data = yaml.safe_load(f)
+                    config_data = yaml.load(f, Loader=_YAML_LOADER)
                 
                 self._config = Config(**config_data)
+                self._config_mtime = config_mtime
+                self._config_checked_at = time.monotonic()
                 logger.info(f"Configuration loaded from {self.config_file}")
                 
             except FileNotFoundError:
@@ -117,7 +137,7 @@ class ConfigManager:
             try:
                 if self.secrets_file.exists():
                     with open(self.secrets_file, 'r') as f:
-                        self._secrets = yaml.safe_load(f) or {}
+                        self._secrets = yaml.load(f, Loader=_YAML_LOADER) or {}
                     logger.info(f"Secrets loaded from {self.secrets_file}")
                 else:
                     logger.warning(f"Secrets file not found: {self.secrets_file}")
@@ -130,11 +150,24 @@ class ConfigManager:
         return self._secrets
     
     def get_config(self) -> Config:
-        """Get loaded configuration."""
+        """Get loaded configuration, reloading it if the file changed on disk."""
+        # Hot path for every component, so stat the file at most once per interval
+        now = time.monotonic()
+        if self._config is not None and now - self._config_checked_at >= CONFIG_CHECK_INTERVAL_SECONDS:
+            self._config_checked_at = now
+            if self._config_changed():
+                self._config = None
         if self._config is None:
             return self.load_config()
         return self._config
     
+    def _config_changed(self) -> bool:
+        """Check whether the config file was modified since it was loaded."""
+        try:
+            return os.stat(self.config_file).st_mtime != self._config_mtime
+        except OSError:
+            return False
+    
     def get_secrets(self) -> Dict[str, Any]:
         """Get loaded secrets."""
         if self._secrets is None:
@@ -154,17 +187,32 @@ class ConfigManager:
     def update_keywords(self, keywords: list) -> None:
         """Update monitored keywords in configuration."""
         config = self.get_config()
-        config.keywords['default'] = keywords
         
-        # Save updated config back to file
-        self._save_config(config)
+        # Build a new config rather than mutating the one shared with every caller
+        updated = config.model_copy(update={'keywords': {**config.keywords, 'default': list(keywords)}})
+        
+        # Save updated config back to file, then serve it in place of the old one
+        self._save_config(updated)
+        self._config = updated
     
     def _save_config(self, config: Config) -> None:
         """Save configuration back to YAML file."""
         try:
             config_dict = config.model_dump()
-            with open(self.config_file, 'w') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            
+            # Write to a temp file and swap it in so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    yaml.dump(config_dict, f, Dumper=_YAML_DUMPER, default_flow_style=False, indent=2)
+                if self.config_file.exists():
+                    shutil.copymode(self.config_file, tmp_path)
+                os.replace(tmp_path, self.config_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            
+            self._config_mtime = os.stat(self.config_file).st_mtime
             logger.info("Configuration saved successfully")
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
@@ -174,6 +222,8 @@ class ConfigManager:
 # Global config manager instance
 config_manager = ConfigManager()
 
+# A reload only reaches callers that fetch the config again; components that kept
+# the Config from their constructor go on using the old one until rebuilt
 def get_config() -> Config:
     """Get the global configuration instance."""
     return config_manager.get_config()
@@ -0,0 +1,46 @@
+"""JSON serialization helpers backed by orjson when available."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """Convert NumPy scalars and arrays, which neither backend encodes on its own."""
+    # Duck-typed so this module does not need to import NumPy
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RawJSON(str):
+    """JSON text that is already serialized and should be stored as-is."""
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize a value to UTF-8 encoded JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, default=_default).encode('utf-8')
+
+
+def dumps(value: Any) -> str:
+    """Serialize a value to a JSON string."""
+    # Pre-serialized payloads skip the decode/encode round trip
+    if isinstance(value, RawJSON):
+        return str(value)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(value, default=_default)
+
+
+def loads(value: Any) -> Any:
+    """Deserialize JSON from a string or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
@@ -1,27 +1,35 @@
 """Pytest configuration and fixtures."""
 
+import copy
 import pytest
-import tempfile
-import os
-from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
-# Add src to path
-import sys
-src_dir = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_dir))
+# Captured once so every fixture shares a timestamp; kept near the real clock because
+# database tests compare stored times against utcnow() cutoffs
+_NOW = datetime.utcnow()
 
-from sentiment_monitor.storage.database import DatabaseManager
-from sentiment_monitor.storage.models import Base, Keyword, Platform, Post, SentimentScore
-from sentiment_monitor.utils.config import ConfigManager
-from sentiment_monitor.analysis.sentiment_analyzer import SentimentAnalyzer
+
+def _use_config(monkeypatch, config):
+    """Serve a config to every consumer, including modules that imported get_config by name."""
+    from sentiment_monitor.utils import config as config_module
+    
+    # Consumers hold their own reference to get_config, which delegates to the manager
+    monkeypatch.setattr(config_module, 'get_config', lambda: config)
+    monkeypatch.setattr(config_module.config_manager, 'get_config', lambda: config)
+
+
+def _override(config, section, **values):
+    """Return a copy of the config with some values of one section replaced."""
+    return config.model_copy(update={section: getattr(config, section).model_copy(update=values)})
 
 
 @pytest.fixture(scope="session")
 def test_config():
-    """Create test configuration."""
-    return {
+    """Create test configuration as the frozen models the application loads."""
+    from sentiment_monitor.utils.config import Config
+    
+    return Config(**{
         'database': {
             'path': ':memory:',  # Use in-memory database for tests
             'backup_interval_hours': 24,
@@ -31,8 +39,8 @@ def test_config():
             'polling_interval': 5,
             'max_posts_per_poll': 10,
             'platforms': {
-                'reddit': {'enabled': True, 'subreddits': ['test']},
-                'hackernews': {'enabled': True}
+                'reddit': {'enabled': False, 'subreddits': ['test']},
+                'hackernews': {'enabled': False}
             }
         },
         'sentiment': {
@@ -48,7 +56,7 @@ def test_config():
             'case_sensitive': False
         },
         'alerts': {
-            'enabled': True,
+            'enabled': False,  # Off unless a test opts in via the enable_alerts fixture
             'thresholds': {
                 'very_negative': -0.8,
                 'negative': -0.3,
@@ -60,7 +68,7 @@ def test_config():
         },
         'dashboard': {
             'title': 'Test Sentiment Monitor',
-            'refresh_interval_seconds': 30,
+            'refresh_interval_seconds': 0,
             'max_recent_posts': 10
         },
         'logging': {
@@ -81,75 +89,111 @@ def test_config():
             'remove_hashtags': False,
             'handle_emojis': True
         }
-    }
+    })
 
 
 @pytest.fixture
-def test_db(test_config):
-    """Create test database."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
+def enable_alerts(monkeypatch, test_config):
+    """Patch in a copy of the test configuration with alerting turned on for one test."""
+    config = _override(test_config, 'alerts', enabled=True)
+    _use_config(monkeypatch, config)
+    return config
+
+
+@pytest.fixture(scope="session")
+def session_db(test_config):
+    """Create the in-memory test database schema once per session."""
+    # Imported lazily so collection doesn't pay for SQLAlchemy unless a test needs the DB
+    from sqlalchemy import event
+    from sentiment_monitor.storage.database import DatabaseManager
     
-    try:
-        db = DatabaseManager(db_path)
-        yield db
-    finally:
-        # Cleanup
-        try:
-            os.unlink(db_path)
-        except:
-            pass
+    db = DatabaseManager(test_config.database.path)
+    
+    # pysqlite's implicit transactions break SAVEPOINT; let SQLAlchemy emit BEGIN itself
+    with db.engine.connect() as connection:
+        connection.connection.driver_connection.isolation_level = None
+    event.listen(db.engine, 'begin', lambda connection: connection.exec_driver_sql('BEGIN'))
+    
+    yield db
+    db.engine.dispose()
+
+
+@pytest.fixture
+def test_db(session_db):
+    """Provide the session database wrapped in a transaction rolled back after each test."""
+    from sqlalchemy.orm import sessionmaker
+    
+    connection = session_db.engine.connect()
+    transaction = connection.begin()
+    
+    # Commits inside DatabaseManager only release a SAVEPOINT of the outer transaction
+    original_factory = session_db.SessionLocal
+    session_db.SessionLocal = sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode='create_savepoint'
+    )
+    
+    yield session_db
+    
+    session_db.SessionLocal = original_factory
+    transaction.rollback()
+    connection.close()
+
+
+# Templates built once at import; tests mutate their copies, never these
+_SAMPLE_POSTS = (
+    {
+        'external_id': 'test_post_1',
+        'platform_id': 1,
+        'keyword_id': 1,
+        'title': 'Great news about test keyword',
+        'content': 'This is a very positive post about the test keyword. Everything is amazing!',
+        'url': 'https://example.com/post1',
+        'author': 'test_user_1',
+        'posted_at': _NOW - timedelta(hours=1),
+        'score': 100,
+        'comment_count': 50,
+        'metadata': {'platform': 'test', 'subreddit': 'test'}
+    },
+    {
+        'external_id': 'test_post_2',
+        'platform_id': 1,
+        'keyword_id': 1,
+        'title': 'Bad news about test keyword',
+        'content': 'This is a negative post about the test keyword. Everything is terrible!',
+        'url': 'https://example.com/post2',
+        'author': 'test_user_2',
+        'posted_at': _NOW - timedelta(hours=2),
+        'score': 10,
+        'comment_count': 5,
+        'metadata': {'platform': 'test', 'subreddit': 'test'}
+    },
+    {
+        'external_id': 'test_post_3',
+        'platform_id': 1,
+        'keyword_id': 1,
+        'title': 'Neutral post about test keyword',
+        'content': 'This is a neutral post about the test keyword. Nothing special.',
+        'url': 'https://example.com/post3',
+        'author': 'test_user_3',
+        'posted_at': _NOW - timedelta(hours=3),
+        'score': 25,
+        'comment_count': 10,
+        'metadata': {'platform': 'test', 'subreddit': 'test'}
+    }
+)
 
 
 @pytest.fixture
 def sample_posts():
     """Create sample post data for testing."""
-    return [
-        {
-            'external_id': 'test_post_1',
-            'platform_id': 1,
-            'keyword_id': 1,
-            'title': 'Great news about test keyword',
-            'content': 'This is a very positive post about the test keyword. Everything is amazing!',
-            'url': 'https://example.com/post1',
-            'author': 'test_user_1',
-            'posted_at': datetime.utcnow() - timedelta(hours=1),
-            'score': 100,
-            'comment_count': 50,
-            'metadata': {'platform': 'test', 'subreddit': 'test'}
-        },
-        {
-            'external_id': 'test_post_2',
-            'platform_id': 1,
-            'keyword_id': 1,
-            'title': 'Bad news about test keyword',
-            'content': 'This is a negative post about the test keyword. Everything is terrible!',
-            'url': 'https://example.com/post2',
-            'author': 'test_user_2',
-            'posted_at': datetime.utcnow() - timedelta(hours=2),
-            'score': 10,
-            'comment_count': 5,
-            'metadata': {'platform': 'test', 'subreddit': 'test'}
-        },
-        {
-            'external_id': 'test_post_3',
-            'platform_id': 1,
-            'keyword_id': 1,
-            'title': 'Neutral post about test keyword',
-            'content': 'This is a neutral post about the test keyword. Nothing special.',
-            'url': 'https://example.com/post3',
-            'author': 'test_user_3',
-            'posted_at': datetime.utcnow() - timedelta(hours=3),
-            'score': 25,
-            'comment_count': 10,
-            'metadata': {'platform': 'test', 'subreddit': 'test'}
-        }
-    ]
+    return [dict(post) for post in _SAMPLE_POSTS]
 
 
-@pytest.fixture
-def mock_reddit_submission():
-    """Mock Reddit submission object."""
+@pytest.fixture(scope="session")
+def reddit_submission_prototype():
+    """Build the mock Reddit submission once per session."""
     submission = Mock()
     submission.id = 'test_submission'
     submission.title = 'Test Reddit Post'
@@ -157,7 +201,7 @@ def mock_reddit_submission():
     submission.url = 'https://reddit.com/r/test/comments/test'
     submission.author = Mock()
     submission.author.__str__ = Mock(return_value='test_author')
-    submission.created_utc = datetime.utcnow().timestamp()
+    submission.created_utc = _NOW.timestamp()
     submission.score = 100
     submission.num_comments = 50
     submission.subreddit = Mock()
@@ -175,6 +219,13 @@ def mock_reddit_submission():
     return submission
 
 
+@pytest.fixture
+def mock_reddit_submission(reddit_submission_prototype):
+    """Mock Reddit submission object."""
+    # Deep copy so nested mocks (author, comments) don't share call records between tests
+    return copy.deepcopy(reddit_submission_prototype)
+
+
 @pytest.fixture
 def mock_hn_story():
     """Mock Hacker News story object."""
@@ -184,7 +235,7 @@ def mock_hn_story():
         'text': 'This is a test story content',
         'url': 'https://example.com/test',
         'by': 'test_author',
-        'time': int(datetime.utcnow().timestamp()),
+        'time': int(_NOW.timestamp()),
         'score': 100,
         'descendants': 50,
         'type': 'story',
@@ -192,14 +243,42 @@ def mock_hn_story():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sentiment_analyzer():
     """Create sentiment analyzer for testing."""
+    from sentiment_monitor.analysis.sentiment_analyzer import SentimentAnalyzer
+    
     with patch('sentiment_monitor.analysis.sentiment_analyzer.HF_AVAILABLE', False):
         analyzer = SentimentAnalyzer()
     return analyzer
 
 
+@pytest.fixture(scope="session")
+def text_preprocessor(test_config):
+    """Create one text preprocessor, bound to the test configuration, for the session."""
+    from sentiment_monitor.analysis.sentiment_analyzer import TextPreprocessor
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('sentiment_monitor.analysis.sentiment_analyzer.get_config', lambda: test_config)
+        return TextPreprocessor()
+
+
+@pytest.fixture(scope="session")
+def vader_analyzer():
+    """Create one VADER analyzer so the lexicon is loaded once per session."""
+    from sentiment_monitor.analysis.sentiment_analyzer import VADERAnalyzer
+    
+    return VADERAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def text_analyzer():
+    """Create one text analyzer for the session."""
+    from sentiment_monitor.analysis.text_utils import TextAnalyzer
+    
+    return TextAnalyzer()
+
+
 @pytest.fixture
 def mock_requests_response():
     """Mock requests response."""
@@ -214,14 +293,5 @@ def mock_requests_response():
 def setup_test_environment(monkeypatch, test_config):
     """Setup test environment for all tests."""
     # Mock configuration
-    with patch('sentiment_monitor.utils.config.get_config') as mock_config:
-        mock_config.return_value = Mock(**test_config)
-        yield
-
-
-def pytest_configure(config):
-    """Configure pytest."""
-    # Suppress warnings
-    import warnings
-    warnings.filterwarnings("ignore", category=DeprecationWarning)
-    warnings.filterwarnings("ignore", category=PendingDeprecationWarning)
\ No newline at end of file
+    _use_config(monkeypatch, test_config)
+    yield
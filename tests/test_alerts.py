@@ -0,0 +1,233 @@
+"""Test alert creation, deduplication, notifications and housekeeping."""
+
+import time
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from sqlalchemy import select
+
+from sentiment_monitor.analysis.analytics import AlertCondition
+from sentiment_monitor.storage.models import Alert
+from sentiment_monitor.utils.alerts import AlertManager
+
+
+def _condition(keyword, alert_type, severity='high', triggered=True):
+    """Build an alert condition as returned by SentimentAnalytics.check_alert_conditions."""
+    return AlertCondition(
+        keyword=keyword,
+        alert_type=alert_type,
+        severity=severity,
+        message=f'{alert_type} for {keyword}',
+        current_value=-0.9,
+        threshold_value=-0.8,
+        triggered=triggered
+    )
+
+
+def _alert_row(keyword_id, alert_type, severity='high', **overrides):
+    """Build an alert row dict for DatabaseManager.add_alerts."""
+    row = {
+        'keyword_id': keyword_id,
+        'alert_type': alert_type,
+        'severity': severity,
+        'message': f'{alert_type} alert',
+        'current_value': -0.9,
+        'threshold_value': -0.8
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def alert_manager(monkeypatch, test_db, test_config):
+    """Construct an AlertManager backed by the test database and a mock analytics engine."""
+    monkeypatch.setattr('sentiment_monitor.utils.alerts.get_db', lambda: test_db)
+    monkeypatch.setattr('sentiment_monitor.utils.alerts.get_config', lambda: test_config)
+    monkeypatch.setattr('sentiment_monitor.utils.alerts.get_secrets', dict)
+    monkeypatch.setattr('sentiment_monitor.utils.alerts.get_analytics', Mock)
+    
+    manager = AlertManager()
+    executor = manager._executor
+    yield manager
+    executor.shutdown(wait=True)
+
+
+class TestAlertCreation:
+    """Test alert creation and deduplication."""
+    
+    def test_recent_alert_is_not_repeated(self, alert_manager, test_db):
+        """Test that an alert type raised in the last hour is skipped."""
+        keyword = test_db.add_keyword('alert_keyword')
+        test_db.add_alerts([_alert_row(keyword.id, 'very_negative_sentiment')])
+        
+        alert_manager.analytics.check_alert_conditions.return_value = [
+            _condition('alert_keyword', 'very_negative_sentiment'),
+            _condition('alert_keyword', 'high_volume', severity='medium')
+        ]
+        
+        assert alert_manager._recent_alert_keys([keyword.id]) == {(keyword.id, 'very_negative_sentiment')}
+        
+        created = alert_manager.check_and_create_alerts('alert_keyword')
+        
+        assert [alert.alert_type for alert in created] == ['high_volume']
+    
+    def test_untriggered_conditions_are_ignored(self, alert_manager, test_db):
+        """Test that conditions which did not trigger create no alerts."""
+        test_db.add_keyword('quiet_keyword')
+        alert_manager.analytics.check_alert_conditions.return_value = [
+            _condition('quiet_keyword', 'high_volume', triggered=False)
+        ]
+        
+        assert alert_manager.check_and_create_alerts('quiet_keyword') == []
+    
+    def test_bulk_creates_alerts_per_keyword(self, alert_manager, test_db):
+        """Test that the bulk path creates alerts for every known keyword in one batch."""
+        first = test_db.add_keyword('bulk_one')
+        second = test_db.add_keyword('bulk_two')
+        test_db.add_alerts([_alert_row(second.id, 'high_volume')])
+        
+        alert_manager.analytics.check_alert_conditions.side_effect = lambda keyword, summary=None: [
+            _condition(keyword, 'high_volume', severity='medium')
+        ]
+        
+        created = alert_manager.check_and_create_alerts_bulk(['bulk_one', 'bulk_two', 'missing_keyword'])
+        
+        # bulk_two already has a recent high_volume alert and the unknown keyword is skipped
+        assert [(alert.keyword_id, alert.alert_type) for alert in created] == [(first.id, 'high_volume')]
+        
+        # Each known keyword is checked against its own pre-fetched summary
+        checked = {call.args[0] for call in alert_manager.analytics.check_alert_conditions.call_args_list}
+        assert checked == {'bulk_one', 'bulk_two'}
+        for call in alert_manager.analytics.check_alert_conditions.call_args_list:
+            assert call.kwargs['summary']['total_posts'] == 0
+
+
+class TestAlertHousekeeping:
+    """Test alert summaries and cleanup."""
+    
+    def test_alert_summary_groups_active_alerts(self, alert_manager, test_db):
+        """Test that the summary counts active alerts by severity and type."""
+        keyword = test_db.add_keyword('summary_keyword')
+        test_db.add_alerts([
+            _alert_row(keyword.id, 'very_negative_sentiment', severity='critical'),
+            _alert_row(keyword.id, 'very_negative_sentiment', severity='high'),
+            _alert_row(keyword.id, 'high_volume', severity='medium'),
+            _alert_row(keyword.id, 'high_volume', severity='medium', is_active=False)
+        ])
+        
+        summary = alert_manager.get_alert_summary()
+        
+        assert summary['total_active'] == 3
+        assert summary['by_severity'] == {'critical': 1, 'high': 1, 'medium': 1, 'low': 0}
+        assert summary['by_type'] == {'very_negative_sentiment': 2, 'high_volume': 1}
+        assert summary['recent_24h'] == 4
+    
+    def test_cleanup_old_alerts_returns_rowcount(self, alert_manager, test_db):
+        """Test that only old resolved alerts are deleted and the count is returned."""
+        keyword = test_db.add_keyword('cleanup_keyword')
+        old = datetime.utcnow() - timedelta(days=40)
+        recent = datetime.utcnow() - timedelta(days=1)
+        test_db.add_alerts([
+            _alert_row(keyword.id, 'high_volume', is_active=False, resolved_at=old),
+            _alert_row(keyword.id, 'high_volume', is_active=False, resolved_at=old),
+            _alert_row(keyword.id, 'high_volume', is_active=False, resolved_at=recent),
+            _alert_row(keyword.id, 'very_negative_sentiment')
+        ])
+        
+        assert alert_manager.cleanup_old_alerts(days=30) == 2
+        
+        with test_db.get_session() as session:
+            remaining = session.scalars(select(Alert.resolved_at).where(Alert.keyword_id == keyword.id)).all()
+        
+        assert len(remaining) == 2
+        assert None in remaining
+
+
+class _RecordingExecutor:
+    """Executor stub that records submissions and runs nothing."""
+    
+    def __init__(self):
+        self.submitted = []
+    
+    def submit(self, fn, *args):
+        self.submitted.append((fn.__name__, args))
+
+
+_SECRETS = {
+    'email': {'email': 'alerts@example.com', 'password': 'secret'},
+    'slack': {'webhook_url': 'https://hooks.slack.com/services/test'}
+}
+
+
+class TestAlertNotifications:
+    """Test that notifications are dispatched to the background executor."""
+    
+    def test_notifications_submitted_with_snapshot(self, alert_manager, test_db, monkeypatch):
+        """Test that email and Slack sends are submitted with a plain snapshot of the alert."""
+        executor = _RecordingExecutor()
+        monkeypatch.setattr(alert_manager, '_executor', executor)
+        monkeypatch.setattr(alert_manager, 'secrets', _SECRETS)
+        
+        test_db.add_keyword('notify_keyword')
+        alert_manager.analytics.check_alert_conditions.return_value = [
+            _condition('notify_keyword', 'very_negative_sentiment', severity='critical')
+        ]
+        
+        [alert] = alert_manager.check_and_create_alerts('notify_keyword')
+        
+        assert [name for name, _ in executor.submitted] == ['_send_email_notification', '_send_slack_notification']
+        expected = {
+            'id': alert.id,
+            'keyword': 'notify_keyword',
+            'alert_type': 'very_negative_sentiment',
+            'severity': 'critical',
+            'message': 'very_negative_sentiment for notify_keyword',
+            'current_value': -0.9,
+            'threshold_value': -0.8,
+            'created_at': alert.created_at
+        }
+        for _, (snapshot,) in executor.submitted:
+            assert snapshot == expected
+    
+    def test_notifications_skipped_without_secrets(self, alert_manager, test_db, monkeypatch):
+        """Test that nothing is submitted when no notification channel is configured."""
+        executor = _RecordingExecutor()
+        monkeypatch.setattr(alert_manager, '_executor', executor)
+        
+        test_db.add_keyword('silent_keyword')
+        alert_manager.analytics.check_alert_conditions.return_value = [
+            _condition('silent_keyword', 'high_volume')
+        ]
+        
+        assert len(alert_manager.check_and_create_alerts('silent_keyword')) == 1
+        assert executor.submitted == []
+    
+    def test_exit_shutdown_drains_pending_sends(self, monkeypatch, test_db, test_config):
+        """Test that the atexit hook waits for queued notifications to finish."""
+        registered = []
+        monkeypatch.setattr('sentiment_monitor.utils.alerts.atexit.register',
+                            lambda fn, *args, **kwargs: registered.append((fn, args, kwargs)))
+        monkeypatch.setattr('sentiment_monitor.utils.alerts.get_db', lambda: test_db)
+        monkeypatch.setattr('sentiment_monitor.utils.alerts.get_config', lambda: test_config)
+        monkeypatch.setattr('sentiment_monitor.utils.alerts.get_secrets', lambda: _SECRETS)
+        monkeypatch.setattr('sentiment_monitor.utils.alerts.get_analytics', Mock)
+        
+        manager = AlertManager()
+        
+        sent = []
+        
+        def slow_send(alert):
+            time.sleep(0.05)
+            sent.append(alert['id'])
+        
+        monkeypatch.setattr(manager, '_send_email_notification', slow_send)
+        monkeypatch.setattr(manager, '_send_slack_notification', slow_send)
+        
+        alert = Mock(id=1, created_at=datetime.utcnow())
+        manager._send_notifications(alert, 'exit_keyword')
+        
+        [(shutdown, args, kwargs)] = registered
+        shutdown(*args, **kwargs)
+        
+        assert sent == [1, 1]
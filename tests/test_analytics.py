@@ -1,8 +1,10 @@
 """Test analytics and insights functionality."""
 
+import re
 import pytest
 import numpy as np
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from sentiment_monitor.analysis.analytics import (
@@ -10,31 +12,65 @@ from sentiment_monitor.analysis.analytics import (
 )
 
 
+# Analytics runs against mocked DB rows, so a fixed clock keeps trend data deterministic
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Fixed-seed random data drawn once at import, so tests are fast and reproducible
+_RNG = np.random.default_rng(0xC0FFEE)
+_NORMAL_DATA = _RNG.normal(0, 0.05, size=20)
+_VOLUME_COUNTS = _RNG.integers(1, 6, size=20)
+_VOLUME_NOISE = _RNG.normal(0, 0.1, size=_VOLUME_COUNTS.sum())
+
+
+def _make_trends(timestamps, sentiments):
+    """Zip timestamp and sentiment arrays into the trend dicts returned by the DB layer."""
+    return [
+        {'timestamp': timestamp, 'sentiment': sentiment, 'confidence': 0.8, 'model': 'vader'}
+        for timestamp, sentiment in zip(timestamps, sentiments)
+    ]
+
+
+# Built once at import; analytics copies rows into a DataFrame so tests never mutate them
+_HOURS_AGO = np.arange(10, 0, -1)  # 10 data points
+_TRENDS_DATA = _make_trends(
+    _NOW - _HOURS_AGO * timedelta(hours=1),
+    0.1 + _HOURS_AGO * 0.1  # Increasing trend
+)
+
+
+# Each recommendation concern is checked separately so a missing one still fails
+_LOW_VOLUME_PATTERN = re.compile(r'low|volume')
+_NEGATIVE_TREND_PATTERN = re.compile(r'negative|declining')
+_CRITICAL_ALERT_PATTERN = re.compile(r'critical|immediate')
+
+
+@pytest.fixture(scope="class")
+def analytics():
+    """Construct one SentimentAnalytics per test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('sentiment_monitor.analysis.analytics.get_db', Mock)
+        mp.setattr('sentiment_monitor.analysis.analytics.get_config', Mock)
+        return SentimentAnalytics()
+
+
+@pytest.fixture(autouse=True)
+def patched_analytics(monkeypatch, analytics):
+    """Point the shared analytics instance at fresh mock DB and config objects."""
+    mocks = SimpleNamespace(db=Mock(), config=Mock())
+    monkeypatch.setattr(analytics, 'db', mocks.db)
+    monkeypatch.setattr(analytics, 'config', mocks.config)
+    return mocks
+
+
 class TestSentimentAnalytics:
     """Test sentiment analytics functionality."""
     
-    def setup_method(self):
-        """Setup test data."""
-        self.mock_trends_data = [
-            {
-                'timestamp': datetime.utcnow() - timedelta(hours=i),
-                'sentiment': 0.1 + (i * 0.1),  # Increasing trend
-                'confidence': 0.8,
-                'model': 'vader'
-            }
-            for i in range(10, 0, -1)  # 10 data points
-        ]
-    
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_analyze_trends_increasing(self, mock_config, mock_db):
+    def test_analyze_trends_increasing(self, analytics, patched_analytics):
         """Test trend analysis with increasing sentiment."""
         # Setup mocks
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
-        mock_db_instance.get_sentiment_trends.return_value = self.mock_trends_data
+        mock_db_instance = patched_analytics.db
+        mock_db_instance.get_sentiment_trends.return_value = _TRENDS_DATA
         
-        analytics = SentimentAnalytics()
         result = analytics.analyze_trends('test_keyword', hours=24)
         
         assert isinstance(result, TrendAnalysis)
@@ -44,55 +80,39 @@ class TestSentimentAnalytics:
         assert result.sentiment_change > 0
         assert result.data_points == 10
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_analyze_trends_decreasing(self, mock_config, mock_db):
+    def test_analyze_trends_decreasing(self, analytics, patched_analytics):
         """Test trend analysis with decreasing sentiment."""
         # Create decreasing trend data
-        decreasing_trends = [
-            {
-                'timestamp': datetime.utcnow() - timedelta(hours=i),
-                'sentiment': 1.0 - (i * 0.1),  # Decreasing trend
-                'confidence': 0.8,
-                'model': 'vader'
-            }
-            for i in range(10, 0, -1)
-        ]
+        hours_ago = np.arange(10, 0, -1)
+        decreasing_trends = _make_trends(
+            _NOW - hours_ago * timedelta(hours=1),
+            1.0 - hours_ago * 0.1  # Decreasing trend
+        )
         
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
+        mock_db_instance = patched_analytics.db
         mock_db_instance.get_sentiment_trends.return_value = decreasing_trends
         
-        analytics = SentimentAnalytics()
         result = analytics.analyze_trends('test_keyword', hours=24)
         
         assert result.trend_direction == 'declining'
         assert result.sentiment_change < 0
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_analyze_trends_insufficient_data(self, mock_config, mock_db):
+    def test_analyze_trends_insufficient_data(self, analytics, patched_analytics):
         """Test trend analysis with insufficient data."""
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
+        mock_db_instance = patched_analytics.db
         mock_db_instance.get_sentiment_trends.return_value = []  # No data
         
-        analytics = SentimentAnalytics()
         result = analytics.analyze_trends('test_keyword', hours=24)
         
         assert result.trend_direction == 'insufficient_data'
         assert result.data_points == 0
         assert result.trend_strength == 0.0
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_calculate_momentum(self, mock_config, mock_db):
+    def test_calculate_momentum(self, analytics, patched_analytics):
         """Test momentum calculation."""
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
-        mock_db_instance.get_sentiment_trends.return_value = self.mock_trends_data
+        mock_db_instance = patched_analytics.db
+        mock_db_instance.get_sentiment_trends.return_value = _TRENDS_DATA
         
-        analytics = SentimentAnalytics()
         result = analytics.calculate_momentum('test_keyword', hours=24)
         
         assert 'current_sentiment' in result
@@ -103,41 +123,30 @@ class TestSentimentAnalytics:
         assert 'rate_of_change' in result
         assert result['momentum_signal'] in ['bullish', 'bearish', 'neutral']
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_calculate_momentum_insufficient_data(self, mock_config, mock_db):
+    def test_calculate_momentum_insufficient_data(self, analytics, patched_analytics):
         """Test momentum calculation with insufficient data."""
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
-        mock_db_instance.get_sentiment_trends.return_value = self.mock_trends_data[:3]  # Only 3 points
+        mock_db_instance = patched_analytics.db
+        mock_db_instance.get_sentiment_trends.return_value = _TRENDS_DATA[:3]  # Only 3 points
         
-        analytics = SentimentAnalytics()
         result = analytics.calculate_momentum('test_keyword', hours=24)
         
         assert 'error' in result
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_analyze_volume_correlation(self, mock_config, mock_db):
+    def test_analyze_volume_correlation(self, analytics, patched_analytics):
         """Test volume correlation analysis."""
         # Create data with volume variation
-        trends_with_volume = []
-        for i in range(20):
-            trends_with_volume.extend([
-                {
-                    'timestamp': datetime.utcnow() - timedelta(hours=i) + timedelta(minutes=j*10),
-                    'sentiment': 0.5 + np.random.normal(0, 0.1),
-                    'confidence': 0.8,
-                    'model': 'vader'
-                }
-                for j in range(np.random.randint(1, 6))  # Variable number of posts per hour
-            ])
-        
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
+        posts_per_hour = _VOLUME_COUNTS  # Variable number of posts per hour
+        hours_ago = np.repeat(np.arange(20), posts_per_hour)
+        # Position of each post within its hour: 0, 1, ... posts_per_hour - 1
+        post_index = np.arange(posts_per_hour.sum()) - np.repeat(np.cumsum(posts_per_hour) - posts_per_hour, posts_per_hour)
+        trends_with_volume = _make_trends(
+            _NOW - hours_ago * timedelta(hours=1) + post_index * timedelta(minutes=10),
+            0.5 + _VOLUME_NOISE
+        )
+        
+        mock_db_instance = patched_analytics.db
         mock_db_instance.get_sentiment_trends.return_value = trends_with_volume
         
-        analytics = SentimentAnalytics()
         result = analytics.analyze_volume_correlation('test_keyword', hours=24)
         
         assert 'correlation_coefficient' in result
@@ -146,42 +155,34 @@ class TestSentimentAnalytics:
         assert 'avg_hourly_volume' in result
         assert result['relationship_strength'] in ['strong', 'moderate', 'weak']
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_detect_anomalies(self, mock_config, mock_db):
+    def test_detect_anomalies(self, analytics, patched_analytics):
         """Test anomaly detection."""
         # Create data with anomalies
-        normal_data = [
-            {
-                'timestamp': datetime.utcnow() - timedelta(hours=i),
-                'sentiment': 0.1 + np.random.normal(0, 0.05),  # Normal variation
-                'confidence': 0.8,
-                'model': 'vader'
-            }
-            for i in range(25, 5, -1)
-        ]
+        hours_ago = np.arange(25, 5, -1)
+        normal_data = _make_trends(
+            _NOW - hours_ago * timedelta(hours=1),
+            0.1 + _NORMAL_DATA  # Normal variation
+        )
         
         # Add anomalies
         normal_data.extend([
             {
-                'timestamp': datetime.utcnow() - timedelta(hours=4),
+                'timestamp': _NOW - timedelta(hours=4),
                 'sentiment': 0.9,  # Positive spike
                 'confidence': 0.8,
                 'model': 'vader'
             },
             {
-                'timestamp': datetime.utcnow() - timedelta(hours=3),
+                'timestamp': _NOW - timedelta(hours=3),
                 'sentiment': -0.8,  # Negative spike
                 'confidence': 0.8,
                 'model': 'vader'
             }
         ])
         
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
+        mock_db_instance = patched_analytics.db
         mock_db_instance.get_sentiment_trends.return_value = normal_data
         
-        analytics = SentimentAnalytics()
         anomalies = analytics.detect_anomalies('test_keyword', hours=24)
         
         assert len(anomalies) >= 2  # Should detect both spikes
@@ -196,12 +197,9 @@ class TestSentimentAnalytics:
             assert anomaly['type'] in ['positive_spike', 'negative_spike']
             assert anomaly['severity'] in ['medium', 'high']
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_compare_keywords(self, mock_config, mock_db):
+    def test_compare_keywords(self, analytics, patched_analytics):
         """Test keyword comparison."""
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
+        mock_db_instance = patched_analytics.db
         
         # Mock different summaries for different keywords
         def mock_get_sentiment_summary(keyword, hours):
@@ -238,7 +236,6 @@ class TestSentimentAnalytics:
                 r_squared=0.7
             )
             
-            analytics = SentimentAnalytics()
             result = analytics.compare_keywords(['bitcoin', 'ethereum'], hours=24)
             
             assert 'keyword_data' in result
@@ -250,12 +247,10 @@ class TestSentimentAnalytics:
             assert result['worst_performing'] == 'ethereum'  # Lower sentiment
             assert result['most_discussed'] == 'bitcoin'  # More posts
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_check_alert_conditions(self, mock_config, mock_db):
+    def test_check_alert_conditions(self, analytics, patched_analytics):
         """Test alert condition checking."""
         # Setup config with alert thresholds
-        mock_config_obj = Mock()
+        mock_config_obj = patched_analytics.config
         mock_config_obj.alerts.enabled = True
         mock_config_obj.alerts.thresholds = {
             'very_negative': -0.8,
@@ -265,10 +260,8 @@ class TestSentimentAnalytics:
         }
         mock_config_obj.alerts.volume_threshold = 10
         mock_config_obj.alerts.rapid_change_threshold = 0.3
-        mock_config.return_value = mock_config_obj
         
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
+        mock_db_instance = patched_analytics.db
         
         # Mock very negative sentiment
         mock_db_instance.get_sentiment_summary.return_value = {
@@ -289,7 +282,6 @@ class TestSentimentAnalytics:
                 r_squared=0.7
             )
             
-            analytics = SentimentAnalytics()
             alerts = analytics.check_alert_conditions('test_keyword')
             
             assert len(alerts) >= 2  # Should have sentiment and volume/change alerts
@@ -302,12 +294,9 @@ class TestSentimentAnalytics:
                 assert alert.alert_type in ['sentiment_threshold', 'volume_spike', 'rapid_change']
                 assert alert.severity in ['low', 'medium', 'high', 'critical']
     
-    @patch('sentiment_monitor.analysis.analytics.get_db')
-    @patch('sentiment_monitor.analysis.analytics.get_config')
-    def test_generate_insights(self, mock_config, mock_db):
+    def test_generate_insights(self, analytics, patched_analytics):
         """Test comprehensive insights generation."""
-        mock_db_instance = Mock()
-        mock_db.return_value = mock_db_instance
+        mock_db_instance = patched_analytics.db
         mock_db_instance.get_sentiment_summary.return_value = {
             'avg_sentiment': 0.3,
             'total_posts': 50,
@@ -315,16 +304,14 @@ class TestSentimentAnalytics:
             'negative_count': 10,
             'avg_confidence': 0.8
         }
-        mock_db_instance.get_sentiment_trends.return_value = self.mock_trends_data
+        mock_db_instance.get_sentiment_trends.return_value = _TRENDS_DATA
         
-        mock_config_obj = Mock()
+        mock_config_obj = patched_analytics.config
         mock_config_obj.alerts.enabled = True
         mock_config_obj.alerts.thresholds = {'negative': -0.3, 'positive': 0.3}
         mock_config_obj.alerts.volume_threshold = 10
         mock_config_obj.alerts.rapid_change_threshold = 0.3
-        mock_config.return_value = mock_config_obj
         
-        analytics = SentimentAnalytics()
         insights = analytics.generate_insights('test_keyword', hours=24)
         
         assert 'keyword' in insights
@@ -339,9 +326,8 @@ class TestSentimentAnalytics:
         assert insights['keyword'] == 'test_keyword'
         assert isinstance(insights['recommendations'], list)
     
-    def test_generate_recommendations(self):
+    def test_generate_recommendations(self, analytics):
         """Test recommendation generation."""
-        analytics = SentimentAnalytics()
         
         # Test with various insight scenarios
         insights = {
@@ -374,6 +360,30 @@ class TestSentimentAnalytics:
         
         # Check that recommendations address the issues
         rec_text = ' '.join(recommendations).lower()
-        assert 'low' in rec_text or 'volume' in rec_text  # Should mention low volume
-        assert 'negative' in rec_text or 'declining' in rec_text  # Should mention negative trend
-        assert 'critical' in rec_text or 'immediate' in rec_text  # Should mention critical alerts
\ No newline at end of file
+        assert _LOW_VOLUME_PATTERN.search(rec_text)  # Should mention low volume
+        assert _NEGATIVE_TREND_PATTERN.search(rec_text)  # Should mention negative trend
+        assert _CRITICAL_ALERT_PATTERN.search(rec_text)  # Should mention critical alerts
+
+class TestAlertOptIn:
+    """Test that alerting follows the configuration the analytics engine loads."""
+    
+    @pytest.fixture
+    def configured_analytics(self, monkeypatch):
+        """Construct analytics through the real get_config, with a mock database."""
+        db = Mock()
+        db.get_sentiment_summary.return_value = {'avg_sentiment': -0.9, 'total_posts': 50}
+        db.get_sentiment_trends.return_value = []
+        monkeypatch.setattr('sentiment_monitor.analysis.analytics.get_db', lambda: db)
+        return SentimentAnalytics
+    
+    def test_alerts_disabled_by_default(self, configured_analytics):
+        """Test that the test configuration keeps alerting off."""
+        assert configured_analytics().check_alert_conditions('test_keyword') == []
+    
+    def test_enable_alerts_reaches_analytics(self, enable_alerts, configured_analytics):
+        """Test that the enable_alerts fixture turns alerting on for code under test."""
+        analytics = configured_analytics()
+        assert analytics.config is enable_alerts
+        
+        alerts = analytics.check_alert_conditions('test_keyword')
+        assert [(alert.alert_type, alert.severity) for alert in alerts][:1] == [('sentiment_threshold', 'critical')]
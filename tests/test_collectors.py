@@ -1,32 +1,65 @@
 """Test data collection functionality."""
 
+import json
+import random
+import re
+import threading
+import time
 import pytest
+import responses
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+from types import SimpleNamespace
 
 from sentiment_monitor.collectors.reddit_collector import RedditCollector
+import sentiment_monitor.collectors.hackernews_collector as hn_module
 from sentiment_monitor.collectors.hackernews_collector import HackerNewsCollector
 from sentiment_monitor.collectors.base_collector import BaseCollector
 
 
+_HN_API = 'https://hacker-news.firebaseio.com/v0'
+_ALGOLIA_SEARCH = 'https://hn.algolia.com/api/v1/search'
+
+
+class _StubCollector(BaseCollector):
+    """Minimal concrete collector for exercising BaseCollector helpers."""
+    
+    def is_available(self):
+        return True
+    
+    def collect_posts_for_keyword(self, keyword, limit=100):
+        return []
+    
+    def test_connection(self):
+        return {'available': True}
+
+
+@pytest.fixture(scope="module")
+def stub_collector():
+    """Share one stub collector across the BaseCollector tests."""
+    return _StubCollector("test")
+
+
+@pytest.fixture(scope="module")
+def hn_collector():
+    """Share one Hacker News collector, built against a mocked database, across the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('sentiment_monitor.collectors.hackernews_collector.get_db', Mock())
+        return HackerNewsCollector()
+
+
+@pytest.fixture
+def hn(hn_collector):
+    """Reset the shared collector's per-test state."""
+    hn_collector._hn_platform_id = 2
+    return hn_collector
+
+
 class TestBaseCollector:
     """Test base collector functionality."""
     
-    def test_validate_post_data(self):
+    def test_validate_post_data(self, stub_collector):
         """Test post data validation."""
-        # Create a concrete implementation for testing
-        class TestCollector(BaseCollector):
-            def is_available(self):
-                return True
-            
-            def collect_posts_for_keyword(self, keyword, limit=100):
-                return []
-            
-            def test_connection(self):
-                return {'available': True}
-        
-        collector = TestCollector("test")
-        
         # Valid post data
         valid_post = {
             'external_id': 'test_123',
@@ -36,60 +69,36 @@ class TestBaseCollector:
             'posted_at': datetime.utcnow()
         }
         
-        assert collector.validate_post_data(valid_post) is True
+        assert stub_collector.validate_post_data(valid_post) is True
         
         # Missing required field
         invalid_post = valid_post.copy()
         del invalid_post['external_id']
-        assert collector.validate_post_data(invalid_post) is False
+        assert stub_collector.validate_post_data(invalid_post) is False
         
         # Invalid content (too short)
         invalid_post = valid_post.copy()
         invalid_post['content'] = 'hi'
-        assert collector.validate_post_data(invalid_post) is False
+        assert stub_collector.validate_post_data(invalid_post) is False
         
         # Invalid date type
         invalid_post = valid_post.copy()
         invalid_post['posted_at'] = 'not a date'
-        assert collector.validate_post_data(invalid_post) is False
+        assert stub_collector.validate_post_data(invalid_post) is False
     
-    def test_clean_text(self):
+    def test_clean_text(self, stub_collector):
         """Test text cleaning functionality."""
-        class TestCollector(BaseCollector):
-            def is_available(self):
-                return True
-            
-            def collect_posts_for_keyword(self, keyword, limit=100):
-                return []
-            
-            def test_connection(self):
-                return {'available': True}
-        
-        collector = TestCollector("test")
-        
         # Test cleaning
         dirty_text = "  This   has   extra    spaces  \n\t  "
-        clean_text = collector.clean_text(dirty_text)
+        clean_text = stub_collector.clean_text(dirty_text)
         assert clean_text == "This has extra spaces"
         
         # Test empty text
-        assert collector.clean_text("") == ""
-        assert collector.clean_text(None) == ""
+        assert stub_collector.clean_text("") == ""
+        assert stub_collector.clean_text(None) == ""
     
-    def test_filter_duplicates(self):
+    def test_filter_duplicates(self, stub_collector):
         """Test duplicate filtering."""
-        class TestCollector(BaseCollector):
-            def is_available(self):
-                return True
-            
-            def collect_posts_for_keyword(self, keyword, limit=100):
-                return []
-            
-            def test_connection(self):
-                return {'available': True}
-        
-        collector = TestCollector("test")
-        
         posts = [
             {'external_id': 'post_1', 'content': 'Content 1'},
             {'external_id': 'post_2', 'content': 'Content 2'},
@@ -99,157 +108,178 @@ class TestBaseCollector:
         
         existing_ids = {'post_2'}  # post_2 already exists
         
-        filtered = collector.filter_duplicates(posts, existing_ids)
+        filtered = stub_collector.filter_duplicates(posts, existing_ids)
         
         assert len(filtered) == 2  # Should have post_1 and post_3 only
         filtered_ids = {p['external_id'] for p in filtered}
         assert 'post_1' in filtered_ids
         assert 'post_3' in filtered_ids
         assert 'post_2' not in filtered_ids  # Was in existing_ids
+    
+    @pytest.mark.parametrize("n", [4, 10_000])
+    def test_filter_duplicates_matches_set_difference(self, stub_collector, n):
+        """Test duplicate filtering against a set difference, including large batches."""
+        rng = random.Random(n)
+        unique_count = n - n // 5  # 20% of posts repeat an earlier id
+        ids = [f'p{i}' for i in range(unique_count)]
+        ids += rng.choices(ids, k=n - unique_count)
+        posts = [{'external_id': external_id, 'content': f'Content {i}'} for i, external_id in enumerate(ids)]
+        existing_ids = set(rng.sample(ids[:unique_count], n // 2))
+        expected_ids = set(ids) - existing_ids
+        
+        filtered = stub_collector.filter_duplicates(posts, existing_ids)
+        
+        filtered_ids = {p['external_id'] for p in filtered}
+        assert filtered_ids == expected_ids
+        assert len(filtered) == len(filtered_ids)  # Each id kept once
+    
+    def test_filter_duplicates_accepts_set_like_container(self, stub_collector):
+        """Test duplicate filtering with a non-set container such as a Bloom filter."""
+        class SeenIds:
+            def __init__(self, ids):
+                self._ids = set(ids)
+            
+            def __contains__(self, external_id):
+                return external_id in self._ids
+            
+            def add(self, external_id):
+                self._ids.add(external_id)
+        
+        posts = [{'external_id': f'p{i % 6}', 'content': f'Content {i}'} for i in range(10)]
+        seen = SeenIds({'p0', 'p1'})
+        
+        filtered = stub_collector.filter_duplicates(posts, seen)
+        
+        assert [p['external_id'] for p in filtered] == ['p2', 'p3', 'p4', 'p5']
+        assert 'p5' in seen
 
 
 class TestRedditCollector:
     """Test Reddit data collector."""
     
-    @patch('sentiment_monitor.collectors.reddit_collector.praw')
-    def test_initialization(self, mock_praw):
+    @pytest.fixture(autouse=True)
+    def reddit_patches(self, mocker):
+        """Patch the Reddit client, database and secrets for every test in the class."""
+        patches = SimpleNamespace(
+            praw=mocker.patch('sentiment_monitor.collectors.reddit_collector.praw'),
+            get_db=mocker.patch('sentiment_monitor.collectors.reddit_collector.get_db'),
+            get_secrets=mocker.patch('sentiment_monitor.collectors.reddit_collector.get_secrets')
+        )
+        patches.get_secrets.return_value = {'reddit': {'client_id': 'test', 'client_secret': 'test'}}
+        return patches
+    
+    def test_initialization(self, reddit_patches):
         """Test Reddit collector initialization."""
         # Mock PRAW Reddit instance
         mock_reddit = Mock()
-        mock_praw.Reddit.return_value = mock_reddit
-        
-        with patch('sentiment_monitor.collectors.reddit_collector.get_secrets') as mock_secrets:
-            mock_secrets.return_value = {
-                'reddit': {
-                    'client_id': 'test_id',
-                    'client_secret': 'test_secret',
-                    'user_agent': 'test_agent'
-                }
+        reddit_patches.praw.Reddit.return_value = mock_reddit
+        
+        reddit_patches.get_secrets.return_value = {
+            'reddit': {
+                'client_id': 'test_id',
+                'client_secret': 'test_secret',
+                'user_agent': 'test_agent'
             }
-            
-            collector = RedditCollector()
-            
-            assert collector.reddit is not None
-            mock_praw.Reddit.assert_called_once()
+        }
+        
+        collector = RedditCollector()
+        
+        assert collector.reddit is not None
+        reddit_patches.praw.Reddit.assert_called_once()
     
-    @patch('sentiment_monitor.collectors.reddit_collector.praw')
-    def test_is_available(self, mock_praw):
+    def test_is_available(self, reddit_patches):
         """Test availability check."""
         mock_reddit = Mock()
-        mock_praw.Reddit.return_value = mock_reddit
+        reddit_patches.praw.Reddit.return_value = mock_reddit
         
-        with patch('sentiment_monitor.collectors.reddit_collector.get_secrets') as mock_secrets:
-            mock_secrets.return_value = {
-                'reddit': {
-                    'client_id': 'test_id',
-                    'client_secret': 'test_secret'
-                }
+        reddit_patches.get_secrets.return_value = {
+            'reddit': {
+                'client_id': 'test_id',
+                'client_secret': 'test_secret'
             }
-            
-            with patch('sentiment_monitor.collectors.reddit_collector.get_db') as mock_db:
-                mock_db_instance = Mock()
-                mock_db.return_value = mock_db_instance
-                
-                # Mock platform query
-                mock_session = Mock()
-                mock_platform = Mock()
-                mock_platform.id = 1
-                mock_session.query.return_value.filter_by.return_value.first.return_value = mock_platform
-                mock_db_instance.get_session.return_value.__enter__.return_value = mock_session
-                
-                collector = RedditCollector()
-                assert collector.is_available() is True
+        }
+        
+        mock_db_instance = Mock()
+        reddit_patches.get_db.return_value = mock_db_instance
+        
+        # Mock platform id lookup
+        mock_db_instance.get_platform_id.return_value = 1
+        
+        collector = RedditCollector()
+        assert collector.is_available() is True
     
-    def test_extract_post_data(self):
+    def test_extract_post_data(self, reddit_patches):
         """Test post data extraction from Reddit submission."""
-        with patch('sentiment_monitor.collectors.reddit_collector.get_db') as mock_db, \
-             patch('sentiment_monitor.collectors.reddit_collector.get_secrets') as mock_secrets, \
-             patch('sentiment_monitor.collectors.reddit_collector.praw'):
-            
-            mock_secrets.return_value = {'reddit': {'client_id': 'test', 'client_secret': 'test'}}
-            
-            # Mock database
-            mock_db_instance = Mock()
-            mock_db.return_value = mock_db_instance
-            mock_session = Mock()
-            mock_platform = Mock()
-            mock_platform.id = 1
-            mock_session.query.return_value.filter_by.return_value.first.return_value = mock_platform
-            mock_db_instance.get_session.return_value.__enter__.return_value = mock_session
-            
-            collector = RedditCollector()
-            collector._reddit_platform_id = 1
-            
-            # Mock submission
-            submission = Mock()
-            submission.id = 'test_123'
-            submission.title = 'Test Post Title'
-            submission.selftext = 'Test post content'
-            submission.url = 'https://example.com'
-            submission.author = Mock()
-            submission.author.__str__ = Mock(return_value='test_author')
-            submission.created_utc = datetime.utcnow().timestamp()
-            submission.score = 100
-            submission.num_comments = 50
-            submission.subreddit = Mock()
-            submission.subreddit.__str__ = Mock(return_value='test')
-            submission.permalink = '/r/test/comments/test'
-            submission.is_self = True
-            submission.over_18 = False
-            submission.upvote_ratio = 0.95
-            submission.gilded = 0
-            submission.archived = False
-            submission.locked = False
-            
-            post_data = collector._extract_post_data(submission, keyword_id=1)
-            
-            assert post_data is not None
-            assert post_data['external_id'] == 'test_123'
-            assert post_data['title'] == 'Test Post Title'
-            assert 'Test Post Title' in post_data['content']
-            assert 'Test post content' in post_data['content']
-            assert post_data['author'] == 'test_author'
-            assert post_data['platform_id'] == 1
-            assert post_data['keyword_id'] == 1
+        # Mock database
+        mock_db_instance = Mock()
+        reddit_patches.get_db.return_value = mock_db_instance
+        mock_db_instance.get_platform_id.return_value = 1
+        
+        collector = RedditCollector()
+        collector._reddit_platform_id = 1
+        
+        # Plain namespace submission; praw renders author and subreddit via str()
+        submission = SimpleNamespace(
+            id='test_123',
+            title='Test Post Title',
+            selftext='Test post content',
+            url='https://example.com',
+            author='test_author',
+            created_utc=datetime.utcnow().timestamp(),
+            score=100,
+            num_comments=50,
+            subreddit='test',
+            permalink='/r/test/comments/test',
+            is_self=True,
+            over_18=False,
+            upvote_ratio=0.95,
+            gilded=0,
+            archived=False,
+            locked=False
+        )
+        
+        post_data = collector._extract_post_data(submission, keyword_id=1)
+        
+        assert post_data is not None
+        assert post_data['external_id'] == 'test_123'
+        assert post_data['title'] == 'Test Post Title'
+        assert 'Test Post Title' in post_data['content']
+        assert 'Test post content' in post_data['content']
+        assert post_data['author'] == 'test_author'
+        assert post_data['platform_id'] == 1
+        assert post_data['keyword_id'] == 1
     
     def test_contains_keyword(self):
         """Test keyword matching."""
-        with patch('sentiment_monitor.collectors.reddit_collector.get_db'), \
-             patch('sentiment_monitor.collectors.reddit_collector.get_secrets') as mock_secrets, \
-             patch('sentiment_monitor.collectors.reddit_collector.praw'):
-            
-            mock_secrets.return_value = {'reddit': {'client_id': 'test', 'client_secret': 'test'}}
-            
-            collector = RedditCollector()
-            
-            # Case insensitive matching
-            assert collector._contains_keyword("This post mentions Bitcoin", "bitcoin") is True
-            assert collector._contains_keyword("BITCOIN is trending", "bitcoin") is True
-            assert collector._contains_keyword("This post is about Ethereum", "bitcoin") is False
-            assert collector._contains_keyword("", "bitcoin") is False
-            assert collector._contains_keyword("Some text", "") is False
+        collector = RedditCollector()
+        
+        # Case insensitive matching
+        assert collector._contains_keyword("This post mentions Bitcoin", "bitcoin") is True
+        assert collector._contains_keyword("BITCOIN is trending", "bitcoin") is True
+        assert collector._contains_keyword("This post is about Ethereum", "bitcoin") is False
+        assert collector._contains_keyword("", "bitcoin") is False
+        assert collector._contains_keyword("Some text", "") is False
+        
+        # The compiled pattern is cached and reused across calls
+        pattern = collector._keyword_patterns['bitcoin']
+        assert collector._contains_keyword("More bitcoin news", "bitcoin") is True
+        assert collector._keyword_patterns['bitcoin'] is pattern
     
     @patch('sentiment_monitor.collectors.reddit_collector.requests')
-    def test_test_connection(self, mock_requests):
+    def test_test_connection(self, mock_requests, reddit_patches):
         """Test connection testing."""
-        with patch('sentiment_monitor.collectors.reddit_collector.get_db'), \
-             patch('sentiment_monitor.collectors.reddit_collector.get_secrets') as mock_secrets, \
-             patch('sentiment_monitor.collectors.reddit_collector.praw') as mock_praw:
-            
-            mock_secrets.return_value = {'reddit': {'client_id': 'test', 'client_secret': 'test'}}
-            
-            # Mock successful Reddit connection
-            mock_reddit = Mock()
-            mock_subreddit = Mock()
-            mock_subreddit.hot.return_value = [Mock()]
-            mock_reddit.subreddit.return_value = mock_subreddit
-            mock_praw.Reddit.return_value = mock_reddit
-            
-            collector = RedditCollector()
-            status = collector.test_connection()
-            
-            assert 'available' in status
-            assert 'authenticated' in status
+        # Mock successful Reddit connection
+        mock_reddit = Mock()
+        mock_subreddit = Mock()
+        mock_subreddit.hot.return_value = [Mock()]
+        mock_reddit.subreddit.return_value = mock_subreddit
+        reddit_patches.praw.Reddit.return_value = mock_reddit
+        
+        collector = RedditCollector()
+        status = collector.test_connection()
+        
+        assert 'available' in status
+        assert 'authenticated' in status
 
 
 class TestHackerNewsCollector:
@@ -261,12 +291,8 @@ class TestHackerNewsCollector:
             mock_db_instance = Mock()
             mock_db.return_value = mock_db_instance
             
-            # Mock platform query
-            mock_session = Mock()
-            mock_platform = Mock()
-            mock_platform.id = 2
-            mock_session.query.return_value.filter_by.return_value.first.return_value = mock_platform
-            mock_db_instance.get_session.return_value.__enter__.return_value = mock_session
+            # Mock platform id lookup
+            mock_db_instance.get_platform_id.return_value = 2
             
             collector = HackerNewsCollector()
             assert collector._hn_platform_id == 2
@@ -277,155 +303,201 @@ class TestHackerNewsCollector:
             mock_db_instance = Mock()
             mock_db.return_value = mock_db_instance
             
-            mock_session = Mock()
-            mock_platform = Mock()
-            mock_platform.id = 2
-            mock_session.query.return_value.filter_by.return_value.first.return_value = mock_platform
-            mock_db_instance.get_session.return_value.__enter__.return_value = mock_session
+            mock_db_instance.get_platform_id.return_value = 2
             
             collector = HackerNewsCollector()
             assert collector.is_available() is True
     
-    @patch('sentiment_monitor.collectors.hackernews_collector.requests')
-    def test_get_story_ids(self, mock_requests):
+    @responses.activate
+    def test_get_story_ids(self, hn):
         """Test getting story IDs."""
-        with patch('sentiment_monitor.collectors.hackernews_collector.get_db'):
-            # Mock successful API response
-            mock_response = Mock()
-            mock_response.json.return_value = [1, 2, 3, 4, 5]
-            mock_response.raise_for_status.return_value = None
-            mock_requests.get.return_value = mock_response
-            
-            collector = HackerNewsCollector()
-            story_ids = collector._get_story_ids('topstories', limit=3)
-            
-            assert story_ids == [1, 2, 3]
-            mock_requests.get.assert_called_once()
+        # Mock successful API response
+        responses.add(responses.GET, f'{_HN_API}/topstories.json', json=[1, 2, 3, 4, 5])
+        
+        story_ids = hn._get_story_ids('topstories', limit=3)
+        
+        assert story_ids == [1, 2, 3]
+        assert len(responses.calls) == 1
     
-    @patch('sentiment_monitor.collectors.hackernews_collector.requests')
-    def test_get_story_data(self, mock_requests):
+    @responses.activate
+    def test_get_story_data(self, hn):
         """Test getting story data."""
-        with patch('sentiment_monitor.collectors.hackernews_collector.get_db'):
-            # Mock successful API response
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                'id': 123,
-                'title': 'Test HN Story',
-                'text': 'Story content',
-                'by': 'test_author',
-                'time': 1640995200,  # 2022-01-01
-                'score': 100,
-                'descendants': 50
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_requests.get.return_value = mock_response
-            
-            collector = HackerNewsCollector()
-            story_data = collector._get_story_data(123)
-            
-            assert story_data is not None
-            assert story_data['id'] == 123
-            assert story_data['title'] == 'Test HN Story'
+        # Mock successful API response
+        responses.add(responses.GET, f'{_HN_API}/item/123.json', json={
+            'id': 123,
+            'title': 'Test HN Story',
+            'text': 'Story content',
+            'by': 'test_author',
+            'time': 1640995200,  # 2022-01-01
+            'score': 100,
+            'descendants': 50
+        })
+        
+        story_data = hn._get_story_data(123)
+        
+        assert story_data is not None
+        assert story_data['id'] == 123
+        assert story_data['title'] == 'Test HN Story'
+    
+    @responses.activate
+    def test_get_story_data_many(self, hn):
+        """Test fetching several stories concurrently."""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+        
+        def story_callback(request):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)  # Simulated network latency
+            with lock:
+                in_flight -= 1
+            story_id = int(request.url.rsplit('/', 1)[-1].split('.')[0])
+            return 200, {}, json.dumps({'id': story_id, 'title': f'Story {story_id}'})
+        
+        responses.add_callback(
+            responses.GET, re.compile(rf'{re.escape(_HN_API)}/item/\d+\.json'), callback=story_callback
+        )
+        
+        story_ids = list(range(1, 9))
+        stories = hn._get_story_data_many(story_ids)
+        
+        assert [story['id'] for story in stories] == story_ids  # Order preserved
+        assert peak > 1  # Requests overlapped
+        assert hn._get_story_data_many([]) == []
     
-    def test_is_relevant_story(self):
+    def test_is_relevant_story(self, hn):
         """Test story relevance checking."""
-        with patch('sentiment_monitor.collectors.hackernews_collector.get_db'):
-            collector = HackerNewsCollector()
-            
-            # Relevant story
-            relevant_story = {
-                'title': 'Bitcoin reaches new heights',
-                'text': 'The cryptocurrency market is booming',
-                'url': 'https://example.com/bitcoin-news'
-            }
-            assert collector._is_relevant_story(relevant_story, 'bitcoin') is True
-            
-            # Irrelevant story
-            irrelevant_story = {
-                'title': 'New JavaScript framework released',
-                'text': 'This framework makes development easier',
-                'url': 'https://example.com/js-news'
-            }
-            assert collector._is_relevant_story(irrelevant_story, 'bitcoin') is False
-            
-            # Deleted/dead story
-            deleted_story = {'deleted': True}
-            assert collector._is_relevant_story(deleted_story, 'bitcoin') is False
+        # Relevant story
+        relevant_story = {
+            'title': 'Bitcoin reaches new heights',
+            'text': 'The cryptocurrency market is booming',
+            'url': 'https://example.com/bitcoin-news'
+        }
+        assert hn._is_relevant_story(relevant_story, 'bitcoin') is True
+        
+        # Irrelevant story
+        irrelevant_story = {
+            'title': 'New JavaScript framework released',
+            'text': 'This framework makes development easier',
+            'url': 'https://example.com/js-news'
+        }
+        assert hn._is_relevant_story(irrelevant_story, 'bitcoin') is False
+        
+        # Deleted/dead story
+        deleted_story = {'deleted': True}
+        assert hn._is_relevant_story(deleted_story, 'bitcoin') is False
+    
+    def test_match_story_keywords(self, hn):
+        """Test matching many keywords against a story in one call."""
+        keywords = ['Bitcoin'] + [f'keyword{i}' for i in range(49)]
+        matcher = hn._build_keyword_matcher(keywords)
+        
+        story = {
+            'title': 'Bitcoin reaches new heights',
+            'text': 'The cryptocurrency market is booming',
+            'url': 'https://example.com/bitcoin-news'
+        }
+        assert hn._match_story_keywords(story, matcher) == {'bitcoin'}
+        assert hn._match_story_keywords({'deleted': True}, matcher) == set()
+        assert hn._match_story_keywords(story, hn._build_keyword_matcher([])) == set()
+    
+    def test_collect_posts_for_keywords(self, hn, monkeypatch):
+        """Test that one pass over the story feeds collects posts for every keyword."""
+        db = MagicMock()
+        session = db.get_session.return_value.__enter__.return_value
+        session.query.return_value.filter.return_value.all.return_value = [('Bitcoin', 1), ('ethereum', 2)]
+        monkeypatch.setattr(hn, 'db', db)
+        
+        stories = {
+            1: {'id': 1, 'title': 'Bitcoin and Ethereum rally', 'time': 1640995200, 'score': 10},
+            2: {'id': 2, 'title': 'Ethereum upgrade ships', 'time': 1640995200, 'score': 10},
+            3: {'id': 3, 'title': 'Unrelated news', 'time': 1640995200, 'score': 10}
+        }
+        get_story_ids = Mock(return_value=list(stories))
+        monkeypatch.setattr(hn, '_get_story_ids', get_story_ids)
+        monkeypatch.setattr(hn, '_get_story_data', stories.get)
+        monkeypatch.setattr(hn, '_search_algolia', Mock(return_value=[]))
+        sleep = Mock()
+        monkeypatch.setattr('sentiment_monitor.collectors.hackernews_collector.time.sleep', sleep)
+        
+        with patch('sentiment_monitor.collectors.hackernews_collector.ThreadPoolExecutor',
+                   wraps=hn_module.ThreadPoolExecutor) as mock_executor:
+            posts = hn.collect_posts_for_keywords(['Bitcoin', 'ethereum', 'missing'], limit=10)
+        
+        # Each feed is fetched once for all keywords, not once per keyword
+        assert get_story_ids.call_count == 2
+        
+        # One pool for the whole call, with the rate limit paid per story request
+        assert mock_executor.call_count == 1
+        assert sleep.call_count == 2 * len(stories)
+        assert [post['external_id'] for post in posts['Bitcoin']] == ['1', '1']
+        assert [post['external_id'] for post in posts['ethereum']] == ['1', '2', '1', '2']
+        assert {post['keyword_id'] for post in posts['ethereum']} == {2}
+        assert posts['missing'] == []
     
-    def test_convert_to_post_data(self):
+    def test_convert_to_post_data(self, hn):
         """Test converting HN story to post format."""
-        with patch('sentiment_monitor.collectors.hackernews_collector.get_db'):
-            collector = HackerNewsCollector()
-            collector._hn_platform_id = 2
-            
-            story_data = {
-                'id': 123456,
-                'title': 'Test HN Story Title',
-                'text': 'Test story content',
-                'url': 'https://example.com/story',
-                'by': 'test_author',
-                'time': 1640995200,
-                'score': 100,
-                'descendants': 50,
-                'type': 'story'
-            }
-            
-            post_data = collector._convert_to_post_data(story_data, keyword_id=1)
-            
-            assert post_data is not None
-            assert post_data['external_id'] == '123456'
-            assert post_data['title'] == 'Test HN Story Title'
-            assert 'Test HN Story Title' in post_data['content']
-            assert 'Test story content' in post_data['content']
-            assert post_data['author'] == 'test_author'
-            assert post_data['platform_id'] == 2
-            assert post_data['keyword_id'] == 1
-            assert post_data['score'] == 100
+        story_data = {
+            'id': 123456,
+            'title': 'Test HN Story Title',
+            'text': 'Test story content',
+            'url': 'https://example.com/story',
+            'by': 'test_author',
+            'time': 1640995200,
+            'score': 100,
+            'descendants': 50,
+            'type': 'story'
+        }
+        
+        post_data = hn._convert_to_post_data(story_data, keyword_id=1)
+        
+        assert post_data is not None
+        assert post_data['external_id'] == '123456'
+        assert post_data['title'] == 'Test HN Story Title'
+        assert 'Test HN Story Title' in post_data['content']
+        assert 'Test story content' in post_data['content']
+        assert post_data['author'] == 'test_author'
+        assert post_data['platform_id'] == 2
+        assert post_data['keyword_id'] == 1
+        assert post_data['score'] == 100
     
-    @patch('sentiment_monitor.collectors.hackernews_collector.requests')
-    def test_search_algolia(self, mock_requests):
+    @responses.activate
+    def test_search_algolia(self, hn):
         """Test Algolia search functionality."""
-        with patch('sentiment_monitor.collectors.hackernews_collector.get_db'):
-            # Mock Algolia API response
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                'hits': [
-                    {
-                        'objectID': '789',
-                        'title': 'Bitcoin Discussion',
-                        'url': 'https://example.com',
-                        'author': 'hn_user',
-                        'created_at': '2022-01-01T00:00:00.000Z',
-                        'points': 150,
-                        'num_comments': 75,
-                        '_tags': ['story']
-                    }
-                ]
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_requests.get.return_value = mock_response
-            
-            collector = HackerNewsCollector()
-            collector._hn_platform_id = 2
-            
-            posts = collector._search_algolia('bitcoin', keyword_id=1, limit=10)
-            
-            assert len(posts) == 1
-            assert posts[0]['external_id'] == 'algolia_789'
-            assert posts[0]['title'] == 'Bitcoin Discussion'
+        # Mock Algolia API response
+        responses.add(responses.GET, _ALGOLIA_SEARCH, json={
+            'hits': [
+                {
+                    'objectID': '789',
+                    'title': 'Bitcoin Discussion',
+                    'url': 'https://example.com',
+                    'author': 'hn_user',
+                    'created_at': '2022-01-01T00:00:00.000Z',
+                    'points': 150,
+                    'num_comments': 75,
+                    '_tags': ['story']
+                }
+            ]
+        })
+        
+        posts = hn._search_algolia('bitcoin', keyword_id=1, limit=10)
+        
+        assert len(posts) == 1
+        assert posts[0]['external_id'] == 'algolia_789'
+        assert posts[0]['title'] == 'Bitcoin Discussion'
     
-    @patch('sentiment_monitor.collectors.hackernews_collector.requests')
-    def test_test_connection(self, mock_requests):
+    @responses.activate
+    def test_test_connection(self, hn):
         """Test connection testing."""
-        with patch('sentiment_monitor.collectors.hackernews_collector.get_db'):
-            # Mock successful API responses
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_requests.get.return_value = mock_response
-            
-            collector = HackerNewsCollector()
-            status = collector.test_connection()
-            
-            assert 'available' in status
-            assert 'api_responsive' in status
-            assert 'algolia_responsive' in status
\ No newline at end of file
+        # Mock successful API responses
+        responses.add(responses.GET, f'{_HN_API}/topstories.json', json=[])
+        responses.add(responses.GET, _ALGOLIA_SEARCH, json={'hits': []})
+        
+        status = hn.test_connection()
+        
+        assert 'available' in status
+        assert 'api_responsive' in status
+        assert 'algolia_responsive' in status
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""Test configuration management."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from sentiment_monitor.utils.config import ConfigManager
+
+_CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """Create a config manager over a copy of the shipped configuration."""
+    shutil.copy(_CONFIG_DIR / "config.yaml", tmp_path / "config.yaml")
+    return ConfigManager(str(tmp_path))
+
+
+class TestConfigManager:
+    """Test configuration loading and updates."""
+    
+    def test_update_keywords_replaces_config(self, config_manager):
+        """Test that updating keywords saves a new config instead of mutating the shared one."""
+        original = config_manager.get_config()
+        original_keywords = list(original.keywords['default'])
+        
+        config_manager.update_keywords(['bitcoin', 'ethereum'])
+        
+        assert original.keywords['default'] == original_keywords
+        assert config_manager.get_config() is not original
+        assert config_manager.get_config().keywords['default'] == ['bitcoin', 'ethereum']
+        assert ConfigManager(str(config_manager.config_dir)).get_config().keywords['default'] == ['bitcoin', 'ethereum']
+    
+    def test_update_keywords_keeps_config_when_save_fails(self, config_manager, monkeypatch):
+        """Test that a failed save leaves the cached config untouched."""
+        original = config_manager.get_config()
+        original_keywords = list(original.keywords['default'])
+        monkeypatch.setattr(config_manager, '_save_config', Mock(side_effect=OSError("disk full")))
+        
+        with pytest.raises(OSError):
+            config_manager.update_keywords(['bitcoin'])
+        
+        assert config_manager.get_config() is original
+        assert original.keywords['default'] == original_keywords
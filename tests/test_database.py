@@ -1,13 +1,35 @@
 """Test database functionality."""
 
+import sqlite3
+import numpy as np
 import pytest
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from unittest.mock import Mock
 
+from sqlalchemy import event, exists, inspect, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateTable
+
 from sentiment_monitor.storage.database import DatabaseManager
 from sentiment_monitor.storage.models import Keyword, Platform, Post, SentimentScore, Alert
 
 
+@contextmanager
+def _recorded_statements(engine):
+    """Collect the (statement, parameters) pairs an engine issues inside the block."""
+    statements = []
+    
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+    
+    event.listen(engine, 'before_cursor_execute', record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', record_statement)
+
+
 class TestDatabaseManager:
     """Test DatabaseManager functionality."""
     
@@ -82,6 +104,21 @@ class TestDatabaseManager:
         platform = test_db.get_platform_by_name("non_existent")
         assert platform is None
     
+    def test_get_platform_id(self, test_db):
+        """Test that platform ids are looked up once and then cached."""
+        expected_id = test_db.get_platform_by_name("hackernews").id
+        test_db._platform_ids.clear()
+        
+        with _recorded_statements(test_db.engine) as statements:
+            platform_ids = {test_db.get_platform_id("hackernews") for _ in range(1000)}
+        
+        assert platform_ids == {expected_id}
+        assert len([statement for statement, _ in statements if statement.lstrip().upper().startswith('SELECT')]) == 1
+        
+        # Unknown names are not cached, so a platform added later is still found
+        assert test_db.get_platform_id("non_existent") is None
+        assert "non_existent" not in test_db._platform_ids
+    
     def test_add_post(self, test_db, sample_posts):
         """Test adding posts."""
         # Setup keyword and platform
@@ -99,9 +136,37 @@ class TestDatabaseManager:
         assert post.external_id == "test_post_1"
         assert post.title == "Great news about test keyword"
         
+        assert post.post_metadata == {'platform': 'test', 'subreddit': 'test'}
+        
         # Test duplicate post
-        duplicate_post = test_db.add_post(post_data)
+        with _recorded_statements(test_db.engine) as statements:
+            duplicate_post = test_db.add_post(post_data)
         assert duplicate_post is None  # Should skip duplicate
+        
+        # The duplicate is skipped by the INSERT itself, without a lookup first
+        queries = [statement for statement, _ in statements if statement.lstrip().upper().startswith(('SELECT', 'INSERT'))]
+        assert len(queries) == 1
+        assert 'ON CONFLICT' in queries[0].upper()
+    
+    def test_add_posts(self, test_db, sample_posts):
+        """Test adding posts in a batch."""
+        keyword = test_db.add_keyword("test_keyword")
+        platform = test_db.get_platform_by_name("reddit")
+        
+        posts_data = []
+        for post_data in sample_posts:
+            post_data = post_data.copy()
+            post_data['keyword_id'] = keyword.id
+            post_data['platform_id'] = platform.id
+            posts_data.append(post_data)
+        
+        # Pre-existing post and an in-batch duplicate should both be skipped
+        test_db.add_post(posts_data[0])
+        posts = test_db.add_posts(posts_data + [posts_data[1].copy()])
+        
+        assert {p.external_id for p in posts} == {'test_post_2', 'test_post_3'}
+        assert all(p.id is not None for p in posts)
+        assert test_db.add_posts([]) == []
     
     def test_add_sentiment_score(self, test_db, sample_posts):
         """Test adding sentiment scores."""
@@ -136,8 +201,40 @@ class TestDatabaseManager:
         
         # Test updating existing score
         score_data['compound_score'] = 0.6
-        updated_score = test_db.add_sentiment_score(score_data)
+        with _recorded_statements(test_db.engine) as statements:
+            updated_score = test_db.add_sentiment_score(score_data)
         assert updated_score.compound_score == 0.6
+        assert updated_score.id == score.id
+        
+        # The update is a single upsert rather than a lookup followed by a write
+        queries = [statement for statement, _ in statements if statement.lstrip().upper().startswith(('SELECT', 'INSERT', 'UPDATE'))]
+        assert len(queries) == 1
+        assert 'ON CONFLICT' in queries[0].upper()
+    
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_add_sentiment_score_numpy_values(self, test_db, sample_posts, monkeypatch, orjson_available):
+        """Test that NumPy floats in raw model output are stored with either JSON backend."""
+        monkeypatch.setattr('sentiment_monitor.utils.serialization.ORJSON_AVAILABLE', orjson_available)
+        keyword = test_db.add_keyword("test_keyword")
+        platform = test_db.get_platform_by_name("reddit")
+        
+        post_data = sample_posts[0].copy()
+        post_data['keyword_id'] = keyword.id
+        post_data['platform_id'] = platform.id
+        post = test_db.add_post(post_data)
+        
+        score = test_db.add_sentiment_score({
+            'post_id': post.id,
+            'model_name': 'vader',
+            'compound_score': 0.5,
+            'confidence': 0.8,
+            'raw_output': {'compound': np.float64(0.5), 'pos': np.float32(0.25), 'scores': np.array([0.1, 0.9])}
+        })
+        assert score is not None
+        
+        with test_db.get_session() as session:
+            stored = session.get(SentimentScore, score.id).raw_output
+        assert stored == {'compound': 0.5, 'pos': 0.25, 'scores': [0.1, 0.9]}
     
     def test_get_recent_posts(self, test_db, sample_posts):
         """Test getting recent posts."""
@@ -150,14 +247,50 @@ class TestDatabaseManager:
             post_data['keyword_id'] = keyword.id
             post_data['platform_id'] = platform.id
             post_data['is_processed'] = True
-            test_db.add_post(post_data)
+        test_db.add_posts(sample_posts)
         
         # Get recent posts
-        recent_posts = test_db.get_recent_posts("test_keyword", hours=24, limit=10)
+        with _recorded_statements(test_db.engine) as statements:
+            recent_posts = test_db.get_recent_posts("test_keyword", hours=24, limit=10)
         
         assert len(recent_posts) == 3
         # Should be ordered by posted_at desc
         assert recent_posts[0].posted_at >= recent_posts[1].posted_at
+        
+        # The keyword/posted_at index serves both the filter and the ordering
+        query, parameters = next(
+            (statement, params) for statement, params in statements if statement.lstrip().upper().startswith('SELECT')
+        )
+        with test_db.get_session() as session:
+            plan = ' '.join(
+                row[-1] for row in session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {query}', parameters)
+            )
+        assert 'idx_keyword_posted_at' in plan
+        assert 'TEMP B-TREE' not in plan
+    
+    def test_get_sentiment_trends(self, test_db, sample_posts):
+        """Test getting sentiment trends."""
+        keyword = test_db.add_keyword("test_keyword")
+        platform = test_db.get_platform_by_name("reddit")
+        
+        for i, post_data in enumerate(sample_posts):
+            post_data['keyword_id'] = keyword.id
+            post_data['platform_id'] = platform.id
+            post = test_db.add_post(post_data)
+            
+            test_db.add_sentiment_score({
+                'post_id': post.id,
+                'model_name': 'vader',
+                'compound_score': 0.5,
+                # Low confidence scores are excluded from trends
+                'confidence': 0.8 if i < 2 else 0.2
+            })
+        
+        trends = test_db.get_sentiment_trends("test_keyword", hours=24)
+        
+        assert len(trends) == 2
+        assert set(trends[0]) == {'timestamp', 'sentiment', 'confidence', 'model'}
+        assert trends[0]['timestamp'] <= trends[1]['timestamp']
     
     def test_get_sentiment_summary(self, test_db, sample_posts):
         """Test getting sentiment summary."""
@@ -168,11 +301,12 @@ class TestDatabaseManager:
         # Add posts with sentiment scores
         sentiment_scores = [0.8, -0.6, 0.1]  # positive, negative, neutral
         
-        for i, post_data in enumerate(sample_posts):
+        for post_data in sample_posts:
             post_data['keyword_id'] = keyword.id
             post_data['platform_id'] = platform.id
-            post = test_db.add_post(post_data)
-            
+        posts = test_db.add_posts(sample_posts)
+        
+        for i, post in enumerate(posts):
             score_data = {
                 'post_id': post.id,
                 'model_name': 'vader',
@@ -184,14 +318,43 @@ class TestDatabaseManager:
             }
             test_db.add_sentiment_score(score_data)
         
-        # Get summary
-        summary = test_db.get_sentiment_summary("test_keyword", hours=24)
+        # Get summary, recording the SQL it issues
+        with _recorded_statements(test_db.engine) as statements:
+            summary = test_db.get_sentiment_summary("test_keyword", hours=24)
+        
+        # Aggregation happens in one SQL query rather than by loading score rows
+        selects = [statement for statement, _ in statements if statement.lstrip().upper().startswith('SELECT')]
+        assert len(selects) == 1
+        assert 'avg(' in selects[0].lower()
         
         assert summary['total_posts'] == 3
         assert abs(summary['avg_sentiment'] - (0.8 - 0.6 + 0.1) / 3) < 0.01
         assert summary['positive_count'] >= 1
         assert summary['negative_count'] >= 1
     
+    def test_get_sentiment_summaries(self, test_db, sample_posts):
+        """Test getting sentiment summaries for several keywords at once."""
+        keyword = test_db.add_keyword("test_keyword")
+        test_db.add_keyword("quiet_keyword")
+        platform = test_db.get_platform_by_name("reddit")
+        
+        for post_data in sample_posts:
+            post_data['keyword_id'] = keyword.id
+            post_data['platform_id'] = platform.id
+            post = test_db.add_post(post_data)
+            test_db.add_sentiment_score({
+                'post_id': post.id,
+                'model_name': 'vader',
+                'compound_score': 0.5,
+                'confidence': 0.8
+            })
+        
+        summaries = test_db.get_sentiment_summaries(["test_keyword", "quiet_keyword"], hours=24)
+        
+        assert summaries["test_keyword"] == test_db.get_sentiment_summary("test_keyword", hours=24)
+        assert summaries["quiet_keyword"]['total_posts'] == 0
+        assert test_db.get_sentiment_summaries([]) == {}
+    
     def test_add_alert(self, test_db):
         """Test adding alerts."""
         keyword = test_db.add_keyword("test_keyword")
@@ -213,24 +376,52 @@ class TestDatabaseManager:
         assert alert.is_active is True
         assert alert.is_acknowledged is False
     
-    def test_get_active_alerts(self, test_db):
-        """Test getting active alerts."""
+    def test_add_alerts(self, test_db):
+        """Test adding alerts in a batch."""
         keyword = test_db.add_keyword("test_keyword")
         
-        # Add some alerts
-        for i in range(3):
-            alert_data = {
+        alerts = test_db.add_alerts([
+            {
                 'keyword_id': keyword.id,
-                'alert_type': 'test',
+                'alert_type': alert_type,
                 'severity': 'medium',
-                'message': f'Test alert {i}',
+                'message': f'{alert_type} alert',
                 'current_value': 0.5,
                 'threshold_value': 0.3
             }
-            test_db.add_alert(alert_data)
+            for alert_type in ('sentiment_threshold', 'volume_spike')
+        ])
+        
+        assert [a.alert_type for a in alerts] == ['sentiment_threshold', 'volume_spike']
+        assert all(a.id is not None for a in alerts)
+        assert test_db.add_alerts([]) == []
+    
+    @pytest.mark.parametrize("n", [3, 1000])
+    def test_get_active_alerts(self, test_db, n):
+        """Test getting active alerts."""
+        keyword = test_db.add_keyword("test_keyword")
+        
+        # Add the alerts in one batch
+        with _recorded_statements(test_db.engine) as statements:
+            test_db.add_alerts([
+                {
+                    'keyword_id': keyword.id,
+                    'alert_type': 'test',
+                    'severity': 'medium',
+                    'message': f'Test alert {i}',
+                    'current_value': 0.5,
+                    'threshold_value': 0.3
+                }
+                for i in range(n)
+            ])
+        
+        inserts = [statement for statement, _ in statements if statement.lstrip().upper().startswith('INSERT')]
+        assert len(inserts) == 1  # One multi-row INSERT, not one per alert
         
         active_alerts = test_db.get_active_alerts()
-        assert len(active_alerts) == 3
+        assert len(active_alerts) == n
+        # Keyword is loaded with the alerts, so it is usable after the session closes
+        assert active_alerts[0].keyword_rel.keyword == "test_keyword"
     
     def test_cleanup_old_data(self, test_db, sample_posts):
         """Test cleaning up old data."""
@@ -245,26 +436,109 @@ class TestDatabaseManager:
         old_post_data['collected_at'] = datetime.utcnow() - timedelta(days=10)
         old_post_data['external_id'] = 'old_post'
         
-        test_db.add_post(old_post_data)
-        
         # Add recent post
         recent_post_data = sample_posts[1].copy()
         recent_post_data['keyword_id'] = keyword.id
         recent_post_data['platform_id'] = platform.id
         recent_post_data['external_id'] = 'recent_post'
         
-        test_db.add_post(recent_post_data)
+        test_db.add_posts([old_post_data, recent_post_data])
         
         # Cleanup with 5 day retention
         test_db.cleanup_old_data(retention_days=5)
         
         # Check that old post is gone but recent post remains
         with test_db.get_session() as session:
-            posts = session.query(Post).all()
-            external_ids = {p.external_id for p in posts}
+            def post_exists(external_id):
+                return session.query(exists().where(Post.external_id == external_id)).scalar()
+            
+            assert not post_exists('old_post')
+            assert post_exists('recent_post')
+    
+    def test_cleanup_old_data_cascades_scores(self, test_db, sample_posts):
+        """Test that cleaning up old posts removes their sentiment scores."""
+        keyword = test_db.add_keyword("test_keyword")
+        platform = test_db.get_platform_by_name("reddit")
+        
+        old_post_data = sample_posts[0].copy()
+        old_post_data['keyword_id'] = keyword.id
+        old_post_data['platform_id'] = platform.id
+        old_post_data['collected_at'] = datetime.utcnow() - timedelta(days=10)
+        
+        post = test_db.add_post(old_post_data)
+        test_db.add_sentiment_score({
+            'post_id': post.id,
+            'model_name': 'vader',
+            'compound_score': 0.5,
+            'confidence': 0.8
+        })
+        
+        test_db.cleanup_old_data(retention_days=5)
+        
+        with test_db.get_session() as session:
+            assert session.query(SentimentScore).filter_by(post_id=post.id).count() == 0
+    
+    def test_cleanup_old_data_without_cascade(self, tmp_path, sample_posts):
+        """Test cleanup on a database whose score foreign key predates ON DELETE CASCADE."""
+        db_path = tmp_path / "upgraded.db"
+        
+        # Create sentiment_scores the way older releases did, before the rest of the schema
+        old_ddl = str(CreateTable(SentimentScore.__table__).compile(dialect=sqlite.dialect()))
+        assert 'ON DELETE CASCADE' in old_ddl
+        connection = sqlite3.connect(db_path)
+        connection.execute(old_ddl.replace(' ON DELETE CASCADE', ''))
+        connection.close()
+        
+        db = DatabaseManager(str(db_path))
+        try:
+            keyword = db.add_keyword("test_keyword")
+            platform = db.get_platform_by_name("reddit")
+            
+            old_post_data = sample_posts[0].copy()
+            old_post_data['keyword_id'] = keyword.id
+            old_post_data['platform_id'] = platform.id
+            old_post_data['collected_at'] = datetime.utcnow() - timedelta(days=10)
+            
+            post = db.add_post(old_post_data)
+            db.add_sentiment_score({
+                'post_id': post.id,
+                'model_name': 'vader',
+                'compound_score': 0.5,
+                'confidence': 0.8
+            })
+            
+            db.cleanup_old_data(retention_days=5)
+            
+            with db.get_session() as session:
+                assert session.query(Post).count() == 0
+                assert session.query(SentimentScore).count() == 0
+        finally:
+            db.engine.dispose()
+    
+    def test_init_db_dedupes_scores_before_unique_index(self, tmp_path):
+        """Test that duplicate scores from before uq_post_model keep only the newest row."""
+        db_path = tmp_path / "duplicates.db"
+        
+        # Older releases had no unique index, so the same post and model could repeat
+        connection = sqlite3.connect(db_path)
+        connection.execute(str(CreateTable(SentimentScore.__table__).compile(dialect=sqlite.dialect())))
+        connection.executemany(
+            "INSERT INTO sentiment_scores (id, post_id, model_name, compound_score, confidence) VALUES (?, ?, ?, ?, ?)",
+            [(1, 1, 'vader', 0.1, 0.5), (2, 1, 'vader', 0.2, 0.6), (3, 1, 'roberta', 0.3, 0.7)]
+        )
+        connection.commit()
+        connection.close()
+        
+        db = DatabaseManager(str(db_path))
+        try:
+            with db.get_session() as session:
+                remaining = session.scalars(select(SentimentScore.id).order_by(SentimentScore.id)).all()
+            assert remaining == [2, 3]
             
-            assert 'old_post' not in external_ids
-            assert 'recent_post' in external_ids
+            index_names = {index['name'] for index in inspect(db.engine).get_indexes('sentiment_scores')}
+            assert 'uq_post_model' in index_names
+        finally:
+            db.engine.dispose()
     
     def test_get_database_stats(self, test_db):
         """Test getting database statistics."""
@@ -1,8 +1,15 @@
 """Test sentiment analysis functionality."""
 
+import random
+import re
+import time
+from collections import Counter
+import numpy as np
 import pytest
 from unittest.mock import Mock, patch
 
+import sentiment_monitor.analysis.sentiment_analyzer as sentiment_module
+from sentiment_monitor.analysis import text_utils
 from sentiment_monitor.analysis.sentiment_analyzer import (
     SentimentAnalyzer, VADERAnalyzer, TextPreprocessor
 )
@@ -11,46 +18,120 @@ from sentiment_monitor.analysis.text_utils import (
 )
 
 
+def _with_text_processing(config, **values):
+    """Return a copy of the frozen config with some text processing options replaced."""
+    return config.model_copy(update={
+        'text_processing': config.text_processing.model_copy(update=values)
+    })
+
+
 class TestTextPreprocessor:
     """Test text preprocessing functionality."""
     
-    def test_preprocess_basic(self):
+    def test_preprocess_basic(self, text_preprocessor):
         """Test basic text preprocessing."""
-        preprocessor = TextPreprocessor()
-        
         text = "This is a TEST message with URLs https://example.com and @mentions #hashtags"
-        processed = preprocessor.preprocess(text)
+        processed = text_preprocessor.preprocess(text)
         
         assert processed.lower() == processed  # Should be lowercase
         assert "https://example.com" not in processed  # URLs removed
         assert len(processed) > 0
     
-    def test_preprocess_empty(self):
+    def test_preprocess_empty(self, text_preprocessor):
         """Test preprocessing empty text."""
-        preprocessor = TextPreprocessor()
-        
-        assert preprocessor.preprocess("") == ""
-        assert preprocessor.preprocess(None) == ""
+        assert text_preprocessor.preprocess("") == ""
+        assert text_preprocessor.preprocess(None) == ""
     
-    def test_preprocess_long_text(self):
-        """Test preprocessing very long text."""
-        preprocessor = TextPreprocessor()
-        
-        long_text = "word " * 1000  # Create long text
-        processed = preprocessor.preprocess(long_text)
+    @pytest.mark.parametrize("n", [100, 1000, 10000, 100000])
+    def test_preprocess_long_text(self, text_preprocessor, monkeypatch, n):
+        """Test that very long text is truncated before it is cleaned."""
+        max_length = text_preprocessor.config.text_processing.max_text_length
+        
+        def best_time(text):
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                text_preprocessor.preprocess(text)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+        
+        long_text = "word " * n
+        processed = text_preprocessor.preprocess(long_text)
         
         # Should be truncated
-        assert len(processed) <= 1003  # max_length + "..."
+        assert len(processed) <= max_length + 3  # max_length + "..."
+        
+        # Cost is bounded by max_length rather than growing with the input
+        assert best_time(long_text) / best_time("word " * 100) < 2000
+        
+        # The cleaning passes see a single prefix, one character past max_length
+        seen_lengths = []
+        
+        def recording_sub(replacement, text):
+            seen_lengths.append(len(text))
+            return text
+        
+        monkeypatch.setattr(sentiment_module, '_EMOJI_RE', Mock(sub=recording_sub))
+        text_preprocessor.preprocess(long_text)
+        assert len(seen_lengths) == 1 and seen_lengths[0] <= max_length + 1
+    
+    def test_preprocess_ellipsis_only_when_cut(self, text_preprocessor):
+        """Test that text cleaned below max_length keeps its tail and gets no ellipsis."""
+        max_length = text_preprocessor.config.text_processing.max_text_length
+        
+        # Long raw input that is mostly URLs, so the cleaned text fits
+        text = "https://example.com/" + "a" * max_length + " short tail"
+        assert text_preprocessor.preprocess(text) == "short tail"
+        
+        # Text that is still too long after cleaning is cut and marked
+        processed = text_preprocessor.preprocess("word " * max_length)
+        assert len(processed) == max_length + 3
+        assert processed.endswith("...")
+    
+    @pytest.mark.parametrize("remove_urls, remove_mentions, remove_hashtags", [
+        (True, False, False),
+        (True, True, False),
+        (True, True, True),
+        (False, True, True),
+        (False, False, False),
+    ])
+    def test_single_pass_removal(self, text_preprocessor, monkeypatch, remove_urls, remove_mentions, remove_hashtags):
+        """Test that the combined removal pattern matches applying each pattern in turn."""
+        monkeypatch.setattr(text_preprocessor, 'config', _with_text_processing(
+            text_preprocessor.config,
+            remove_urls=remove_urls, remove_mentions=remove_mentions, remove_hashtags=remove_hashtags
+        ))
+        
+        text = "Check https://example.com/page?id=1 from @alice and @bob about #bitcoin #crypto today"
+        
+        expected = text.lower()
+        for pattern, remove in ((sentiment_module._URL_RE, remove_urls),
+                                (sentiment_module._MENTION_RE, remove_mentions),
+                                (sentiment_module._HASHTAG_RE, remove_hashtags)):
+            if remove:
+                expected = pattern.sub('', expected)
+        
+        assert text_preprocessor.preprocess(text) == ' '.join(expected.split())
+    
+    def test_patterns_compiled_once(self, text_preprocessor, monkeypatch):
+        """Test that cleaning patterns are compiled at import rather than per instance."""
+        for pattern in (sentiment_module._URL_RE, sentiment_module._MENTION_RE,
+                        sentiment_module._HASHTAG_RE, sentiment_module._EMOJI_RE):
+            assert isinstance(pattern, re.Pattern)
+        assert not hasattr(text_preprocessor, 'url_pattern')
+        
+        monkeypatch.setattr(text_preprocessor, 'config', _with_text_processing(
+            text_preprocessor.config, remove_mentions=True, remove_hashtags=True
+        ))
+        assert text_preprocessor.preprocess("Hello @someone, see #news") == "hello , see"
 
 
 class TestVADERAnalyzer:
     """Test VADER sentiment analyzer."""
     
-    def test_analyze_positive(self):
+    def test_analyze_positive(self, vader_analyzer):
         """Test analyzing positive text."""
-        analyzer = VADERAnalyzer()
-        
-        result = analyzer.analyze("I love this! It's absolutely amazing and wonderful!")
+        result = vader_analyzer.analyze("I love this! It's absolutely amazing and wonderful!")
         
         assert result['model_name'] == 'vader'
         assert result['compound_score'] > 0.5
@@ -58,30 +139,45 @@ class TestVADERAnalyzer:
         assert result['confidence'] > 0.5
         assert 'processing_time' in result
     
-    def test_analyze_negative(self):
-        """Test analyzing negative text."""
-        analyzer = VADERAnalyzer()
+    def test_lexicon_loaded_once(self, vader_analyzer):
+        """Test that new analyzers reuse the already parsed lexicon."""
+        with patch('sentiment_monitor.analysis.sentiment_analyzer.SentimentIntensityAnalyzer') as mock_vader:
+            analyzer = VADERAnalyzer()
         
-        result = analyzer.analyze("I hate this! It's terrible and awful!")
+        mock_vader.assert_not_called()
+        assert analyzer.analyzer is vader_analyzer.analyzer
+    
+    def test_analyze_cache_hit(self, vader_analyzer):
+        """Test that repeated texts are served from the score cache."""
+        text = "This repost is great, really great!"
+        hits = vader_analyzer._polarity_scores.cache_info().hits
+        
+        first = vader_analyzer.analyze(text)
+        first['raw_output']['compound'] = 0.0  # Mutating a result must not touch the cache
+        second = vader_analyzer.analyze(text)
+        
+        assert vader_analyzer._polarity_scores.cache_info().hits >= hits + 1
+        assert second['compound_score'] == first['compound_score']
+        assert second['raw_output']['compound'] == second['compound_score']
+    
+    def test_analyze_negative(self, vader_analyzer):
+        """Test analyzing negative text."""
+        result = vader_analyzer.analyze("I hate this! It's terrible and awful!")
         
         assert result['compound_score'] < -0.5
         assert result['negative_score'] > 0.5
         assert result['confidence'] > 0.5
     
-    def test_analyze_neutral(self):
+    def test_analyze_neutral(self, vader_analyzer):
         """Test analyzing neutral text."""
-        analyzer = VADERAnalyzer()
-        
-        result = analyzer.analyze("This is a neutral statement about something.")
+        result = vader_analyzer.analyze("This is a neutral statement about something.")
         
         assert -0.2 < result['compound_score'] < 0.2
         assert result['neutral_score'] > 0.5
     
-    def test_analyze_empty(self):
+    def test_analyze_empty(self, vader_analyzer):
         """Test analyzing empty text."""
-        analyzer = VADERAnalyzer()
-        
-        result = analyzer.analyze("")
+        result = vader_analyzer.analyze("")
         
         assert result['compound_score'] == 0
         assert result['neutral_score'] == 1.0
@@ -140,6 +236,34 @@ class TestSentimentAnalyzer:
         assert weighted['model_count'] == 2
         assert 'models_used' in weighted
     
+    def test_get_weighted_sentiment_vectorized(self, sentiment_analyzer):
+        """Test the weighted average against a plain Python reference over many results."""
+        rng = random.Random(42)
+        model_names = ['vader', 'cardiffnlp/twitter-roberta-base-sentiment-latest', 'other']
+        fields = ['compound_score', 'positive_score', 'negative_score', 'neutral_score', 'confidence']
+        results = [
+            {
+                'model_name': rng.choice(model_names),
+                'compound_score': rng.uniform(-1, 1),
+                'positive_score': rng.random(),
+                'negative_score': rng.random(),
+                'neutral_score': rng.random(),
+                'confidence': rng.random()
+            }
+            for _ in range(100)
+        ]
+        
+        weighted = sentiment_analyzer.get_weighted_sentiment(results)
+        
+        models = sentiment_analyzer.config.sentiment.models
+        weights = {'vader': models.get('vader', {}).get('weight', 0.4), 'roberta': models.get('roberta', {}).get('weight', 0.6)}
+        result_weights = [weights.get(r['model_name'].split('/')[-1].split('-')[0], 1.0) for r in results]
+        for field in fields:
+            expected = sum(r[field] * w for r, w in zip(results, result_weights)) / sum(result_weights)
+            assert weighted[field] == pytest.approx(expected, abs=1e-6)
+            assert isinstance(weighted[field], float)
+        assert weighted['model_count'] == 100
+    
     def test_get_weighted_sentiment_empty(self, sentiment_analyzer):
         """Test weighted sentiment with empty results."""
         weighted = sentiment_analyzer.get_weighted_sentiment([])
@@ -152,6 +276,17 @@ class TestSentimentAnalyzer:
         assert sentiment_analyzer.get_sentiment_label(0.0) == 'neutral'
         assert sentiment_analyzer.get_sentiment_label(0.03) == 'neutral'  # Within threshold
     
+    def test_get_sentiment_labels(self, sentiment_analyzer):
+        """Test vectorized labels against the scalar version."""
+        rng = np.random.default_rng(0)
+        scores = np.concatenate([rng.uniform(-1, 1, 100_000), [0.05, -0.05, 0.0499, -0.0499]])
+        
+        labels = sentiment_analyzer.get_sentiment_labels(scores)
+        expected = np.array([sentiment_analyzer.get_sentiment_label(score) for score in scores])
+        
+        assert labels.shape == scores.shape
+        assert (labels == expected).all()
+    
     def test_is_high_confidence(self, sentiment_analyzer):
         """Test confidence threshold checking."""
         assert sentiment_analyzer.is_high_confidence(0.8) is True
@@ -166,7 +301,15 @@ class TestSentimentAnalyzer:
             ""  # Empty text
         ]
         
-        results = sentiment_analyzer.analyze_batch(texts)
+        vader = sentiment_analyzer.analyzers['vader']
+        with patch.object(vader, 'analyze', wraps=vader.analyze) as mock_analyze, \
+                patch.object(vader, 'analyze_batch', wraps=vader.analyze_batch) as mock_analyze_batch:
+            results = sentiment_analyzer.analyze_batch(texts)
+        
+        # The whole batch is scored in one call rather than once per text
+        mock_analyze.assert_not_called()
+        mock_analyze_batch.assert_called_once()
+        assert len(mock_analyze_batch.call_args.args[0]) == 3  # Empty text is skipped
         
         assert len(results) == 4
         assert results[0] is not None  # Great text
@@ -178,6 +321,88 @@ class TestSentimentAnalyzer:
         for i, result in enumerate(results):
             if result:
                 assert result['text_index'] == i
+        
+        # Batch scores match analyzing each text on its own
+        single = sentiment_analyzer.get_weighted_sentiment(sentiment_analyzer.analyze_text(texts[0]))
+        assert results[0]['compound_score'] == single['compound_score']
+    
+    def test_analyze_stream(self, sentiment_analyzer):
+        """Test that streaming analysis pulls input one chunk at a time."""
+        pulled = 0
+        
+        def texts():
+            nonlocal pulled
+            for i in range(1000):
+                pulled += 1
+                yield "" if i % 10 == 0 else f"text number {i} is good"
+        
+        stream = sentiment_analyzer.analyze_stream(texts(), chunk_size=8)
+        first = next(stream)
+        
+        assert first is None  # Empty text
+        assert pulled == 8  # Only the first chunk is resident
+        
+        rest = list(stream)
+        assert pulled == 1000
+        assert len(rest) == 999
+        assert [result['text_index'] for result in rest if result] == [i for i in range(1, 1000) if i % 10]
+    
+    def test_analyze_batch_skips_empty_texts(self, sentiment_analyzer):
+        """Test that texts empty before or after cleaning never reach a model."""
+        vader = sentiment_analyzer.analyzers['vader']
+        with patch.object(vader, 'analyze_batch', wraps=vader.analyze_batch) as mock_analyze_batch:
+            results = sentiment_analyzer.analyze_batch(["", "   ", "https://example.com", "ok"])
+            
+            mock_analyze_batch.assert_called_once_with(["ok"])
+            assert results[:3] == [None, None, None]
+            assert results[3] is not None
+            
+            mock_analyze_batch.reset_mock()
+            assert sentiment_analyzer.analyze_batch(["", None]) == [None, None]
+            mock_analyze_batch.assert_not_called()
+    
+    @pytest.mark.performance
+    @pytest.mark.parametrize("batch_size", [1_000, 10_000])
+    def test_batch_throughput(self, sentiment_analyzer, batch_size):
+        """Test that batch analysis sustains at least 2000 texts per second."""
+        texts = [f"tweet number {i} is great!" for i in range(batch_size)]
+        
+        start = time.perf_counter()
+        results = sentiment_analyzer.analyze_batch(texts)
+        elapsed = time.perf_counter() - start
+        
+        assert len(results) == batch_size
+        assert all(result is not None for result in results)
+        assert batch_size / elapsed > 2000
+    
+    def test_analyze_batch_runs_models_in_parallel(self, sentiment_analyzer, monkeypatch):
+        """Test that batch analysis runs several models on a thread pool."""
+        roberta = Mock(model_name='cardiffnlp/twitter-roberta-base-sentiment-latest')
+        roberta.analyze_batch.side_effect = lambda texts: [
+            {
+                'model_name': roberta.model_name,
+                'compound_score': 0.5,
+                'positive_score': 0.7,
+                'negative_score': 0.2,
+                'neutral_score': 0.1,
+                'confidence': 0.7
+            }
+            for _ in texts
+        ]
+        monkeypatch.setitem(sentiment_analyzer.analyzers, 'roberta', roberta)
+        config = sentiment_analyzer.config
+        models = {**config.sentiment.models, 'roberta': {'enabled': True, 'weight': 0.6}}
+        monkeypatch.setattr(sentiment_analyzer, 'config', config.model_copy(update={
+            'sentiment': config.sentiment.model_copy(update={'models': models})
+        }))
+        
+        with patch('sentiment_monitor.analysis.sentiment_analyzer.ThreadPoolExecutor',
+                   wraps=sentiment_module.ThreadPoolExecutor) as mock_executor:
+            results = sentiment_analyzer.analyze_batch(["good", "bad", "okay", "fine"])
+        
+        assert mock_executor.call_args.kwargs['max_workers'] >= 2
+        roberta.analyze_batch.assert_called_once()
+        assert all(result['model_count'] == 2 for result in results)
     
     def test_get_model_info(self, sentiment_analyzer):
         """Test getting model information."""
@@ -187,62 +412,85 @@ class TestSentimentAnalyzer:
         assert 'model_details' in info
         assert 'configuration' in info
         assert 'vader' in info['available_models']
+        
+        # Built once and shared read-only between callers
+        assert sentiment_analyzer.get_model_info() is info
+        with pytest.raises(TypeError):
+            info['configuration']['confidence_threshold'] = 0.0
+        
+        # Nested configuration is frozen too
+        with pytest.raises(TypeError):
+            info['configuration']['models']['vader'] = {}
+        with pytest.raises(TypeError):
+            info['configuration']['models']['vader']['weight'] = 1.0
 
 
 class TestTextAnalyzer:
     """Test advanced text analysis utilities."""
     
-    def test_analyze_negation_context(self):
+    def test_analyze_negation_context(self, text_analyzer):
         """Test negation detection."""
-        analyzer = TextAnalyzer()
-        
         # Text with negation
-        result = analyzer.analyze_negation_context("This is not good at all")
+        result = text_analyzer.analyze_negation_context("This is not good at all")
         assert result['has_negation'] is True
         assert result['negation_count'] > 0
         assert 'not' in result['negations']
         
         # Text without negation
-        result = analyzer.analyze_negation_context("This is very good")
+        result = text_analyzer.analyze_negation_context("This is very good")
         assert result['has_negation'] is False
         assert result['negation_count'] == 0
     
-    def test_analyze_intensifiers(self):
-        """Test intensifier detection."""
-        analyzer = TextAnalyzer()
+    def test_patterns_shared_across_instances(self, text_analyzer):
+        """Test that word-list patterns are compiled once and shared."""
+        other = TextAnalyzer()
         
+        assert other.negation_pattern is text_analyzer.negation_pattern
+        assert other.intensifier_pattern is text_analyzer.intensifier_pattern
+        assert text_analyzer.analyze_negation_context("NOT good. Fine.")['negated_sentences'] == ['NOT good']
+    
+    def test_analyze_intensifiers(self, text_analyzer):
+        """Test intensifier detection."""
         # Text with intensifiers
-        result = analyzer.analyze_intensifiers("This is very extremely good")
+        result = text_analyzer.analyze_intensifiers("This is very extremely good")
         assert result['has_intensifiers'] is True
         assert result['intensifier_count'] >= 2
         assert 'very' in result['intensifiers']
         assert 'extremely' in result['intensifiers']
         
         # Text without intensifiers
-        result = analyzer.analyze_intensifiers("This is good")
+        result = text_analyzer.analyze_intensifiers("This is good")
         assert result['has_intensifiers'] is False
     
-    def test_analyze_emphasis(self):
+    def test_analyze_emphasis(self, text_analyzer):
         """Test emphasis analysis."""
-        analyzer = TextAnalyzer()
-        
         # Text with emphasis
-        result = analyzer.analyze_emphasis("This is AMAZING!!! Really???")
+        result = text_analyzer.analyze_emphasis("This is AMAZING!!! Really???")
         assert result['caps_count'] > 0
         assert result['exclamation_count'] >= 3
         assert result['question_count'] >= 3
         assert result['emphasis_score'] > 0
         
         # Text without emphasis
-        result = analyzer.analyze_emphasis("This is good.")
+        result = text_analyzer.analyze_emphasis("This is good.")
         assert result['emphasis_score'] == 0
     
-    def test_extract_keywords(self):
-        """Test keyword extraction."""
-        analyzer = TextAnalyzer()
+    @pytest.mark.parametrize("size", [1_000, 100_000, 1_000_000])
+    def test_analyze_emphasis_large(self, text_analyzer, size):
+        """Test emphasis counts on large random text against a per-character reference."""
+        rng = random.Random(size)
+        text = ''.join(rng.choice('abcXYZ !?.\n') for _ in range(size))
         
+        result = text_analyzer.analyze_emphasis(text)
+        
+        assert result['exclamation_count'] == sum(1 for char in text if char == '!')
+        assert result['question_count'] == sum(1 for char in text if char == '?')
+        assert result['caps_count'] == len(re.findall(r'\b[A-Z]{2,}\b', text))
+    
+    def test_extract_keywords(self, text_analyzer):
+        """Test keyword extraction."""
         text = "Bitcoin and cryptocurrency are trending topics in technology news"
-        keywords = analyzer.extract_keywords(text, top_n=5)
+        keywords = text_analyzer.extract_keywords(text, top_n=5)
         
         assert len(keywords) <= 5
         assert all(isinstance(item, tuple) and len(item) == 2 for item in keywords)
@@ -250,14 +498,33 @@ class TestTextAnalyzer:
         keyword_words = [word for word, count in keywords]
         assert 'and' not in keyword_words
         assert 'are' not in keyword_words
+        
+        # Stop words are a module-level frozenset, built once at import
+        assert isinstance(text_utils._STOP_WORDS, frozenset)
+        assert {'and', 'are'} <= text_utils._STOP_WORDS
     
-    def test_analyze_text_complexity(self):
+    @pytest.mark.performance
+    def test_extract_keywords_scales(self, text_analyzer):
+        """Test keyword extraction over a large vocabulary."""
+        rng = random.Random(7)
+        vocabulary = [f'word{i}' for i in range(100_000)]
+        words = [rng.choice(vocabulary) for _ in range(1_000_000)]
+        text = ' '.join(words)
+        
+        start = time.perf_counter()
+        keywords = text_analyzer.extract_keywords(text, top_n=5)
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 2.0
+        counts = Counter(words)
+        assert [count for _, count in keywords] == sorted(counts.values(), reverse=True)[:5]
+        assert all(counts[word] == count for word, count in keywords)
+    
+    def test_analyze_text_complexity(self, text_analyzer):
         """Test text complexity analysis."""
-        analyzer = TextAnalyzer()
-        
         # Simple text
         simple_text = "This is simple. Short sentences."
-        result = analyzer.analyze_text_complexity(simple_text)
+        result = text_analyzer.analyze_text_complexity(simple_text)
         
         assert 'word_count' in result
         assert 'sentence_count' in result
@@ -267,32 +534,34 @@ class TestTextAnalyzer:
         
         # Complex text
         complex_text = "This is a significantly more sophisticated and intricate sentence structure with multiple clauses."
-        complex_result = analyzer.analyze_text_complexity(complex_text)
+        complex_result = text_analyzer.analyze_text_complexity(complex_text)
         
         assert complex_result['avg_word_length'] > result['avg_word_length']
         assert complex_result['avg_sentence_length'] > result['avg_sentence_length']
+        
+        # Matches the plain Python definitions
+        words = complex_text.split()
+        assert complex_result['avg_word_length'] == pytest.approx(sum(len(word) for word in words) / len(words))
+        assert complex_result['unique_words'] == len(set(complex_text.lower().split()))
+        assert text_analyzer.analyze_text_complexity("   ")['avg_word_length'] == 0.0
     
-    def test_detect_language_patterns(self):
+    def test_detect_language_patterns(self, text_analyzer):
         """Test language pattern detection."""
-        analyzer = TextAnalyzer()
-        
         # Formal text
         formal_text = "I would like to express my gratitude for this opportunity."
-        formal_result = analyzer.detect_language_patterns(formal_text)
+        formal_result = text_analyzer.detect_language_patterns(formal_text)
         assert formal_result['formality_score'] > 0.8
         
         # Informal text
         informal_text = "lol this is awesome btw gonna check it out"
-        informal_result = analyzer.detect_language_patterns(informal_text)
+        informal_result = text_analyzer.detect_language_patterns(informal_text)
         assert informal_result['informal_language'] is True
         assert informal_result['formality_score'] < 0.5
     
-    def test_comprehensive_analysis(self):
+    def test_comprehensive_analysis(self, text_analyzer):
         """Test comprehensive text analysis."""
-        analyzer = TextAnalyzer()
-        
         text = "This is NOT very good!!! It's actually terrible lol"
-        result = analyzer.comprehensive_analysis(text)
+        result = text_analyzer.comprehensive_analysis(text)
         
         assert 'original_text' in result
         assert 'complexity' in result
@@ -347,4 +616,11 @@ class TestTextUtils:
         assert 'Apple' in entities['companies']
         assert 'Google' in entities['companies']
         assert 'Bitcoin' in entities['cryptocurrencies']
-        assert '$TSLA' in entities['stocks']
\ No newline at end of file
+        assert '$TSLA' in entities['stocks']
+        
+        # A single precompiled pattern classifies every entity type
+        assert set(text_utils._ENTITY_RE.groupindex) == {'companies', 'cryptocurrencies', 'stocks'}
+        entities = extract_entities("ethereum and NVDA.NASDAQ beat nvidia")
+        assert entities['cryptocurrencies'] == ['ethereum']
+        assert entities['stocks'] == ['NVDA.NASDAQ']
+        assert entities['companies'] == ['nvidia']
\ No newline at end of file